@@ -0,0 +1,13 @@
+-- Migration: Add geography expression indexes for radius searches
+-- The coordinates columns use the native POINT type, whose GIST index cannot
+-- serve PostGIS ST_DWithin. Radius queries cast the point to a WGS84 geography
+-- (so distances are in meters); these indexes match that exact expression.
+
+CREATE INDEX IF NOT EXISTS idx_venues_geography
+ON venues USING GIST ((ST_SetSRID(coordinates::geometry, 4326)::geography));
+
+CREATE INDEX IF NOT EXISTS idx_cities_geography
+ON cities USING GIST ((ST_SetSRID(coordinates::geometry, 4326)::geography));
+
+COMMENT ON INDEX idx_venues_geography IS 'Backs ST_DWithin radius searches on venues (meters)';
+COMMENT ON INDEX idx_cities_geography IS 'Backs ST_DWithin radius searches on cities (meters)';
@@ -0,0 +1,9 @@
+-- Migration: Add composite indexes for keyset pagination of event lists
+-- Event lists page with a (event_datetime, id) > (cursor) seek instead of OFFSET;
+-- these indexes match that ordering so each page is an index range scan.
+
+CREATE INDEX IF NOT EXISTS idx_events_datetime_id ON events(event_datetime, id);
+CREATE INDEX IF NOT EXISTS idx_events_venue_datetime_id ON events(venue_id, event_datetime, id);
+
+COMMENT ON INDEX idx_events_datetime_id IS 'Keyset pagination of upcoming events by (event_datetime, id)';
+COMMENT ON INDEX idx_events_venue_datetime_id IS 'Keyset pagination of a venue''s events by (event_datetime, id)';
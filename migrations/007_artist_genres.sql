@@ -0,0 +1,60 @@
+-- Migration: Normalize artist genres into a lookup table
+-- Genre-filtered listings joined artists and probed the genres array per row.
+-- artist_genres is B-tree indexed on (genre_id, artist_id), so a genre filter
+-- resolves to an index-only scan. artists.genres stays as the source of truth
+-- for writes and is mirrored here by trigger.
+
+CREATE TABLE IF NOT EXISTS genres (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS artist_genres (
+    artist_id INTEGER NOT NULL REFERENCES artists(id) ON DELETE CASCADE,
+    genre_id INTEGER NOT NULL REFERENCES genres(id) ON DELETE CASCADE,
+    PRIMARY KEY (artist_id, genre_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_artist_genres_genre_artist ON artist_genres(genre_id, artist_id);
+
+-- Backfill from existing artist rows
+INSERT INTO genres (name)
+SELECT DISTINCT unnest(genres) FROM artists WHERE genres IS NOT NULL
+ON CONFLICT (name) DO NOTHING;
+
+INSERT INTO artist_genres (artist_id, genre_id)
+SELECT DISTINCT a.id, g.id
+FROM artists a
+CROSS JOIN LATERAL unnest(a.genres) AS ag(name)
+JOIN genres g ON g.name = ag.name
+ON CONFLICT DO NOTHING;
+
+-- Keep artist_genres in sync with artists.genres
+CREATE OR REPLACE FUNCTION sync_artist_genres()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM artist_genres WHERE artist_id = NEW.id;
+
+    IF NEW.genres IS NOT NULL THEN
+        INSERT INTO genres (name)
+        SELECT DISTINCT unnest(NEW.genres)
+        ON CONFLICT (name) DO NOTHING;
+
+        INSERT INTO artist_genres (artist_id, genre_id)
+        SELECT DISTINCT NEW.id, g.id
+        FROM genres g
+        WHERE g.name = ANY(NEW.genres)
+        ON CONFLICT DO NOTHING;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE 'plpgsql';
+
+CREATE TRIGGER sync_artists_genres
+AFTER INSERT OR UPDATE OF genres ON artists
+FOR EACH ROW
+EXECUTE FUNCTION sync_artist_genres();
+
+COMMENT ON TABLE artist_genres IS 'Normalized artist genres, maintained from artists.genres by trigger';
+COMMENT ON INDEX idx_artist_genres_genre_artist IS 'Index-only genre filtering for artists, events and venues';
@@ -0,0 +1,21 @@
+-- Migration: Full-text search indexes for events and artists
+-- Event search matched '%term%' with ILIKE across title, description and
+-- artist names, which can't use B-tree indexes. These GIN expression indexes
+-- back @@ matching instead. Expression indexes (rather than stored tsvector
+-- columns) keep SELECT events.* / artists.* payloads unchanged.
+
+-- Weighted event document: title ranks above description
+CREATE OR REPLACE FUNCTION event_search_document(title TEXT, description TEXT)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B');
+$$ LANGUAGE SQL IMMUTABLE;
+
+CREATE INDEX IF NOT EXISTS idx_events_search_document
+ON events USING GIN (event_search_document(title, description));
+
+CREATE INDEX IF NOT EXISTS idx_artists_name_tsv
+ON artists USING GIN (to_tsvector('english', coalesce(name, '')));
+
+COMMENT ON INDEX idx_events_search_document IS 'Full-text search over event title and description';
+COMMENT ON INDEX idx_artists_name_tsv IS 'Full-text search over artist names';
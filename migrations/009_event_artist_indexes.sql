@@ -0,0 +1,14 @@
+-- Migration: Composite index for artist event lookups
+-- Artist event lists filter event_artists by artist_id and join to events by
+-- event_id. The primary key is (event_id, artist_id), so that lookup used the
+-- single-column artist index and a heap fetch per row; an (artist_id, event_id)
+-- index answers it index-only.
+--
+-- Venue event lists are already covered by idx_events_venue_datetime (004) and
+-- idx_events_venue_datetime_id (006), and upcoming lists by
+-- idx_events_datetime_id (006). A partial "upcoming" index can't be used here:
+-- index predicates must be immutable, so they can't reference NOW().
+
+CREATE INDEX IF NOT EXISTS idx_event_artists_artist_event ON event_artists(artist_id, event_id);
+
+COMMENT ON INDEX idx_event_artists_artist_event IS 'Index-only artist to events lookups';
@@ -0,0 +1,8 @@
+-- Migration: Composite index for keyset pagination of city venue lists
+-- City venue lists page with a (name, id) > (cursor) seek instead of OFFSET;
+-- this index matches that ordering within a city so each page is a single
+-- index range scan rather than a scan of every skipped venue.
+
+CREATE INDEX IF NOT EXISTS idx_venues_city_name_id ON venues(city_id, name, id);
+
+COMMENT ON INDEX idx_venues_city_name_id IS 'Keyset pagination of a city''s venues by (name, id)';
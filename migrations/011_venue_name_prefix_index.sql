@@ -0,0 +1,10 @@
+-- Migration: Prefix index for short venue name searches
+-- Searches shorter than three characters can't use the trigram index
+-- (idx_venues_name_trgm) and would match nearly every venue as a substring,
+-- so they match LOWER(name) as a prefix instead. idx_venues_name_lower uses the
+-- default operator class, which only serves LIKE under the C collation;
+-- text_pattern_ops serves it under any collation.
+
+CREATE INDEX IF NOT EXISTS idx_venues_name_lower_pattern ON venues(LOWER(name) text_pattern_ops);
+
+COMMENT ON INDEX idx_venues_name_lower_pattern IS 'Prefix matches on LOWER(name) for short venue searches';
@@ -0,0 +1,25 @@
+-- Migration: Case-insensitive, unique email addresses
+-- Logins look users up by LOWER(email) so addresses match regardless of case.
+-- The case-sensitive UNIQUE(email) still allowed Foo@x.com next to foo@x.com,
+-- so existing addresses are normalized to lower case and a unique expression
+-- index on LOWER(email) both serves the lookup and rejects case variants.
+-- idx_users_email duplicated the index behind UNIQUE(email) and only added
+-- write cost, so it is dropped.
+
+-- Case variants of one address belong to separate accounts and can't be merged
+-- automatically; stop so they are resolved by hand before normalizing
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM users GROUP BY LOWER(email) HAVING COUNT(*) > 1) THEN
+        RAISE EXCEPTION 'users has email addresses that differ only in case; resolve them before running this migration';
+    END IF;
+END
+$$;
+
+UPDATE users SET email = LOWER(email) WHERE email <> LOWER(email);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_lower ON users(LOWER(email));
+
+DROP INDEX IF EXISTS idx_users_email;
+
+COMMENT ON INDEX idx_users_email_lower IS 'Case-insensitive unique user lookup by email';
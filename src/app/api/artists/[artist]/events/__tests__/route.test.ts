@@ -0,0 +1,82 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { NextRequest } from 'next/server';
+import { encodeEventCursor } from '@/lib/utils/pagination';
+
+const mocks = vi.hoisted(() => ({
+  findUpcomingEvents: vi.fn(),
+  findUpcomingEventsByArtistName: vi.fn(),
+  findByName: vi.fn()
+}));
+
+// The route creates its repository at module load, so mock the class up front
+vi.mock('@/lib/repositories/artist-repository', () => ({
+  ArtistRepository: vi.fn().mockImplementation(() => mocks)
+}));
+
+import { GET } from '../route';
+
+describe('/api/artists/[artist]/events', () => {
+  const event = (id: number, iso: string) => ({
+    id,
+    venue_id: 1,
+    title: `Show ${id}`,
+    event_datetime: new Date(iso)
+  });
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('should return a cursor when another page follows', async () => {
+    const last = event(2, '2030-01-02T20:00:00Z');
+    mocks.findUpcomingEvents.mockResolvedValue({ data: [event(1, '2030-01-01T20:00:00Z'), last], hasMore: true });
+
+    const request = new NextRequest('http://localhost:3000/api/artists/5/events?limit=2');
+    const response = await GET(request, { params: { artist: '5' } });
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.events).toHaveLength(2);
+    expect(data.next_cursor).toBe(encodeEventCursor(last));
+  });
+
+  it('should seek past the cursor', async () => {
+    const eventDatetime = new Date('2030-01-02T20:00:00Z');
+    const cursor = encodeEventCursor({ event_datetime: eventDatetime, id: 2 });
+    mocks.findUpcomingEvents.mockResolvedValue({ data: [event(3, '2030-01-03T20:00:00Z')], hasMore: false });
+
+    const request = new NextRequest(`http://localhost:3000/api/artists/5/events?limit=2&cursor=${cursor}`);
+    const response = await GET(request, { params: { artist: '5' } });
+
+    expect(response.status).toBe(200);
+    expect(mocks.findUpcomingEvents).toHaveBeenCalledWith(
+      5,
+      { limit: 2 },
+      { event_datetime: eventDatetime, id: 2 }
+    );
+  });
+
+  it('should return a null cursor on the last page, even when it is full', async () => {
+    mocks.findUpcomingEvents.mockResolvedValue({
+      data: [event(1, '2030-01-01T20:00:00Z'), event(2, '2030-01-02T20:00:00Z')],
+      hasMore: false
+    });
+
+    const request = new NextRequest('http://localhost:3000/api/artists/5/events?limit=2');
+    const response = await GET(request, { params: { artist: '5' } });
+    const data = await response.json();
+
+    expect(data.events).toHaveLength(2);
+    expect(data.next_cursor).toBeNull();
+  });
+
+  it('should return 400 for a malformed cursor', async () => {
+    const request = new NextRequest('http://localhost:3000/api/artists/5/events?cursor=not-a-cursor');
+    const response = await GET(request, { params: { artist: '5' } });
+    const data = await response.json();
+
+    expect(response.status).toBe(400);
+    expect(data.error.code).toBe('INVALID_CURSOR');
+    expect(mocks.findUpcomingEvents).not.toHaveBeenCalled();
+  });
+});
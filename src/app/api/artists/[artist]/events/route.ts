@@ -1,10 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { ArtistRepository } from '@/lib/repositories/artist-repository';
+import { decodeEventCursor, encodeEventCursor } from '@/lib/utils/pagination';
+import { EventCursor } from '@/lib/models/types';
 
 const artistRepository = new ArtistRepository();
 
 /**
- * GET /api/artists/[artist]/events - Get upcoming events for an artist
+ * GET /api/artists/[artist]/events - Get upcoming events for an artist.
+ * With a limit, pass the returned `next_cursor` as `cursor` to page without OFFSET.
  */
 export async function GET(
   request: NextRequest,
@@ -14,27 +17,6 @@ export async function GET(
     const artistParam = params.artist;
     const { searchParams } = new URL(request.url);
     
-    // Parse artist ID or name
-    let artistId: number;
-    const parsedId = parseInt(artistParam, 10);
-    
-    if (!isNaN(parsedId)) {
-      artistId = parsedId;
-    } else {
-      // Search by name first to get ID
-      const artistName = decodeURIComponent(artistParam);
-      const artist = await artistRepository.findByName(artistName);
-      
-      if (!artist) {
-        return NextResponse.json(
-          { error: { code: 'ARTIST_NOT_FOUND', message: 'Artist not found' } },
-          { status: 404 }
-        );
-      }
-      
-      artistId = artist.id;
-    }
-
     // Parse query parameters
     const startDate = searchParams.get('start_date');
     const endDate = searchParams.get('end_date');
@@ -59,13 +41,56 @@ export async function GET(
       eventParams.page = parseInt(page, 10);
     }
 
-    // Get upcoming events for the artist
-    const events = await artistRepository.findUpcomingEvents(artistId, eventParams);
+    let cursor: EventCursor | undefined;
+    const cursorParam = searchParams.get('cursor');
+    if (cursorParam) {
+      const decoded = decodeEventCursor(cursorParam);
+      if (!decoded) {
+        return NextResponse.json(
+          { error: { code: 'INVALID_CURSOR', message: 'Invalid cursor' } },
+          { status: 400 }
+        );
+      }
+      cursor = decoded;
+    }
+
+    // Parse artist ID or name
+    let artistId: number;
+    let events;
+    const parsedId = parseInt(artistParam, 10);
+    
+    if (!isNaN(parsedId)) {
+      artistId = parsedId;
+      events = await artistRepository.findUpcomingEvents(artistId, eventParams, cursor);
+    } else {
+      // Resolve the name and fetch its events concurrently rather than back to back
+      const artistName = decodeURIComponent(artistParam);
+      const [artist, artistEvents] = await Promise.all([
+        artistRepository.findByName(artistName),
+        artistRepository.findUpcomingEventsByArtistName(artistName, eventParams, cursor)
+      ]);
+      
+      if (!artist) {
+        return NextResponse.json(
+          { error: { code: 'ARTIST_NOT_FOUND', message: 'Artist not found' } },
+          { status: 404 }
+        );
+      }
+      
+      artistId = artist.id;
+      events = artistEvents;
+    }
+
+    // The repository fetches one row past the page to tell whether more follow
+    const nextCursor = events.hasMore
+      ? encodeEventCursor(events.data[events.data.length - 1])
+      : null;
 
     return NextResponse.json({
       artist_id: artistId,
-      events,
-      total: events.length
+      events: events.data,
+      total: events.data.length,
+      next_cursor: nextCursor
     });
   } catch (error) {
     console.error('Error fetching artist events:', error);
@@ -1,8 +1,12 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { ArtistRepository } from '@/lib/repositories/artist-repository';
+import { Media } from '@/lib/models/types';
 
 const artistRepository = new ArtistRepository();
 
+// Accepted values for the type query parameter
+const MEDIA_TYPES: ReadonlySet<string> = new Set(['photo', 'video']);
+
 /**
  * GET /api/artists/[artist]/media - Get media (photos and videos) for an artist
  */
@@ -14,16 +18,29 @@ export async function GET(
     const artistParam = params.artist;
     const { searchParams } = new URL(request.url);
     
+    // Parse query parameters
+    const type = searchParams.get('type') as 'photo' | 'video' | null;
+
+    // Validate type parameter before touching the database
+    if (type && !MEDIA_TYPES.has(type)) {
+      return NextResponse.json(
+        { error: { code: 'INVALID_TYPE', message: 'Type must be either "photo" or "video"' } },
+        { status: 400 }
+      );
+    }
+
     // Parse artist ID or name
     let artistId: number;
+    let media: Media[];
     const parsedId = parseInt(artistParam, 10);
     
     if (!isNaN(parsedId)) {
       artistId = parsedId;
+      media = await artistRepository.findMedia(artistId, type || undefined);
     } else {
-      // Search by name first to get ID
+      // Resolve the name and load its media in one round trip
       const artistName = decodeURIComponent(artistParam);
-      const artist = await artistRepository.findByName(artistName);
+      const artist = await artistRepository.findByNameWithMedia(artistName);
       
       if (!artist) {
         return NextResponse.json(
@@ -33,22 +50,9 @@ export async function GET(
       }
       
       artistId = artist.id;
+      media = (artist.media || []).filter(m => !type || m.type === type);
     }
 
-    // Parse query parameters
-    const type = searchParams.get('type') as 'photo' | 'video' | null;
-
-    // Validate type parameter if provided
-    if (type && !['photo', 'video'].includes(type)) {
-      return NextResponse.json(
-        { error: { code: 'INVALID_TYPE', message: 'Type must be either "photo" or "video"' } },
-        { status: 400 }
-      );
-    }
-
-    // Get media for the artist
-    const media = await artistRepository.findMedia(artistId, type || undefined);
-
     // Separate photos and videos for easier frontend consumption
     const photos = media.filter(m => m.type === 'photo');
     const videos = media.filter(m => m.type === 'video');
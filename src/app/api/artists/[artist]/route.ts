@@ -21,14 +21,9 @@ export async function GET(
       // Search by ID
       artist = await artistRepository.findByIdWithMedia(artistId);
     } else {
-      // Search by name (URL decoded)
+      // Search by name (URL decoded), loading media in the same query
       const artistName = decodeURIComponent(artistParam);
-      artist = await artistRepository.findByName(artistName);
-      
-      // If found by name, get full data with media
-      if (artist) {
-        artist = await artistRepository.findByIdWithMedia(artist.id);
-      }
+      artist = await artistRepository.findByNameWithMedia(artistName);
     }
 
     if (!artist) {
@@ -18,10 +18,10 @@ describe('City Venues API with Genre Filtering', () => {
     const mockCity = { id: 1, name: 'Seattle', state_province: 'WA', country: 'US' };
     
     // Mock repository methods
-    CityRepository.prototype.findAll = vi.fn().mockResolvedValue([mockCity]);
+    CityRepository.prototype.findByName = vi.fn().mockResolvedValue(mockCity);
     
     const mockSetGenreFilter = vi.fn().mockReturnThis();
-    const mockFindByCityId = vi.fn().mockResolvedValue({
+    const mockFindByCityName = vi.fn().mockResolvedValue({
       data: [{ id: 1, name: 'Venue 1' }],
       page: 1,
       limit: 20,
@@ -30,7 +30,7 @@ describe('City Venues API with Genre Filtering', () => {
     });
     
     VenueRepository.prototype.setGenreFilter = mockSetGenreFilter;
-    VenueRepository.prototype.findByCityId = mockFindByCityId;
+    VenueRepository.prototype.findByCityName = mockFindByCityName;
 
     // Create mock request with genre header
     const mockRequest = {
@@ -60,10 +60,10 @@ describe('City Venues API with Genre Filtering', () => {
     const mockCity = { id: 1, name: 'Seattle', state_province: 'WA', country: 'US' };
     
     // Mock repository methods
-    CityRepository.prototype.findAll = vi.fn().mockResolvedValue([mockCity]);
+    CityRepository.prototype.findByName = vi.fn().mockResolvedValue(mockCity);
     
     const mockSetGenreFilter = vi.fn().mockReturnThis();
-    const mockFindByCityId = vi.fn().mockResolvedValue({
+    const mockFindByCityName = vi.fn().mockResolvedValue({
       data: [{ id: 1, name: 'Venue 1' }],
       page: 1,
       limit: 20,
@@ -72,7 +72,7 @@ describe('City Venues API with Genre Filtering', () => {
     });
     
     VenueRepository.prototype.setGenreFilter = mockSetGenreFilter;
-    VenueRepository.prototype.findByCityId = mockFindByCityId;
+    VenueRepository.prototype.findByCityName = mockFindByCityName;
 
     // Create mock request without genre header
     const mockRequest = {
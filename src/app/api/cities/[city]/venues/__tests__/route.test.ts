@@ -3,6 +3,7 @@ import { GET } from '../route';
 import { CityRepository } from '@/lib/repositories/city-repository';
 import { VenueRepository } from '@/lib/repositories/venue-repository';
 import { NextRequest } from 'next/server';
+import { encodeVenueCursor } from '@/lib/utils/pagination';
 
 // Mock the repositories
 vi.mock('@/lib/repositories/city-repository');
@@ -29,15 +30,15 @@ describe('/api/cities/[city]/venues', () => {
       total_pages: 1
     };
 
-    const mockFindAll = vi.fn().mockResolvedValue(mockCities);
-    const mockFindByCityId = vi.fn().mockResolvedValue(mockVenueResult);
+    const mockFindByName = vi.fn().mockResolvedValue(mockCities[0]);
+    const mockFindByCityName = vi.fn().mockResolvedValue(mockVenueResult);
 
     vi.mocked(CityRepository).mockImplementation(() => ({
-      findAll: mockFindAll,
+      findByName: mockFindByName,
     }) as any);
 
     vi.mocked(VenueRepository).mockImplementation(() => ({
-      findByCityId: mockFindByCityId,
+      findByCityName: mockFindByCityName,
     }) as any);
 
     const request = new NextRequest('http://localhost/api/cities/Seattle/venues');
@@ -56,9 +57,10 @@ describe('/api/cities/[city]/venues', () => {
       page: 1,
       limit: 20,
       total: 2,
-      total_pages: 1
+      total_pages: 1,
+      next_cursor: null
     });
-    expect(mockFindByCityId).toHaveBeenCalledWith(1, {
+    expect(mockFindByCityName).toHaveBeenCalledWith('Seattle', {
       page: 1,
       limit: 20,
       sort_by: 'name',
@@ -79,15 +81,15 @@ describe('/api/cities/[city]/venues', () => {
       total_pages: 5
     };
 
-    const mockFindAll = vi.fn().mockResolvedValue(mockCities);
-    const mockFindByCityId = vi.fn().mockResolvedValue(mockVenueResult);
+    const mockFindByName = vi.fn().mockResolvedValue(mockCities[0]);
+    const mockFindByCityName = vi.fn().mockResolvedValue(mockVenueResult);
 
     vi.mocked(CityRepository).mockImplementation(() => ({
-      findAll: mockFindAll,
+      findByName: mockFindByName,
     }) as any);
 
     vi.mocked(VenueRepository).mockImplementation(() => ({
-      findByCityId: mockFindByCityId,
+      findByCityName: mockFindByCityName,
     }) as any);
 
     const request = new NextRequest('http://localhost/api/cities/Portland/venues?page=2&limit=10&sort_by=capacity&sort_dir=desc');
@@ -99,9 +101,10 @@ describe('/api/cities/[city]/venues', () => {
       page: 2,
       limit: 10,
       total: 50,
-      total_pages: 5
+      total_pages: 5,
+      next_cursor: null
     });
-    expect(mockFindByCityId).toHaveBeenCalledWith(1, {
+    expect(mockFindByCityName).toHaveBeenCalledWith('Portland', {
       page: 2,
       limit: 10,
       sort_by: 'capacity',
@@ -122,15 +125,15 @@ describe('/api/cities/[city]/venues', () => {
       total_pages: 0
     };
 
-    const mockFindAll = vi.fn().mockResolvedValue(mockCities);
-    const mockFindByCityId = vi.fn().mockResolvedValue(mockVenueResult);
+    const mockFindByName = vi.fn().mockResolvedValue(mockCities[0]);
+    const mockFindByCityName = vi.fn().mockResolvedValue(mockVenueResult);
 
     vi.mocked(CityRepository).mockImplementation(() => ({
-      findAll: mockFindAll,
+      findByName: mockFindByName,
     }) as any);
 
     vi.mocked(VenueRepository).mockImplementation(() => ({
-      findByCityId: mockFindByCityId,
+      findByCityName: mockFindByCityName,
     }) as any);
 
     const request = new NextRequest('http://localhost/api/cities/Coeur%20d%27Alene/venues');
@@ -139,17 +142,83 @@ describe('/api/cities/[city]/venues', () => {
 
     expect(response.status).toBe(200);
     expect(data.city).toBe('Coeur d\'Alene');
+    expect(mockFindByName).toHaveBeenCalledWith('Coeur d\'Alene');
   });
 
-  it('should return 404 for non-existent city', async () => {
-    const mockCities = [
-      { id: 1, name: 'Seattle', state_province: 'WA', country: 'US', coordinates: { x: -122.3, y: 47.6 }, created_at: new Date(), updated_at: new Date() }
-    ];
+  it('should return a cursor from the first page in name order', async () => {
+    const lastVenue = { id: 2, name: 'Neumos', city_id: 1 };
+    const mockFindByName = vi.fn().mockResolvedValue({ id: 1, name: 'Seattle', state_province: 'WA', country: 'US' });
+    const mockFindByCityName = vi.fn().mockResolvedValue({
+      data: [{ id: 1, name: 'Barboza', city_id: 1 }, lastVenue],
+      total: 5,
+      page: 1,
+      limit: 2,
+      total_pages: 3
+    });
+
+    vi.mocked(CityRepository).mockImplementation(() => ({
+      findByName: mockFindByName,
+    }) as any);
+
+    vi.mocked(VenueRepository).mockImplementation(() => ({
+      findByCityName: mockFindByCityName,
+    }) as any);
+
+    const request = new NextRequest('http://localhost/api/cities/Seattle/venues?limit=2');
+    const response = await GET(request, { params: { city: 'Seattle' } });
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.pagination.next_cursor).toBe(encodeVenueCursor(lastVenue));
+  });
+
+  it('should page with a cursor when one is given', async () => {
+    const mockFindByName = vi.fn().mockResolvedValue({ id: 1, name: 'Seattle', state_province: 'WA', country: 'US' });
+    const mockFindByCityNameAfter = vi.fn().mockResolvedValue({
+      data: [{ id: 3, name: 'Showbox', city_id: 1 }],
+      limit: 1,
+      next_cursor: 'next'
+    });
+
+    vi.mocked(CityRepository).mockImplementation(() => ({
+      findByName: mockFindByName,
+    }) as any);
+
+    vi.mocked(VenueRepository).mockImplementation(() => ({
+      findByCityNameAfter: mockFindByCityNameAfter,
+    }) as any);
+
+    const cursor = encodeVenueCursor({ name: 'Neumos', id: 2 });
+    const request = new NextRequest(`http://localhost/api/cities/Seattle/venues?limit=1&cursor=${cursor}`);
+    const response = await GET(request, { params: { city: 'Seattle' } });
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.venues).toHaveLength(1);
+    expect(data.pagination).toEqual({ limit: 1, next_cursor: 'next' });
+    expect(mockFindByCityNameAfter).toHaveBeenCalledWith('Seattle', { name: 'Neumos', id: 2 }, 1);
+  });
+
+  it('should return 400 for a malformed cursor', async () => {
+    vi.mocked(CityRepository).mockImplementation(() => ({}) as any);
+    vi.mocked(VenueRepository).mockImplementation(() => ({}) as any);
 
-    const mockFindAll = vi.fn().mockResolvedValue(mockCities);
+    const request = new NextRequest('http://localhost/api/cities/Seattle/venues?cursor=not-a-cursor');
+    const response = await GET(request, { params: { city: 'Seattle' } });
+
+    expect(response.status).toBe(400);
+  });
+
+  it('should return 404 for non-existent city', async () => {
+    const mockFindByName = vi.fn().mockResolvedValue(null);
+    const mockFindByCityName = vi.fn().mockResolvedValue({ data: [], total: 0, page: 1, limit: 20, total_pages: 0 });
 
     vi.mocked(CityRepository).mockImplementation(() => ({
-      findAll: mockFindAll,
+      findByName: mockFindByName,
+    }) as any);
+
+    vi.mocked(VenueRepository).mockImplementation(() => ({
+      findByCityName: mockFindByCityName,
     }) as any);
 
     const request = new NextRequest('http://localhost/api/cities/NonExistentCity/venues');
@@ -170,10 +239,14 @@ describe('/api/cities/[city]/venues', () => {
   });
 
   it('should handle database errors', async () => {
-    const mockFindAll = vi.fn().mockRejectedValue(new Error('Database connection failed'));
+    const mockFindByName = vi.fn().mockRejectedValue(new Error('Database connection failed'));
 
     vi.mocked(CityRepository).mockImplementation(() => ({
-      findAll: mockFindAll,
+      findByName: mockFindByName,
+    }) as any);
+
+    vi.mocked(VenueRepository).mockImplementation(() => ({
+      findByCityName: vi.fn().mockResolvedValue({ data: [], total: 0, page: 1, limit: 20, total_pages: 0 }),
     }) as any);
 
     const request = new NextRequest('http://localhost/api/cities/Seattle/venues');
@@ -202,15 +275,15 @@ describe('/api/cities/[city]/venues', () => {
       total_pages: 1
     };
 
-    const mockFindAll = vi.fn().mockResolvedValue(mockCities);
-    const mockFindByCityId = vi.fn().mockResolvedValue(mockVenueResult);
+    const mockFindByName = vi.fn().mockResolvedValue(mockCities[0]);
+    const mockFindByCityName = vi.fn().mockResolvedValue(mockVenueResult);
 
     vi.mocked(CityRepository).mockImplementation(() => ({
-      findAll: mockFindAll,
+      findByName: mockFindByName,
     }) as any);
 
     vi.mocked(VenueRepository).mockImplementation(() => ({
-      findByCityId: mockFindByCityId,
+      findByCityName: mockFindByCityName,
     }) as any);
 
     const request = new NextRequest('http://localhost/api/cities/vancouver/venues');
@@ -1,11 +1,14 @@
 import { CityRepository } from '@/lib/repositories/city-repository';
 import { VenueRepository } from '@/lib/repositories/venue-repository';
 import { NextRequest, NextResponse } from 'next/server';
-import { withCaching, CACHE_CONFIGS } from '@/lib/utils/cache-utils';
+import { cachedJsonResponse } from '@/lib/utils/cache-utils';
+import { paginationOf, parsePagination, decodeVenueCursor, encodeVenueCursor } from '@/lib/utils/pagination';
 
 /**
  * GET /api/cities/{city}/venues
- * Returns venues in a specific city with pagination
+ * Returns venues in a specific city with pagination.
+ * In name order, every page returns a `next_cursor` while more venues follow;
+ * pass it as `cursor` to continue without OFFSET.
  */
 export async function GET(
     request: NextRequest,
@@ -23,20 +26,67 @@ export async function GET(
 
         // Parse query parameters for pagination and filtering
         const { searchParams } = new URL(request.url);
-        const page = parseInt(searchParams.get('page') || '1');
-        const limit = parseInt(searchParams.get('limit') || '20');
+        const { page, limit } = parsePagination(searchParams);
         const sortBy = searchParams.get('sort_by') || 'name';
         const sortDir = (searchParams.get('sort_dir') || 'asc') as 'asc' | 'desc';
         
         // Get genre filter from request headers (set by middleware)
         const genreFilter = request.headers.get('x-genre-filter');
 
-        // Find the city first
+        const cityName = decodeURIComponent(city);
         const cityRepo = new CityRepository();
-        const cities = await cityRepo.findAll();
-        const targetCity = cities.find(c =>
-            c.name.toLowerCase() === decodeURIComponent(city).toLowerCase()
-        );
+        const venueRepo = new VenueRepository();
+        
+        // Apply genre filter if present
+        if (genreFilter) {
+            venueRepo.setGenreFilter(genreFilter);
+        }
+        
+        // Keyset pagination: continue after the cursor instead of counting pages
+        const cursorParam = searchParams.get('cursor');
+        if (cursorParam) {
+            const cursor = decodeVenueCursor(cursorParam);
+            if (!cursor) {
+                return NextResponse.json(
+                    { error: "Invalid cursor" },
+                    { status: 400 }
+                );
+            }
+
+            const [cursorCity, venuesPage] = await Promise.all([
+                cityRepo.findByName(cityName),
+                venueRepo.findByCityNameAfter(cityName, cursor, limit)
+            ]);
+
+            if (!cursorCity) {
+                return NextResponse.json(
+                    { error: `No city found with name: ${city}` },
+                    { status: 404 }
+                );
+            }
+
+            return cachedJsonResponse(request, {
+                city: cursorCity.name,
+                genre: genreFilter || null,
+                venues: venuesPage.data,
+                pagination: {
+                    limit: venuesPage.limit,
+                    next_cursor: venuesPage.next_cursor
+                }
+            });
+        }
+
+        // Look up the city and its venues concurrently; the venue query
+        // resolves the city by name itself, so it doesn't wait on the lookup
+        const [targetCity, result] = await Promise.all([
+            cityRepo.findByName(cityName),
+            venueRepo.findByCityName(cityName, {
+                page,
+                limit,
+                sort_by: sortBy,
+                sort_dir: sortDir
+            })
+        ]);
 
         if (!targetCity) {
             return NextResponse.json(
@@ -45,37 +95,23 @@ export async function GET(
             );
         }
 
-        // Get venues for the city with pagination
-        const venueRepo = new VenueRepository();
-        
-        // Apply genre filter if present
-        if (genreFilter) {
-            venueRepo.setGenreFilter(genreFilter);
-        }
-        
-        const result = await venueRepo.findByCityId(targetCity.id, {
-            page,
-            limit,
-            sort_by: sortBy,
-            sort_dir: sortDir
-        });
+        // Cursors follow (name, id), so they are only handed out in that order
+        const last = result.data[result.data.length - 1];
+        const nameOrder = sortBy === 'name' && sortDir.toLowerCase() !== 'desc';
+        const nextCursor = nameOrder && page < result.total_pages && last
+            ? encodeVenueCursor(last)
+            : null;
 
-        // Create the response
-        const response = NextResponse.json({
+        // Cache-Control + ETag let repeat requests short-circuit with a 304
+        return cachedJsonResponse(request, {
             city: targetCity.name,
             genre: genreFilter || null,
             venues: result.data,
             pagination: {
-                page: result.page,
-                limit: result.limit,
-                total: result.total,
-                total_pages: result.total_pages
+                ...paginationOf(result),
+                next_cursor: nextCursor
             }
         });
-        
-        // Apply caching headers - use STANDARD cache for venue listings
-        // This allows for a good balance between freshness and performance
-        return withCaching(request, response);
 
     } catch (error) {
         console.error(`Error fetching venues for city ${params.city}:`, error);
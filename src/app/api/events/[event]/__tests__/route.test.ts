@@ -62,7 +62,8 @@ describe('/api/events/[event]', () => {
             photo_url: 'https://example.com/photo.jpg',
             profile_bio: 'A great artist'
           }
-        ]
+        ],
+        status: 'upcoming'
       };
 
       mockEventRepo.findByIdWithDetails.mockResolvedValue(mockEvent);
@@ -82,7 +83,7 @@ describe('/api/events/[event]', () => {
       expect(mockEventRepo.findByIdWithDetails).toHaveBeenCalledWith(1);
     });
 
-    it('should return correct status for past events', async () => {
+    it('should return the query-computed status for past events', async () => {
       const pastDate = new Date();
       pastDate.setDate(pastDate.getDate() - 2); // 2 days ago
 
@@ -117,7 +118,8 @@ describe('/api/events/[event]', () => {
             updated_at: new Date()
           }
         },
-        artists: []
+        artists: [],
+        status: 'past'
       };
 
       mockEventRepo.findByIdWithDetails.mockResolvedValue(mockEvent);
@@ -130,7 +132,7 @@ describe('/api/events/[event]', () => {
       expect(data.event.status).toBe('past');
     });
 
-    it('should return correct status for events today', async () => {
+    it('should return the query-computed status for events today', async () => {
       const todayDate = new Date();
       todayDate.setHours(todayDate.getHours() + 2); // 2 hours from now
 
@@ -165,7 +167,8 @@ describe('/api/events/[event]', () => {
             updated_at: new Date()
           }
         },
-        artists: []
+        artists: [],
+        status: 'today'
       };
 
       mockEventRepo.findByIdWithDetails.mockResolvedValue(mockEvent);
@@ -178,7 +181,7 @@ describe('/api/events/[event]', () => {
       expect(data.event.status).toBe('today');
     });
 
-    it('should return correct status for ongoing events', async () => {
+    it('should return the query-computed status for ongoing events', async () => {
       const recentDate = new Date();
       recentDate.setHours(recentDate.getHours() - 2); // 2 hours ago
 
@@ -213,7 +216,8 @@ describe('/api/events/[event]', () => {
             updated_at: new Date()
           }
         },
-        artists: []
+        artists: [],
+        status: 'ongoing'
       };
 
       mockEventRepo.findByIdWithDetails.mockResolvedValue(mockEvent);
@@ -1,5 +1,6 @@
 import { EventRepository } from '@/lib/repositories/event-repository';
 import { NextRequest, NextResponse } from 'next/server';
+import { formatEventDate, formatEventTime } from '@/lib/utils/date-utils';
 
 /**
  * GET /api/events/{event}
@@ -39,43 +40,15 @@ export async function GET(
             );
         }
 
-        // Add event status based on date
-        const now = new Date();
+        // Status comes from the query (database clock); only formatting happens here
         const eventDate = new Date(eventData.event_datetime);
-        let status = 'upcoming';
-        
-        if (eventDate < now) {
-            // Check if event was within the last 24 hours (could be ongoing)
-            const hoursSinceEvent = (now.getTime() - eventDate.getTime()) / (1000 * 60 * 60);
-            if (hoursSinceEvent <= 24) {
-                status = 'ongoing';
-            } else {
-                status = 'past';
-            }
-        } else {
-            // Check if event is within the next 24 hours
-            const hoursUntilEvent = (eventDate.getTime() - now.getTime()) / (1000 * 60 * 60);
-            if (hoursUntilEvent <= 24) {
-                status = 'today';
-            }
-        }
 
         return NextResponse.json({
             event: {
                 ...eventData,
-                status,
                 // Add formatted date for convenience
-                formatted_date: eventDate.toLocaleDateString('en-US', {
-                    weekday: 'long',
-                    year: 'numeric',
-                    month: 'long',
-                    day: 'numeric'
-                }),
-                formatted_time: eventDate.toLocaleTimeString('en-US', {
-                    hour: 'numeric',
-                    minute: '2-digit',
-                    hour12: true
-                })
+                formatted_date: formatEventDate(eventDate),
+                formatted_time: formatEventTime(eventDate)
             }
         });
 
@@ -8,8 +8,8 @@ export async function GET() {
   const startTime = Date.now();
 
   try {
-    // Get comprehensive system health
-    const systemHealth = await HealthMonitor.getSystemHealth();
+    // Get comprehensive system health (briefly cached so probes don't hammer DB/ES)
+    const systemHealth = await HealthMonitor.getCachedSystemHealth();
     const responseTime = Date.now() - startTime;
 
     // Record performance metrics
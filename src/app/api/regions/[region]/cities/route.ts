@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { CityRepository } from '@/lib/repositories/city-repository';
-import { VenueRepository } from '@/lib/repositories/venue-repository';
+import { cachedJsonResponse } from '@/lib/utils/cache-utils';
 
 /**
  * GET /api/regions/{region}/cities
@@ -20,34 +20,18 @@ export async function GET(
       );
     }
     
-    // Get cities in the specified region
+    // Get cities in the specified region, sorted by name, with their venue counts in one query
     const cityRepo = new CityRepository();
-    const cities = await cityRepo.findByStateProvince(region);
+    const citiesWithVenueCounts = await cityRepo.findByStateProvinceWithVenueCounts(region);
     
-    if (cities.length === 0) {
+    if (citiesWithVenueCounts.length === 0) {
       return NextResponse.json(
         { error: `No cities found in region: ${region}` },
         { status: 404 }
       );
     }
     
-    // Get venue counts for each city
-    const venueRepo = new VenueRepository();
-    const venueCounts = await venueRepo.getVenueCountsByCity();
-    
-    // Map venue counts to cities
-    const citiesWithVenueCounts = cities.map(city => {
-      const venueCount = venueCounts.find(vc => vc.city_id === city.id)?.venue_count || 0;
-      return {
-        ...city,
-        venue_count: venueCount
-      };
-    });
-    
-    // Sort cities by name
-    citiesWithVenueCounts.sort((a, b) => a.name.localeCompare(b.name));
-    
-    return NextResponse.json({
+    return cachedJsonResponse(request, {
       region,
       cities: citiesWithVenueCounts
     });
@@ -1,4 +1,5 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { NextRequest } from 'next/server';
 import { GET } from '../route';
 import { CityRepository } from '@/lib/repositories/city-repository';
 
@@ -22,7 +23,7 @@ describe('/api/regions', () => {
       getRegions: mockGetRegions,
     }) as any);
 
-    const response = await GET();
+    const response = await GET(new NextRequest('http://localhost/api/regions'));
     const data = await response.json();
 
     expect(response.status).toBe(200);
@@ -35,6 +36,30 @@ describe('/api/regions', () => {
     expect(mockGetRegions).toHaveBeenCalledOnce();
   });
 
+  it('should set cache headers and return 304 for a matching ETag', async () => {
+    const mockGetRegions = vi.fn().mockResolvedValue([
+      { country: 'US', regions: ['WA', 'OR'] }
+    ]);
+
+    vi.mocked(CityRepository).mockImplementation(() => ({
+      getRegions: mockGetRegions,
+    }) as any);
+
+    const response = await GET(new NextRequest('http://localhost/api/regions'));
+    const etag = response.headers.get('ETag');
+
+    expect(etag).toMatch(/^"[0-9a-f]{16}"$/);
+    expect(response.headers.get('Cache-Control')).toContain('max-age=60');
+    expect(response.headers.get('Cache-Control')).toContain('stale-while-revalidate=300');
+
+    const revalidated = await GET(new NextRequest('http://localhost/api/regions', {
+      headers: { 'If-None-Match': etag! }
+    }));
+
+    expect(revalidated.status).toBe(304);
+    expect(revalidated.headers.get('ETag')).toBe(etag);
+  });
+
   it('should handle empty regions gracefully', async () => {
     const mockGetRegions = vi.fn().mockResolvedValue([]);
 
@@ -42,7 +67,7 @@ describe('/api/regions', () => {
       getRegions: mockGetRegions,
     }) as any);
 
-    const response = await GET();
+    const response = await GET(new NextRequest('http://localhost/api/regions'));
     const data = await response.json();
 
     expect(response.status).toBe(200);
@@ -58,7 +83,7 @@ describe('/api/regions', () => {
       getRegions: mockGetRegions,
     }) as any);
 
-    const response = await GET();
+    const response = await GET(new NextRequest('http://localhost/api/regions'));
     const data = await response.json();
 
     expect(response.status).toBe(500);
@@ -79,7 +104,7 @@ describe('/api/regions', () => {
       getRegions: mockGetRegions,
     }) as any);
 
-    const response = await GET();
+    const response = await GET(new NextRequest('http://localhost/api/regions'));
     const data = await response.json();
 
     expect(response.status).toBe(200);
@@ -1,11 +1,12 @@
-import { NextResponse } from 'next/server';
+import { NextRequest, NextResponse } from 'next/server';
 import { CityRepository } from '@/lib/repositories/city-repository';
+import { cachedJsonResponse } from '@/lib/utils/cache-utils';
 
 /**
  * GET /api/regions
  * Returns a list of regions (WA, OR, ID, BC)
  */
-export async function GET() {
+export async function GET(request: NextRequest) {
   try {
     // Define the specific regions we want to return based on requirements
     const targetRegions = ['WA', 'OR', 'ID', 'BC'];
@@ -33,7 +34,7 @@ export async function GET() {
       })
       .filter(Boolean); // Remove null entries
     
-    return NextResponse.json({
+    return cachedJsonResponse(request, {
       regions: filteredRegions
     });
   } catch (error) {
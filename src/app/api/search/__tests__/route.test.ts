@@ -1,6 +1,7 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { GET } from '../route';
 import { elasticsearchService } from '@/lib/search/elasticsearch';
+import { EventRepository } from '@/lib/repositories/event-repository';
 import { NextRequest } from 'next/server';
 
 // Mock the elasticsearch service
@@ -14,6 +15,27 @@ vi.mock('@/lib/search/elasticsearch', () => ({
   }
 }));
 
+// Mock the event repository used when Elasticsearch is down
+vi.mock('@/lib/repositories/event-repository', () => ({
+  EVENT_SEARCH_SORT_COLUMNS: new Map([['_score', 'rank'], ['event_datetime', 'e.event_datetime']]),
+  EventRepository: vi.fn().mockImplementation(() => ({
+    search: vi.fn().mockResolvedValue({
+      data: [{
+        id: 7,
+        title: 'Test Event',
+        venue_id: 3,
+        venue_name: 'Test Venue',
+        artists: [{ id: 4, name: 'Test Artist', genres: ['indie'] }],
+        rank: 0.5
+      }],
+      total: 1,
+      page: 1,
+      limit: 10,
+      total_pages: 1
+    })
+  }))
+}));
+
 describe('/api/search', () => {
   beforeEach(() => {
     vi.clearAllMocks();
@@ -64,6 +86,62 @@ describe('/api/search', () => {
     expect(data.error).toBe('Search service is currently unavailable');
   });
 
+  it('should search events in the database when elasticsearch is unhealthy', async () => {
+    (elasticsearchService.healthCheck as any).mockResolvedValue(false);
+
+    const request = new NextRequest('http://localhost/api/search?q=test&type=event');
+    const response = await GET(request);
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.results.events.total).toBe(1);
+    expect(data.results.events.items[0]).toEqual(expect.objectContaining({
+      id: 7,
+      title: 'Test Event',
+      venue: expect.objectContaining({ id: 3, name: 'Test Venue' }),
+      artists: [{ id: 4, name: 'Test Artist', genres: ['indie'] }],
+      score: 0.5
+    }));
+    expect(elasticsearchService.searchEvents).not.toHaveBeenCalled();
+
+    const repository = (EventRepository as any).mock.results[0].value;
+    expect(repository.search).toHaveBeenCalledWith('test', expect.objectContaining({ page: 1, limit: 10 }));
+  });
+
+  it('should pass a supported sort to the database search', async () => {
+    (elasticsearchService.healthCheck as any).mockResolvedValue(false);
+
+    const request = new NextRequest('http://localhost/api/search?q=test&type=event&sort_by=event_datetime&sort_dir=asc');
+    const response = await GET(request);
+
+    expect(response.status).toBe(200);
+    const repository = (EventRepository as any).mock.results[0].value;
+    expect(repository.search).toHaveBeenCalledWith('test', expect.objectContaining({
+      sort_by: 'event_datetime',
+      sort_dir: 'asc'
+    }));
+  });
+
+  it('should return 503 for event searches sorted by a field the database cannot sort by', async () => {
+    (elasticsearchService.healthCheck as any).mockResolvedValue(false);
+
+    const request = new NextRequest('http://localhost/api/search?q=test&type=event&sort_by=venue.name');
+    const response = await GET(request);
+
+    expect(response.status).toBe(503);
+    expect(EventRepository).not.toHaveBeenCalled();
+  });
+
+  it('should return 503 for filtered event searches when elasticsearch is unhealthy', async () => {
+    (elasticsearchService.healthCheck as any).mockResolvedValue(false);
+
+    const request = new NextRequest('http://localhost/api/search?q=test&type=event&genres=rock');
+    const response = await GET(request);
+
+    expect(response.status).toBe(503);
+    expect(EventRepository).not.toHaveBeenCalled();
+  });
+
   it('should search venues only when type=venue', async () => {
     const mockVenueResults = {
       total: 1,
@@ -181,6 +259,19 @@ describe('/api/search', () => {
     );
   });
 
+  it('should accept repeated and comma-separated list parameters', async () => {
+    (elasticsearchService.healthCheck as any).mockResolvedValue(true);
+    (elasticsearchService.searchVenues as any).mockResolvedValue({ total: 0, hits: [] });
+
+    const request = new NextRequest('http://localhost/api/search?q=test&type=venue&state_province=WA&state_province=OR,ID');
+    const response = await GET(request);
+
+    expect(response.status).toBe(200);
+    expect(elasticsearchService.searchVenues).toHaveBeenCalledWith('test',
+      expect.objectContaining({ state_province: ['WA', 'OR', 'ID'] })
+    );
+  });
+
   it('should validate query parameters and return 400 for invalid values', async () => {
     const request = new NextRequest('http://localhost/api/search?q=test&limit=invalid');
     const response = await GET(request);
@@ -191,6 +282,16 @@ describe('/api/search', () => {
     expect(data.details).toBeDefined();
   });
 
+  it('should return 400 for malformed dates', async () => {
+    const request = new NextRequest('http://localhost/api/search?q=test&type=event&start_date=not-a-date');
+    const response = await GET(request);
+    const data = await response.json();
+
+    expect(response.status).toBe(400);
+    expect(data.error).toBe('Invalid query parameters');
+    expect(elasticsearchService.searchEvents).not.toHaveBeenCalled();
+  });
+
   it('should handle elasticsearch service errors gracefully', async () => {
     (elasticsearchService.healthCheck as any).mockResolvedValue(true);
     (elasticsearchService.searchAll as any).mockRejectedValue(new Error('Elasticsearch error'));
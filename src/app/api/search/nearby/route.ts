@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { elasticsearchService } from '@/lib/search/elasticsearch';
 import { z } from 'zod';
+import { dateParam, listParam, searchParamsToObject } from '@/lib/utils/query-params';
+import { paginationMeta } from '@/lib/utils/pagination';
 
 // Nearby search parameters schema
 const nearbyParamsSchema = z.object({
@@ -11,17 +13,20 @@ const nearbyParamsSchema = z.object({
   type: z.enum(['venue', 'artist', 'event', 'all']).optional().default('all'),
   page: z.coerce.number().min(1).optional().default(1),
   limit: z.coerce.number().min(1).max(50).optional().default(10),
-  genres: z.string().optional().transform(val => val ? val.split(',') : undefined),
+  genres: listParam,
   capacity_min: z.coerce.number().min(0).optional(),
   capacity_max: z.coerce.number().min(0).optional(),
   prosper_rank_min: z.coerce.number().min(0).optional(),
-  start_date: z.string().optional().transform(val => val ? new Date(val) : undefined),
-  end_date: z.string().optional().transform(val => val ? new Date(val) : undefined),
+  start_date: dateParam,
+  end_date: dateParam,
   has_tickets: z.coerce.boolean().optional(),
   upcoming_only: z.coerce.boolean().optional().default(false),
   sort_by_distance: z.coerce.boolean().optional().default(true)
 });
 
+// Parameters that may be repeated in the query string
+const LIST_PARAMS = new Set(['genres']);
+
 /**
  * GET /api/search/nearby
  * 
@@ -36,7 +41,7 @@ const nearbyParamsSchema = z.object({
  * - type: Content type filter (venue|artist|event|all, default: all)
  * - page: Page number for pagination (default: 1)
  * - limit: Results per page (max 50, default: 10)
- * - genres: Comma-separated list of genres to filter by
+ * - genres: Genres to filter by (repeated or comma-separated)
  * - capacity_min: Minimum venue capacity
  * - capacity_max: Maximum venue capacity
  * - prosper_rank_min: Minimum prosper rank for venues
@@ -50,7 +55,7 @@ export async function GET(request: NextRequest) {
   try {
     // Parse and validate query parameters
     const searchParams = request.nextUrl.searchParams;
-    const params = Object.fromEntries(searchParams.entries());
+    const params = searchParamsToObject(searchParams, LIST_PARAMS);
     
     const validatedParams = nearbyParamsSchema.parse(params);
     
@@ -318,12 +323,7 @@ export async function GET(request: NextRequest) {
           )
         }
       },
-      pagination: {
-        page,
-        limit,
-        total: results.total,
-        total_pages: Math.ceil(results.total / limit)
-      },
+      pagination: paginationMeta(results.total, page, limit),
       filters: {
         location: { lat, lon },
         radius,
@@ -2,8 +2,11 @@ import { NextRequest, NextResponse } from 'next/server';
 import { elasticsearchService } from '@/lib/search/elasticsearch';
 import { z } from 'zod';
 import { ErrorHandler, AppError, ErrorType } from '@/lib/utils/error-handler';
-import { PerformanceMonitor, RequestTracker } from '@/lib/utils/monitoring';
-import { randomUUID } from 'crypto';
+import { RequestTracker } from '@/lib/utils/monitoring';
+import { dateParam, listParam, searchParamsToObject } from '@/lib/utils/query-params';
+import { paginationMeta } from '@/lib/utils/pagination';
+import { EventRepository, EVENT_SEARCH_SORT_COLUMNS } from '@/lib/repositories/event-repository';
+import { EventSearchParams } from '@/lib/models/types';
 
 // Search query parameters schema
 const searchParamsSchema = z.object({
@@ -11,14 +14,14 @@ const searchParamsSchema = z.object({
   type: z.enum(['venue', 'artist', 'event', 'all']).optional().default('all'),
   page: z.coerce.number().min(1).optional().default(1),
   limit: z.coerce.number().min(1).max(50).optional().default(10),
-  genres: z.string().optional().transform(val => val ? val.split(',') : undefined),
-  state_province: z.string().optional().transform(val => val ? val.split(',') : undefined),
-  country: z.string().optional().transform(val => val ? val.split(',') : undefined),
+  genres: listParam,
+  state_province: listParam,
+  country: listParam,
   capacity_min: z.coerce.number().min(0).optional(),
   capacity_max: z.coerce.number().min(0).optional(),
   prosper_rank_min: z.coerce.number().min(0).optional(),
-  start_date: z.string().optional().transform(val => val ? new Date(val) : undefined),
-  end_date: z.string().optional().transform(val => val ? new Date(val) : undefined),
+  start_date: dateParam,
+  end_date: dateParam,
   has_tickets: z.coerce.boolean().optional(),
   has_bio: z.coerce.boolean().optional(),
   has_photo: z.coerce.boolean().optional(),
@@ -26,6 +29,43 @@ const searchParamsSchema = z.object({
   sort_dir: z.enum(['asc', 'desc']).optional().default('desc')
 });
 
+// Parameters that may be repeated in the query string
+const LIST_PARAMS = new Set(['genres', 'state_province', 'country']);
+
+/**
+ * Search upcoming events through the database's full-text indexes, shaped like
+ * Elasticsearch hits so the response format doesn't change
+ * @param q Search query
+ * @param params Pagination, date filters and sort order
+ */
+async function searchEventsInDatabase(q: string, params: EventSearchParams) {
+  const result = await new EventRepository().search(q, params);
+
+  return {
+    total: result.total,
+    hits: result.data.map(event => ({
+      _source: {
+        id: event.id,
+        title: event.title,
+        description: event.description,
+        event_datetime: event.event_datetime,
+        ticket_url: event.ticket_url,
+        venue: {
+          id: event.venue_id,
+          name: event.venue_name,
+          city: {
+            name: event.city_name,
+            state_province: event.state_province,
+            country: event.country
+          }
+        },
+        artists: event.artists
+      },
+      _score: event.rank
+    }))
+  };
+}
+
 /**
  * GET /api/search
  * 
@@ -37,9 +77,9 @@ const searchParamsSchema = z.object({
  * - type: Content type filter (venue|artist|event|all, default: all)
  * - page: Page number for pagination (default: 1)
  * - limit: Results per page (max 50, default: 10)
- * - genres: Comma-separated list of genres to filter by
- * - state_province: Comma-separated list of states/provinces
- * - country: Comma-separated list of countries
+ * - genres: Genres to filter by (repeated or comma-separated)
+ * - state_province: States/provinces (repeated or comma-separated)
+ * - country: Countries (repeated or comma-separated)
  * - capacity_min: Minimum venue capacity
  * - capacity_max: Maximum venue capacity
  * - prosper_rank_min: Minimum prosper rank for venues
@@ -50,18 +90,21 @@ const searchParamsSchema = z.object({
  * - has_photo: Filter artists with photos
  * - sort_by: Field to sort by
  * - sort_dir: Sort direction (asc|desc)
+ *
+ * When Elasticsearch is unavailable, type=event searches without genre or
+ * has_tickets filters, and with sort_by unset or one of _score, event_datetime
+ * or title, are served from PostgreSQL full-text search.
  */
 export async function GET(request: NextRequest) {
-  const requestId = randomUUID();
-  const startTime = Date.now();
+  const requestId = RequestTracker.requestIdOf(request);
   
-  // Start request tracking
+  // Start request tracking; endRequest records the response time
   RequestTracker.startRequest(requestId, '/api/search', 'GET');
 
   try {
     // Parse and validate query parameters
     const searchParams = request.nextUrl.searchParams;
-    const params = Object.fromEntries(searchParams.entries());
+    const params = searchParamsToObject(searchParams, LIST_PARAMS);
     
     const validatedParams = searchParamsSchema.parse(params);
     
@@ -92,15 +135,28 @@ export async function GET(request: NextRequest) {
     // Otherwise use the genres from the query parameters
     const genres = genreHeader ? [genreHeader] : queryGenres;
 
-    // Check Elasticsearch health
+    // Check Elasticsearch health. Event searches without genre or ticket filters,
+    // sorted by relevance or a column the database supports, can still be answered
+    // from the database's full-text indexes.
     const isHealthy = await elasticsearchService.healthCheck();
-    if (!isHealthy) {
+    const useDatabase = !isHealthy && type === 'event' && !genres?.length && has_tickets === undefined &&
+      (!sort_by || EVENT_SEARCH_SORT_COLUMNS.has(sort_by));
+    if (!isHealthy && !useDatabase) {
       throw ErrorHandler.externalServiceError('Elasticsearch', 'Search service is currently unavailable');
     }
 
     let results;
 
-    if (type === 'all') {
+    if (useDatabase) {
+      const eventResults = await searchEventsInDatabase(q, { page, limit, start_date, end_date, sort_by, sort_dir });
+
+      results = {
+        venues: { total: 0, hits: [] },
+        artists: { total: 0, hits: [] },
+        events: eventResults,
+        total: eventResults.total
+      };
+    } else if (type === 'all') {
       // Search across all content types
       results = await elasticsearchService.searchAll(q, {
         page,
@@ -254,12 +310,7 @@ export async function GET(request: NextRequest) {
           }))
         }
       },
-      pagination: {
-        page,
-        limit,
-        total: results.total,
-        total_pages: Math.ceil(results.total / limit)
-      },
+      pagination: paginationMeta(results.total, page, limit),
       filters: {
         type,
         genres,
@@ -277,17 +328,13 @@ export async function GET(request: NextRequest) {
     };
 
     // Record successful response metrics
-    const responseTime = Date.now() - startTime;
-    PerformanceMonitor.recordApiResponseTime('/api/search', 'GET', 200, responseTime);
     RequestTracker.endRequest(requestId, 200);
 
     return NextResponse.json(response);
 
   } catch (error) {
     // Record error metrics
-    const responseTime = Date.now() - startTime;
     const statusCode = error instanceof AppError ? error.statusCode : 500;
-    PerformanceMonitor.recordApiResponseTime('/api/search', 'GET', statusCode, responseTime);
     RequestTracker.endRequest(requestId, statusCode);
 
     return ErrorHandler.handleError(error, requestId);
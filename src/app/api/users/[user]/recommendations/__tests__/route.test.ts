@@ -158,6 +158,10 @@ describe('Recommendations API', () => {
   });
 
   it('should return 404 if user not found', async () => {
+    vi.mocked(authMiddleware).mockResolvedValue({
+      isAuthenticated: true,
+      user: { ...mockUser, id: 456, role: 'admin' }
+    });
     vi.mocked(UserRepository.prototype.findById).mockResolvedValue(null);
 
     const request = new NextRequest('http://localhost/api/users/123/recommendations');
@@ -166,6 +170,14 @@ describe('Recommendations API', () => {
     expect(response.status).toBe(404);
   });
 
+  it('should not look up the user again for their own recommendations', async () => {
+    const request = new NextRequest('http://localhost/api/users/123/recommendations');
+    const response = await GET(request, { params: { user: '123' } });
+
+    expect(response.status).toBe(200);
+    expect(UserRepository.prototype.findById).not.toHaveBeenCalled();
+  });
+
   it('should return 400 if user ID is invalid', async () => {
     const request = new NextRequest('http://localhost/api/users/invalid/recommendations');
     const response = await GET(request, { params: { user: 'invalid' } });
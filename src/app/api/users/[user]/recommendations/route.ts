@@ -33,11 +33,14 @@ export async function GET(
       return NextResponse.json({ error: 'Forbidden' }, { status: 403 });
     }
 
-    // Verify the user exists
-    const userRepository = new UserRepository();
-    const user = await userRepository.findById(userId);
-    if (!user) {
-      return NextResponse.json({ error: 'User not found' }, { status: 404 });
+    // Verify the user exists; the authenticated user was already loaded,
+    // so only an admin looking up someone else needs the extra query
+    if (authResult.user.id !== userId) {
+      const userRepository = new UserRepository();
+      const user = await userRepository.findById(userId);
+      if (!user) {
+        return NextResponse.json({ error: 'User not found' }, { status: 404 });
+      }
     }
 
     // Get query parameters
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { AuthMiddleware } from '@/lib/auth/auth-middleware';
 import { FavoritesRepository } from '@/lib/repositories/favorites-repository';
+import { parsePagination } from '@/lib/utils/pagination';
 
 const authMiddleware = new AuthMiddleware();
 const favoritesRepository = new FavoritesRepository();
@@ -79,8 +80,7 @@ export async function GET(req: NextRequest): Promise<NextResponse> {
     // Get query parameters
     const url = new URL(req.url);
     const entityType = url.searchParams.get('type') as 'venue' | 'artist' | undefined;
-    const page = parseInt(url.searchParams.get('page') || '1', 10);
-    const limit = parseInt(url.searchParams.get('limit') || '20', 10);
+    const { page, limit } = parsePagination(url.searchParams);
     const includeDetails = url.searchParams.get('details') === 'true';
     
     // Get favorites based on parameters
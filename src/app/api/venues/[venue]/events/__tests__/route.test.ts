@@ -1,6 +1,7 @@
 import { GET } from '../route';
 import { EventRepository } from '@/lib/repositories/event-repository';
 import { NextRequest } from 'next/server';
+import { encodeEventCursor } from '@/lib/utils/pagination';
 import { vi } from 'vitest';
 
 // Mock the EventRepository
@@ -13,6 +14,7 @@ describe('/api/venues/[venue]/events', () => {
   beforeEach(() => {
     mockEventRepo = {
       findByVenueId: vi.fn(),
+      findByVenueIdAfter: vi.fn(),
     };
     MockedEventRepository.mockImplementation(() => mockEventRepo);
   });
@@ -61,6 +63,41 @@ describe('/api/venues/[venue]/events', () => {
       });
     });
 
+    it('should return a cursor for the next page from the first offset page', async () => {
+      const lastEvent = { id: 2, venue_id: 123, title: 'Second Show', event_datetime: new Date('2024-12-26T20:00:00Z') };
+
+      mockEventRepo.findByVenueId.mockResolvedValue({
+        data: [{ id: 1, venue_id: 123, title: 'First Show', event_datetime: new Date('2024-12-25T20:00:00Z') }, lastEvent],
+        total: 5,
+        page: 1,
+        limit: 2,
+        total_pages: 3
+      });
+
+      const request = new NextRequest('http://localhost:3000/api/venues/123/events?limit=2');
+      const response = await GET(request, { params: { venue: '123' } });
+      const data = await response.json();
+
+      expect(response.status).toBe(200);
+      expect(data.pagination.next_cursor).toBe(encodeEventCursor(lastEvent));
+    });
+
+    it('should not return a cursor from the last offset page', async () => {
+      mockEventRepo.findByVenueId.mockResolvedValue({
+        data: [{ id: 1, venue_id: 123, title: 'Only Show', event_datetime: new Date('2024-12-25T20:00:00Z') }],
+        total: 1,
+        page: 1,
+        limit: 20,
+        total_pages: 1
+      });
+
+      const request = new NextRequest('http://localhost:3000/api/venues/123/events');
+      const response = await GET(request, { params: { venue: '123' } });
+      const data = await response.json();
+
+      expect(data.pagination.next_cursor).toBeNull();
+    });
+
     it('should handle date filtering parameters', async () => {
       const mockEvents = {
         data: [],
@@ -146,6 +183,38 @@ describe('/api/venues/[venue]/events', () => {
       });
     });
 
+    it('should page with a cursor when one is given', async () => {
+      const eventDatetime = new Date('2024-12-25T20:00:00Z');
+      const cursor = encodeEventCursor({ event_datetime: eventDatetime, id: 7 });
+
+      mockEventRepo.findByVenueIdAfter.mockResolvedValue({
+        data: [],
+        limit: 20,
+        next_cursor: null
+      });
+
+      const request = new NextRequest(`http://localhost:3000/api/venues/123/events?cursor=${cursor}`);
+      const response = await GET(request, { params: { venue: '123' } });
+      const data = await response.json();
+
+      expect(response.status).toBe(200);
+      expect(data.pagination).toEqual({ limit: 20, next_cursor: null });
+      expect(mockEventRepo.findByVenueId).not.toHaveBeenCalled();
+      expect(mockEventRepo.findByVenueIdAfter).toHaveBeenCalledWith(
+        123,
+        { event_datetime: eventDatetime, id: 7 },
+        { limit: 20, start_date: undefined, end_date: undefined }
+      );
+    });
+
+    it('should return 400 for a malformed cursor', async () => {
+      const request = new NextRequest('http://localhost:3000/api/venues/123/events?cursor=not-a-cursor');
+      const response = await GET(request, { params: { venue: '123' } });
+
+      expect(response.status).toBe(400);
+      expect(mockEventRepo.findByVenueIdAfter).not.toHaveBeenCalled();
+    });
+
     it('should handle repository errors', async () => {
       mockEventRepo.findByVenueId.mockRejectedValue(new Error('Database error'));
 
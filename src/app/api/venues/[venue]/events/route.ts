@@ -1,9 +1,14 @@
 import { EventRepository } from '@/lib/repositories/event-repository';
 import { NextRequest, NextResponse } from 'next/server';
+import { paginationOf, parsePagination, decodeEventCursor, encodeEventCursor } from '@/lib/utils/pagination';
+import { Event } from '@/lib/models/types';
 
 /**
  * GET /api/venues/{venue}/events
- * Returns events for a specific venue with optional date filtering
+ * Returns events for a specific venue with optional date filtering.
+ * Every page returns a `next_cursor` while more events follow; pass it as
+ * `cursor` to continue without OFFSET.
+ * Pass `include_total=false` to get has_next/has_prev instead of a total count.
  */
 export async function GET(
     request: NextRequest,
@@ -30,8 +35,7 @@ export async function GET(
         }
 
         // Parse query parameters
-        const page = parseInt(searchParams.get('page') || '1');
-        const limit = Math.min(parseInt(searchParams.get('limit') || '20'), 100); // Cap at 100
+        const { page, limit } = parsePagination(searchParams);
         const startDate = searchParams.get('start_date');
         const endDate = searchParams.get('end_date');
 
@@ -67,22 +71,62 @@ export async function GET(
             );
         }
 
-        // Get events for the venue
         const eventRepo = new EventRepository();
-        const eventsResult = await eventRepo.findByVenueId(venueId, {
+
+        // Keyset pagination: continue after the cursor instead of counting pages
+        const cursorParam = searchParams.get('cursor');
+        if (cursorParam) {
+            const cursor = decodeEventCursor(cursorParam);
+            if (!cursor) {
+                return NextResponse.json(
+                    { error: "Invalid cursor" },
+                    { status: 400 }
+                );
+            }
+
+            const eventsPage = await eventRepo.findByVenueIdAfter(venueId, cursor, {
+                limit,
+                start_date: parsedStartDate,
+                end_date: parsedEndDate
+            });
+
+            return NextResponse.json({
+                events: eventsPage.data,
+                pagination: {
+                    limit: eventsPage.limit,
+                    next_cursor: eventsPage.next_cursor
+                }
+            });
+        }
+
+        const eventParams = {
             page,
             limit,
             start_date: parsedStartDate,
             end_date: parsedEndDate
-        });
+        };
+
+        // Callers that only render next/previous links can skip the count
+        if (searchParams.get('include_total') === 'false') {
+            const { data, ...pagination } = await eventRepo.findByVenueIdLite(venueId, eventParams);
+
+            return NextResponse.json({
+                events: data,
+                pagination: {
+                    ...pagination,
+                    next_cursor: nextCursor(data, pagination.has_next)
+                }
+            });
+        }
+
+        // Get events for the venue
+        const eventsResult = await eventRepo.findByVenueId(venueId, eventParams);
 
         return NextResponse.json({
             events: eventsResult.data,
             pagination: {
-                page: eventsResult.page,
-                limit: eventsResult.limit,
-                total: eventsResult.total,
-                total_pages: eventsResult.total_pages
+                ...paginationOf(eventsResult),
+                next_cursor: nextCursor(eventsResult.data, page < eventsResult.total_pages)
             }
         });
 
@@ -96,4 +140,14 @@ export async function GET(
             { status: 500 }
         );
     }
-}
\ No newline at end of file
+}
+
+/**
+ * Cursor for the page after an offset page, so clients can switch to keyset paging
+ * @param events Events on the current page
+ * @param hasNext Whether more events follow
+ */
+function nextCursor(events: Event[], hasNext: boolean): string | null {
+    const last = events[events.length - 1];
+    return hasNext && last ? encodeEventCursor(last) : null;
+}
@@ -1,8 +1,8 @@
 import { VenueRepository } from '@/lib/repositories/venue-repository';
-import { NextRequest, NextResponse } from 'next/server';
+import { NextRequest } from 'next/server';
 import { ErrorHandler, AppError } from '@/lib/utils/error-handler';
 import { PerformanceMonitor, RequestTracker } from '@/lib/utils/monitoring';
-import { randomUUID } from 'crypto';
+import { cachedJsonResponse } from '@/lib/utils/cache-utils';
 
 /**
  * GET /api/venues/{venue}
@@ -12,11 +12,10 @@ export async function GET(
     request: NextRequest,
     { params }: { params: { venue: string } }
 ) {
-    const requestId = randomUUID();
-    const startTime = Date.now();
+    const requestId = RequestTracker.requestIdOf(request);
     
-    // Start request tracking
-    RequestTracker.startRequest(requestId, `/api/venues/${params.venue}`, 'GET');
+    // Start request tracking; endRequest records the response time
+    RequestTracker.startRequest(requestId, '/api/venues/[venue]', 'GET');
 
     try {
         const { venue } = params;
@@ -45,19 +44,15 @@ export async function GET(
         }
 
         // Record successful response metrics
-        const responseTime = Date.now() - startTime;
-        PerformanceMonitor.recordApiResponseTime(`/api/venues/${venue}`, 'GET', 200, responseTime);
         RequestTracker.endRequest(requestId, 200);
 
-        return NextResponse.json({
+        return cachedJsonResponse(request, {
             venue: venueData
         });
 
     } catch (error) {
         // Record error metrics
-        const responseTime = Date.now() - startTime;
         const statusCode = error instanceof AppError ? error.statusCode : 500;
-        PerformanceMonitor.recordApiResponseTime(`/api/venues/${params.venue}`, 'GET', statusCode, responseTime);
         RequestTracker.endRequest(requestId, statusCode);
 
         return ErrorHandler.handleError(error, requestId);
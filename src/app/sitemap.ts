@@ -11,17 +11,12 @@ import { VALID_GENRES } from '@/middleware';
 export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
   const baseUrl = process.env.NEXT_PUBLIC_BASE_URL || 'https://venue-explorer.com';
   
-  // Get all cities
-  const cityRepo = new CityRepository();
-  const cities = await cityRepo.findAll();
-  
-  // Get all venues
-  const venueRepo = new VenueRepository();
-  const venues = await venueRepo.findAll({ limit: 1000 });
-  
-  // Get popular artists
-  const artistRepo = new ArtistRepository();
-  const artists = await artistRepo.findAll({ limit: 500 });
+  // Load only the columns the URLs need; full rows carry bios and descriptions
+  const [cities, venues, artists] = await Promise.all([
+    new CityRepository().findAllColumns(['name']),
+    new VenueRepository().findAllColumns(['id', 'created_at'], 1000),
+    new ArtistRepository().findAllColumns(['id', 'created_at'], 500)
+  ]);
   
   // Static routes
   const staticRoutes = [
@@ -0,0 +1,13 @@
+/**
+ * Runs once when the server starts.
+ * Warms the database pool in the background so startup isn't held up when
+ * the database is slow or unreachable.
+ */
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return;
+
+  const { warmPool } = await import('./lib/db');
+  warmPool()
+    .then(opened => console.log(`Database pool warmed with ${opened} connections`))
+    .catch(error => console.error('Database pool warm-up failed:', error));
+}
@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest';
+import bcrypt from 'bcryptjs';
+import { hashPassword, verifyPassword, needsRehash } from '../password';
+
+describe('password hashing', () => {
+  it('should verify a password against its scrypt hash', async () => {
+    const hash = await hashPassword('password123');
+
+    expect(hash.startsWith('scrypt$')).toBe(true);
+    expect(await verifyPassword('password123', hash)).toBe(true);
+    expect(await verifyPassword('wrong-password', hash)).toBe(false);
+  });
+
+  it('should salt each hash', async () => {
+    const first = await hashPassword('password123');
+    const second = await hashPassword('password123');
+
+    expect(first).not.toBe(second);
+  });
+
+  it('should verify legacy bcrypt hashes and flag them for rehashing', async () => {
+    const legacyHash = await bcrypt.hash('password123', 4);
+
+    expect(await verifyPassword('password123', legacyHash)).toBe(true);
+    expect(needsRehash(legacyHash)).toBe(true);
+    expect(needsRehash(await hashPassword('password123'))).toBe(false);
+  });
+
+  it('should reject stored scrypt hashes with invalid parameters', async () => {
+    const [, , , , salt, key] = (await hashPassword('password123')).split('$');
+
+    expect(await verifyPassword('password123', `scrypt$abc$8$1$${salt}$${key}`)).toBe(false);
+    expect(await verifyPassword('password123', `scrypt$3$8$1$${salt}$${key}`)).toBe(false);
+    expect(await verifyPassword('password123', `scrypt$1048576$8$1$${salt}$${key}`)).toBe(false);
+  });
+});
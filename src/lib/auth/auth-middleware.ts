@@ -35,20 +35,11 @@ export class AuthMiddleware {
         );
       }
 
-      // Verify token
-      const userId = await this.authService.verifyToken(token);
-      if (!userId) {
-        return NextResponse.json(
-          { error: 'Invalid token' },
-          { status: 401 }
-        );
-      }
-
-      // Get user
-      const user = await this.authService.getUserById(userId);
+      // Verify token and load its user
+      const user = await this.authService.authenticateToken(token);
       if (!user) {
         return NextResponse.json(
-          { error: 'User not found' },
+          { error: 'Invalid token' },
           { status: 401 }
         );
       }
@@ -1,13 +1,22 @@
-import bcrypt from 'bcryptjs';
 import jwt from 'jsonwebtoken';
 import crypto from 'crypto';
 import { UserRepository } from '../repositories/user-repository';
+import { hashPassword, verifyPassword, needsRehash } from './password';
 import { User, Session } from '../models/types';
 
 // JWT secret key from environment variables
 const JWT_SECRET = process.env.JWT_SECRET || 'default-secret-change-in-production';
 const JWT_EXPIRES_IN = process.env.JWT_EXPIRES_IN || '7d';
-const BCRYPT_SALT_ROUNDS = 12;
+// Parsed once rather than on every sign/verify call; tokens are only ever HS256
+const JWT_KEY = crypto.createSecretKey(Buffer.from(JWT_SECRET));
+const JWT_VERIFY_OPTIONS: jwt.VerifyOptions = { algorithms: ['HS256'] };
+
+// Short-lived cache of authenticated session users, keyed by token hash.
+// Kept small and brief so revoked sessions stop working within seconds
+// even on instances that didn't handle the logout.
+const TOKEN_CACHE_TTL_MS = 30 * 1000;
+const TOKEN_CACHE_MAX_SIZE = 10000;
+const tokenCache = new Map<string, { user: Omit<User, 'password_hash'>; expiresAt: number }>();
 
 /**
  * Authentication service for user management and authentication
@@ -28,23 +37,27 @@ export class AuthService {
    * @throws Error if email already exists
    */
   async register(email: string, password: string, name?: string): Promise<Omit<User, 'password_hash'>> {
-    // Check if user already exists
-    const existingUser = await this.userRepository.findByEmail(email);
-    if (existingUser) {
-      throw new Error('Email already registered');
-    }
-
     // Hash password
-    const passwordHash = await bcrypt.hash(password, BCRYPT_SALT_ROUNDS);
-
-    // Create user
-    const user = await this.userRepository.create({
-      email,
-      password_hash: passwordHash,
-      name: name || null,
-      role: 'user',
-      email_verified: false,
-    });
+    const passwordHash = await hashPassword(password);
+
+    // Create user; the unique LOWER(email) index rejects duplicates in any case,
+    // including concurrent registrations a lookup beforehand would miss
+    let user: User;
+    try {
+      user = await this.userRepository.create({
+        // Stored lower-case so lookups and the unique constraint agree on case
+        email: email.toLowerCase(),
+        password_hash: passwordHash,
+        name: name || null,
+        role: 'user',
+        email_verified: false,
+      });
+    } catch (error: any) {
+      if (error.code === '23505') { // PostgreSQL unique constraint violation
+        throw new Error('Email already registered');
+      }
+      throw error;
+    }
 
     // Return user without password hash
     const { password_hash, ...userWithoutPassword } = user;
@@ -66,11 +79,20 @@ export class AuthService {
     }
 
     // Verify password
-    const isPasswordValid = await bcrypt.compare(password, user.password_hash);
+    const isPasswordValid = await verifyPassword(password, user.password_hash);
     if (!isPasswordValid) {
       throw new Error('Invalid credentials');
     }
 
+    // Upgrade bcrypt or outdated scrypt hashes while the password is at hand
+    if (needsRehash(user.password_hash)) {
+      try {
+        await this.userRepository.update(user.id, { password_hash: await hashPassword(password) });
+      } catch (error) {
+        console.error('Failed to upgrade password hash:', error);
+      }
+    }
+
     // Generate JWT token
     const token = this.generateToken(user);
 
@@ -98,7 +120,7 @@ export class AuthService {
   async verifyToken(token: string): Promise<number> {
     try {
       // Verify JWT signature
-      const decoded = jwt.verify(token, JWT_SECRET) as { userId: number };
+      const decoded = jwt.verify(token, JWT_KEY, JWT_VERIFY_OPTIONS) as { userId: number };
       
       // Check if session exists
       const session = await this.userRepository.findSessionByToken(this.hashToken(token));
@@ -112,6 +134,68 @@ export class AuthService {
     }
   }
 
+  /**
+   * Verify a JWT token and load its user with one session lookup
+   * @param token JWT token
+   * @returns User object (without password) or null if the session is gone
+   * @throws Error if token is invalid
+   */
+  async authenticateToken(token: string): Promise<Omit<User, 'password_hash'> | null> {
+    let decoded: { userId: number };
+    try {
+      // Verify JWT signature
+      decoded = jwt.verify(token, JWT_KEY, JWT_VERIFY_OPTIONS) as { userId: number };
+    } catch (error) {
+      throw new Error('Invalid token');
+    }
+
+    // Serve recently verified sessions without a database round trip
+    const tokenHash = this.hashToken(token);
+    const cached = tokenCache.get(tokenHash);
+    if (cached) {
+      if (cached.expiresAt > Date.now()) {
+        return cached.user;
+      }
+      tokenCache.delete(tokenHash);
+    }
+
+    // Session check and user fetch share a single round trip
+    const user = await this.userRepository.findUserBySessionToken(tokenHash);
+    if (!user || user.id !== decoded.userId) {
+      return null;
+    }
+
+    // Return user without password hash
+    const { password_hash, ...userWithoutPassword } = user;
+
+    // Evict the oldest entry once full; Map preserves insertion order
+    if (tokenCache.size >= TOKEN_CACHE_MAX_SIZE) {
+      tokenCache.delete(tokenCache.keys().next().value!);
+    }
+    tokenCache.set(tokenHash, { user: userWithoutPassword, expiresAt: Date.now() + TOKEN_CACHE_TTL_MS });
+
+    return userWithoutPassword;
+  }
+
+  /**
+   * Clear the authenticated token cache
+   */
+  static clearTokenCache(): void {
+    tokenCache.clear();
+  }
+
+  /**
+   * Drop cached sessions for a user after their sessions are invalidated
+   * @param userId User ID
+   */
+  private evictUserTokens(userId: number): void {
+    for (const [tokenHash, entry] of tokenCache) {
+      if (entry.user.id === userId) {
+        tokenCache.delete(tokenHash);
+      }
+    }
+  }
+
   /**
    * Get user by ID
    * @param userId User ID
@@ -135,7 +219,10 @@ export class AuthService {
    */
   async logout(token: string): Promise<boolean> {
     try {
-      const session = await this.userRepository.findSessionByToken(this.hashToken(token));
+      const tokenHash = this.hashToken(token);
+      tokenCache.delete(tokenHash);
+
+      const session = await this.userRepository.findSessionByToken(tokenHash);
       if (session) {
         await this.userRepository.deleteSession(session.id);
         return true;
@@ -162,19 +249,20 @@ export class AuthService {
     }
 
     // Verify current password
-    const isPasswordValid = await bcrypt.compare(currentPassword, user.password_hash);
+    const isPasswordValid = await verifyPassword(currentPassword, user.password_hash);
     if (!isPasswordValid) {
       throw new Error('Current password is incorrect');
     }
 
     // Hash new password
-    const newPasswordHash = await bcrypt.hash(newPassword, BCRYPT_SALT_ROUNDS);
+    const newPasswordHash = await hashPassword(newPassword);
 
     // Update user
     await this.userRepository.update(userId, { password_hash: newPasswordHash });
 
     // Invalidate all sessions
     await this.userRepository.deleteUserSessions(userId);
+    this.evictUserTokens(userId);
 
     return true;
   }
@@ -224,7 +312,7 @@ export class AuthService {
     }
 
     // Hash new password
-    const newPasswordHash = await bcrypt.hash(newPassword, BCRYPT_SALT_ROUNDS);
+    const newPasswordHash = await hashPassword(newPassword);
 
     // Update user
     await this.userRepository.update(resetToken.user_id, { password_hash: newPasswordHash });
@@ -234,6 +322,7 @@ export class AuthService {
 
     // Invalidate all sessions
     await this.userRepository.deleteUserSessions(resetToken.user_id);
+    this.evictUserTokens(resetToken.user_id);
 
     return true;
   }
@@ -252,7 +341,8 @@ export class AuthService {
    * @returns JWT token
    */
   private generateToken(user: User): string {
-    return jwt.sign({ userId: user.id, role: user.role }, JWT_SECRET, {
+    return jwt.sign({ userId: user.id, role: user.role }, JWT_KEY, {
+      algorithm: 'HS256',
       expiresIn: JWT_EXPIRES_IN,
     });
   }
@@ -0,0 +1,92 @@
+import bcrypt from 'bcryptjs';
+import crypto from 'crypto';
+import { promisify } from 'util';
+
+const scrypt = promisify(crypto.scrypt) as (
+  password: crypto.BinaryLike,
+  salt: crypto.BinaryLike,
+  keylen: number,
+  options: crypto.ScryptOptions
+) => Promise<Buffer>;
+
+// scrypt cost parameters. Hashes record their own parameters, so these can be
+// raised later; older hashes are upgraded on the next successful login.
+const SCRYPT_PREFIX = 'scrypt';
+const SCRYPT_COST = 2 ** 15;
+const SCRYPT_BLOCK_SIZE = 8;
+const SCRYPT_PARALLELIZATION = 1;
+const SCRYPT_KEY_LENGTH = 64;
+const SCRYPT_SALT_LENGTH = 16;
+// 128 * N * r bytes are needed; leave headroom over the 32 MiB default limit
+const SCRYPT_MAX_MEMORY = 64 * 1024 * 1024;
+
+/**
+ * Hash a password with scrypt.
+ * Runs on the libuv thread pool, so hashing never blocks the event loop.
+ * @param password Plain-text password
+ * @returns Encoded hash: scrypt$N$r$p$salt$key (base64)
+ */
+export async function hashPassword(password: string): Promise<string> {
+  const salt = crypto.randomBytes(SCRYPT_SALT_LENGTH);
+  const key = await scrypt(password, salt, SCRYPT_KEY_LENGTH, {
+    N: SCRYPT_COST,
+    r: SCRYPT_BLOCK_SIZE,
+    p: SCRYPT_PARALLELIZATION,
+    maxmem: SCRYPT_MAX_MEMORY,
+  });
+
+  return [
+    SCRYPT_PREFIX,
+    SCRYPT_COST,
+    SCRYPT_BLOCK_SIZE,
+    SCRYPT_PARALLELIZATION,
+    salt.toString('base64'),
+    key.toString('base64'),
+  ].join('$');
+}
+
+/**
+ * Verify a password against a stored hash.
+ * Accepts scrypt hashes and legacy bcrypt hashes.
+ * @param password Plain-text password
+ * @param passwordHash Stored hash
+ */
+export async function verifyPassword(password: string, passwordHash: string): Promise<boolean> {
+  if (!passwordHash.startsWith(`${SCRYPT_PREFIX}$`)) {
+    return bcrypt.compare(password, passwordHash);
+  }
+
+  const [, cost, blockSize, parallelization, salt, key] = passwordHash.split('$');
+  if (!salt || !key) {
+    return false;
+  }
+
+  const expected = Buffer.from(key, 'base64');
+  let actual: Buffer;
+  try {
+    actual = await scrypt(password, Buffer.from(salt, 'base64'), expected.length, {
+      N: Number(cost),
+      r: Number(blockSize),
+      p: Number(parallelization),
+      maxmem: SCRYPT_MAX_MEMORY,
+    });
+  } catch {
+    // Malformed or out-of-range parameters in the stored hash
+    return false;
+  }
+
+  return crypto.timingSafeEqual(actual, expected);
+}
+
+/**
+ * Check whether a stored hash should be replaced with one using the current
+ * algorithm and parameters
+ * @param passwordHash Stored hash
+ */
+export function needsRehash(passwordHash: string): boolean {
+  const [prefix, cost, blockSize, parallelization] = passwordHash.split('$');
+  return prefix !== SCRYPT_PREFIX
+    || Number(cost) !== SCRYPT_COST
+    || Number(blockSize) !== SCRYPT_BLOCK_SIZE
+    || Number(parallelization) !== SCRYPT_PARALLELIZATION;
+}
@@ -1,16 +1,74 @@
 import { Pool } from 'pg';
 
-const pool = new Pool({
+// Keep one pool per process. Next.js can evaluate this module more than once
+// (dev hot reloads, separately bundled route handlers); stashing the pool on
+// globalThis stops each evaluation from opening its own set of connections.
+const globalForDb = globalThis as typeof globalThis & { __pgPool?: Pool };
+
+/**
+ * Read a positive integer setting from the environment
+ * @param name Environment variable name
+ * @param fallback Value used when the variable is unset or invalid
+ */
+function envInt(name: string, fallback: number): number {
+  const value = parseInt(process.env[name] || '', 10);
+  return value > 0 ? value : fallback;
+}
+
+// Size the pool so DB_POOL_MAX x process count covers peak concurrent queries
+// while staying under the server's max_connections
+const pool = globalForDb.__pgPool ?? new Pool({
   connectionString: process.env.DATABASE_URL,
   ssl: process.env.NODE_ENV === 'production' ? { rejectUnauthorized: false } : false,
+  max: envInt('DB_POOL_MAX', 20),
+  // Fail fast when the pool is saturated instead of queueing indefinitely
+  connectionTimeoutMillis: envInt('DB_POOL_CONNECTION_TIMEOUT_MS', 10000),
+  idleTimeoutMillis: envInt('DB_POOL_IDLE_TIMEOUT_MS', 30000),
+  // Recycle connections so they don't outlive load balancer / server-side limits
+  maxLifetimeSeconds: envInt('DB_POOL_MAX_LIFETIME_SECONDS', 1800),
+  keepAlive: true,
 });
 
+globalForDb.__pgPool = pool;
+
+/**
+ * Snapshot of pool usage; waiting > 0 means queries are queueing for a connection
+ */
+export function getPoolStats() {
+  return {
+    total: pool.totalCount,
+    idle: pool.idleCount,
+    waiting: pool.waitingCount,
+    max: pool.options.max
+  };
+}
+
+/**
+ * Open connections ahead of the first requests so they don't pay the
+ * TCP/TLS/auth handshake. Connections that fail to open are skipped.
+ * @param count Connections to open, capped at the pool size
+ * @returns Number of connections opened
+ */
+export async function warmPool(count: number = envInt('DB_POOL_WARM', 4)): Promise<number> {
+  const size = Math.min(count, pool.options.max ?? count);
+  const results = await Promise.allSettled(Array.from({ length: size }, () => pool.connect()));
+
+  let opened = 0;
+  for (const result of results) {
+    if (result.status === 'fulfilled') {
+      result.value.release();
+      opened++;
+    }
+  }
+  return opened;
+}
+
 // Test database connection
 export async function testConnection() {
   try {
-    const client = await pool.connect();
-    const result = await client.query('SELECT NOW()');
-    client.release();
+    // pool.query checks a client out and releases it even if the query fails,
+    // so a failing probe can't leak connections and starve other requests
+    const result = await pool.query('SELECT NOW()');
     return { success: true, timestamp: result.rows[0].now };
   } catch (error) {
     return { success: false, error: error instanceof Error ? error.message : 'Unknown error' };
@@ -63,6 +63,15 @@ describe('QueryBuilder', () => {
       expect(query.text).toBe('SELECT * FROM test_table ORDER BY name ASC');
     });
 
+    it('should build a query ordered by several columns', () => {
+      const query = queryBuilder
+        .select(['*'])
+        .orderBy(['event_datetime', 'id'], 'DESC')
+        .build();
+      
+      expect(query.text).toBe('SELECT * FROM test_table ORDER BY event_datetime DESC, id DESC');
+    });
+
     it('should build a query with LIMIT', () => {
       const query = queryBuilder
         .select(['*'])
@@ -160,45 +169,71 @@ describe('QueryBuilder', () => {
       expect(result).toBeNull();
     });
 
-    it('should execute paginated query', async () => {
-      const mockCountResult = {
-        rows: [{ count: '50' }],
-        rowCount: 1
-      };
-
+    it('should execute paginated query with a window count', async () => {
       const mockDataResult = {
         rows: [
-          { id: 1, name: 'Test 1' },
-          { id: 2, name: 'Test 2' }
+          { id: 1, name: 'Test 1', __total: '50' },
+          { id: 2, name: 'Test 2', __total: '50' }
         ],
         rowCount: 2
       };
 
-      mockPool.query
-        .mockResolvedValueOnce(mockCountResult)
-        .mockResolvedValueOnce(mockDataResult);
+      mockPool.query.mockResolvedValueOnce(mockDataResult);
 
       const result = await queryBuilder
         .select(['*'])
         .executePaginated(2, 10);
 
       expect(result).toEqual({
-        data: mockDataResult.rows,
+        data: [
+          { id: 1, name: 'Test 1' },
+          { id: 2, name: 'Test 2' }
+        ],
         total: 50,
         page: 2,
         limit: 10,
         total_pages: 5
       });
 
-      // Should execute count query first
-      expect(mockPool.query).toHaveBeenNthCalledWith(1,
-        'SELECT COUNT(*) as count FROM test_table',
+      // Page and total come back in a single query
+      expect(mockPool.query).toHaveBeenCalledTimes(1);
+      expect(mockPool.query).toHaveBeenCalledWith(
+        'SELECT *, COUNT(*) OVER() AS __total FROM test_table LIMIT 10 OFFSET 10',
         []
       );
+    });
 
-      // Then execute data query with pagination
+    it('should count separately when the page is past the end', async () => {
+      mockPool.query
+        .mockResolvedValueOnce({ rows: [], rowCount: 0 })
+        .mockResolvedValueOnce({ rows: [{ total: '5' }], rowCount: 1 });
+
+      const result = await queryBuilder.executePaginated(3, 10);
+
+      expect(result.data).toEqual([]);
+      expect(result.total).toBe(5);
       expect(mockPool.query).toHaveBeenNthCalledWith(2,
-        'SELECT * FROM test_table LIMIT 10 OFFSET 10',
+        expect.objectContaining({ text: 'SELECT COUNT(*) AS total FROM test_table' })
+      );
+    });
+
+    it('should detect a next page without counting', async () => {
+      mockPool.query.mockResolvedValue({
+        rows: [{ id: 1 }, { id: 2 }, { id: 3 }],
+        rowCount: 3
+      });
+
+      const result = await queryBuilder.executeLitePaginated(2, 2);
+
+      expect(result).toEqual({
+        data: [{ id: 1 }, { id: 2 }],
+        page: 2,
+        limit: 2,
+        has_next: true,
+        has_prev: true
+      });
+      expect(mockPool.query).toHaveBeenCalledWith(
+        'SELECT * FROM test_table LIMIT 3 OFFSET 2',
         []
       );
     });
@@ -306,6 +341,17 @@ describe('QueryBuilder', () => {
       expect(query.values).toContain('rock');
     });
 
+    it('should filter events by genre through artist_genres', () => {
+      const query = new QueryBuilder('events', mockPool as any)
+        .setGenreFilter('rock')
+        .buildQuery();
+
+      expect(query.text).toContain('EXISTS (SELECT 1 FROM event_artists ea_g');
+      expect(query.text).toContain('g.name = $1');
+      expect(query.text).not.toContain('DISTINCT');
+      expect(query.values).toEqual(['rock']);
+    });
+
     it('should not apply genre filter when not set', () => {
       const query = queryBuilder
         .select(['*'])
@@ -1,6 +1,7 @@
 import { Pool, QueryResult, QueryResultRow } from 'pg';
 import pool from '../db';
-import { QueryParams, PaginatedResult } from '../models/types';
+import { QueryParams, PaginatedResult, LitePaginatedResult } from '../models/types';
+import { buildPaginatedResult } from '../utils/pagination';
 
 /**
  * Database query builder utility class
@@ -75,6 +76,24 @@ export class QueryBuilder {
     return this;
   }
 
+  /**
+   * Add a keyset (seek) condition selecting rows after a position in ascending order
+   * @param columns Ordered key columns, e.g. ['events.event_datetime', 'events.id']
+   * @param values Key values of the last row already returned
+   */
+  whereAfter(columns: string[], values: unknown[]): QueryBuilder {
+    const start = this.nextParamIndex();
+    const placeholders = values.map((_, i) => `$${start + i}`);
+    return this.where(`(${columns.join(', ')}) > (${placeholders.join(', ')})`, ...values);
+  }
+
+  /**
+   * Get the placeholder number the next WHERE parameter will bind to
+   */
+  nextParamIndex(): number {
+    return this.whereParams.length + 1;
+  }
+
   /**
    * Add a JOIN clause
    * @param joinClause Complete join clause (e.g., "LEFT JOIN users ON users.id = posts.user_id")
@@ -86,11 +105,12 @@ export class QueryBuilder {
 
   /**
    * Set the ORDER BY clause
-   * @param column Column name or expression
-   * @param direction Sort direction ('ASC' or 'DESC')
+   * @param column Column name or expression, or several to sort by in turn
+   * @param direction Sort direction ('ASC' or 'DESC'), applied to every column
    */
-  orderBy(column: string, direction: 'ASC' | 'DESC' = 'ASC'): QueryBuilder {
-    this.orderByClause = `${column} ${direction}`;
+  orderBy(column: string | string[], direction: 'ASC' | 'DESC' = 'ASC'): QueryBuilder {
+    const columns = Array.isArray(column) ? column : [column];
+    this.orderByClause = columns.map(col => `${col} ${direction}`).join(', ');
     return this;
   }
 
@@ -222,51 +242,37 @@ export class QueryBuilder {
     }
     
     // Add genre filtering if applicable
-    // This is handled differently depending on the table
+    // Genres are matched through the normalized artist_genres table (B-tree
+    // indexed on genre_id, artist_id). EXISTS keeps one row per entity, so
+    // no joins or DISTINCT are needed.
     if (this.genreFilter) {
-      // For artists table, filter directly by genres array
+      const paramIndex = this.whereParams.length + 1;
+      const artistHasGenre = `SELECT 1 FROM artist_genres ag JOIN genres g ON g.id = ag.genre_id
+        WHERE g.name = $${paramIndex}`;
+      let genreCondition: string | null = null;
+
       if (this.table === 'artists') {
-        const paramIndex = this.whereParams.length + 1;
-        const genreCondition = `${paramIndex} = ANY(genres)`;
-        query += hasWhereConditions ? ` AND ${genreCondition}` : ` WHERE ${genreCondition}`;
-        this.whereParams.push(this.genreFilter);
-        
-        // Add index hint for genre filtering
-        if (!this.indexHints.some(hint => hint.includes('genres_idx'))) {
-          query = query.replace(`FROM ${this.table}`, `FROM ${this.table} INDEXED BY genres_idx`);
-        }
+        genreCondition = `EXISTS (${artistHasGenre} AND ag.artist_id = artists.id)`;
       }
-      // For events table, join with artists and filter by their genres
+      // For events, match any performing artist
       else if (this.table === 'events') {
-        // Only add the join if it's not already present
-        if (!this.joinClauses.some(join => join.includes('event_artists'))) {
-          query += ` LEFT JOIN event_artists ON ${this.table}.id = event_artists.event_id`;
-          query += ` LEFT JOIN artists ON event_artists.artist_id = artists.id`;
-        }
-        
-        const paramIndex = this.whereParams.length + 1;
-        const genreCondition = `${paramIndex} = ANY(artists.genres)`;
-        query += hasWhereConditions ? ` AND ${genreCondition}` : ` WHERE ${genreCondition}`;
-        this.whereParams.push(this.genreFilter);
+        genreCondition = `EXISTS (SELECT 1 FROM event_artists ea_g
+          JOIN artist_genres ag ON ag.artist_id = ea_g.artist_id
+          JOIN genres g ON g.id = ag.genre_id
+          WHERE ea_g.event_id = events.id AND g.name = $${paramIndex})`;
       }
-      // For venues table, join with events and artists to filter by genre
+      // For venues, match any artist performing at the venue
       else if (this.table === 'venues') {
-        // Only add the joins if they're not already present
-        if (!this.joinClauses.some(join => join.includes('events'))) {
-          query += ` LEFT JOIN events ON ${this.table}.id = events.venue_id`;
-          query += ` LEFT JOIN event_artists ON events.id = event_artists.event_id`;
-          query += ` LEFT JOIN artists ON event_artists.artist_id = artists.id`;
-        }
-        
-        const paramIndex = this.whereParams.length + 1;
-        const genreCondition = `${paramIndex} = ANY(artists.genres)`;
+        genreCondition = `EXISTS (SELECT 1 FROM events e_g
+          JOIN event_artists ea_g ON ea_g.event_id = e_g.id
+          JOIN artist_genres ag ON ag.artist_id = ea_g.artist_id
+          JOIN genres g ON g.id = ag.genre_id
+          WHERE e_g.venue_id = venues.id AND g.name = $${paramIndex})`;
+      }
+
+      if (genreCondition) {
         query += hasWhereConditions ? ` AND ${genreCondition}` : ` WHERE ${genreCondition}`;
         this.whereParams.push(this.genreFilter);
-        
-        // Add DISTINCT to avoid duplicate venues
-        if (!this.selectColumns.some(col => col.includes('DISTINCT'))) {
-          query = query.replace('SELECT ', 'SELECT DISTINCT ');
-        }
       }
     }
 
@@ -337,6 +343,91 @@ export class QueryBuilder {
    * Execute the query and return paginated results
    */
   async executePaginated<T>(page: number = 1, limit: number = 20): Promise<PaginatedResult<T>> {
+    // DISTINCT is applied after window functions, so a windowed count
+    // would include duplicates; count separately instead
+    const usesDistinct = this.selectColumns.some(col => col.includes('DISTINCT'));
+
+    if (usesDistinct) {
+      const total = await this.countTotal();
+      this.paginate(page, limit);
+      const data = await this.execute<T>();
+      return buildPaginatedResult(data, total, page, limit);
+    }
+
+    // Fetch the page and the total in one round trip with a window count
+    const countBuilder = this.clone();
+    this.selectColumns = [...this.selectColumns, 'COUNT(*) OVER() AS __total'];
+    this.paginate(page, limit);
+
+    const rows = await this.execute<T & { __total: string }>();
+
+    // An empty page past the end carries no count; fall back to counting
+    const total = rows.length > 0
+      ? parseInt(rows[0].__total, 10)
+      : page > 1 ? await countBuilder.countTotal() : 0;
+
+    const data = rows.map(({ __total, ...row }) => row as T);
+
+    return buildPaginatedResult(data, total, page, limit);
+  }
+
+  /**
+   * Execute the query as an offset page without counting the total: fetch one
+   * row past the limit to tell whether a next page exists
+   * @param page Page number (1-based)
+   * @param limit Items per page
+   */
+  async executeLitePaginated<T>(page: number = 1, limit: number = 20): Promise<LitePaginatedResult<T>> {
+    this.paginate(page, limit);
+    this.limit(limit + 1);
+
+    const rows = await this.execute<T>();
+    const hasNext = rows.length > limit;
+
+    return {
+      data: hasNext ? rows.slice(0, limit) : rows,
+      page,
+      limit,
+      has_next: hasNext,
+      has_prev: page > 1
+    };
+  }
+
+  /**
+   * Execute a keyset-paginated query: fetch one row past the limit to detect
+   * whether another page exists, without OFFSET or a count
+   * @param limit Items per page
+   */
+  async executeKeyset<T>(limit: number): Promise<{ data: T[]; hasMore: boolean }> {
+    this.limit(limit + 1);
+    this.offsetValue = null;
+
+    const rows = await this.execute<T>();
+    const hasMore = rows.length > limit;
+
+    return { data: hasMore ? rows.slice(0, limit) : rows, hasMore };
+  }
+
+  /**
+   * Copy the query state so the copy can be executed independently
+   */
+  private clone(): QueryBuilder {
+    const copy = new QueryBuilder(this.table, this.pool);
+    copy.selectColumns = [...this.selectColumns];
+    copy.whereConditions = [...this.whereConditions];
+    copy.whereParams = [...this.whereParams];
+    copy.joinClauses = [...this.joinClauses];
+    copy.orderByClause = this.orderByClause;
+    copy.groupByClause = this.groupByClause;
+    copy.genreFilter = this.genreFilter;
+    copy.indexHints = [...this.indexHints];
+    return copy;
+  }
+
+  /**
+   * Count all rows matching the current filters
+   */
+  private async countTotal(): Promise<number> {
     // Optimize count query by using simpler query when possible
     let total = 0;
     
@@ -364,19 +455,7 @@ export class QueryBuilder {
       total = countResult.length > 0 ? parseInt(countResult[0].total, 10) : 0;
     }
 
-    // Apply pagination to the original query
-    this.paginate(page, limit);
-
-    // Execute the paginated query
-    const data = await this.execute<T>();
-
-    return {
-      data,
-      total,
-      page,
-      limit,
-      total_pages: Math.ceil(total / limit),
-    };
+    return total;
   }
 
   /**
@@ -386,7 +465,7 @@ export class QueryBuilder {
   async insert<T>(data: Record<string, unknown>): Promise<T> {
     const columns = Object.keys(data);
     const values = Object.values(data);
-    const placeholders = values.map((_, i) => `${i + 1}`);
+    const placeholders = values.map((_, i) => `$${i + 1}`);
 
     const query = {
       text: `INSERT INTO ${this.table} (${columns.join(', ')}) VALUES (${placeholders.join(', ')}) RETURNING *`,
@@ -406,6 +485,17 @@ export class QueryBuilder {
       return [];
     }
     
+    const result = await this.pool.query(QueryBuilder.buildBulkInsert(this.table, dataArray));
+    return result.rows as T[];
+  }
+
+  /**
+   * Build a multi-row INSERT ... RETURNING * statement, so callers holding a
+   * transaction client can run it themselves
+   * @param table Table to insert into
+   * @param dataArray Array of objects with column values; columns come from the first
+   */
+  static buildBulkInsert(table: string, dataArray: Record<string, unknown>[]): { text: string; values: unknown[] } {
     // Get columns from the first object
     const columns = Object.keys(dataArray[0]);
     
@@ -424,27 +514,25 @@ export class QueryBuilder {
       valueSets.push(`(${rowPlaceholders.join(', ')})`);
     });
     
-    const query = {
-      text: `INSERT INTO ${this.table} (${columns.join(', ')}) VALUES ${valueSets.join(', ')} RETURNING *`,
+    return {
+      text: `INSERT INTO ${table} (${columns.join(', ')}) VALUES ${valueSets.join(', ')} RETURNING *`,
       values: allValues,
     };
-    
-    const result = await this.pool.query(query);
-    return result.rows as T[];
   }
 
   /**
-   * Update an existing record
+   * Update an existing record in a single statement, returning the updated row
    * @param id Record ID
    * @param data Object with column values to update
+   * @returns The updated row, or null if no row has the ID
    */
   async update<T>(id: number, data: Record<string, unknown>): Promise<T | null> {
     const columns = Object.keys(data);
     const values = Object.values(data);
-    const setClause = columns.map((col, i) => `${col} = ${i + 1}`).join(', ');
+    const setClause = columns.map((col, i) => `${col} = $${i + 1}`).join(', ');
 
     const query = {
-      text: `UPDATE ${this.table} SET ${setClause} WHERE id = ${values.length + 1} RETURNING *`,
+      text: `UPDATE ${this.table} SET ${setClause} WHERE id = $${values.length + 1} RETURNING *`,
       values: [...values, id],
     };
 
@@ -470,8 +558,14 @@ export class QueryBuilder {
    * Execute a raw SQL query
    * @param text SQL query text
    * @param values Query parameters
+   * @param name Optional prepared statement name; each connection parses and plans
+   *             a named statement once and reuses it on later executions.
+   *             The same name must always be used with the same text.
    */
-  static async raw<T extends QueryResultRow>(text: string, values: unknown[] = []): Promise<QueryResult<T>> {
+  static async raw<T extends QueryResultRow>(text: string, values: unknown[] = [], name?: string): Promise<QueryResult<T>> {
+    if (name) {
+      return await pool.query<T>({ name, text, values });
+    }
     return await pool.query(text, values);
   }
   
@@ -98,9 +98,9 @@ describe('IngestionService', () => {
     } as any;
 
     mockEventRepository = {
-      findAll: vi.fn(),
+      exists: vi.fn(),
       create: vi.fn(),
-      addArtistToEvent: vi.fn(),
+      addArtistsToEvent: vi.fn(),
     } as any;
 
     // Mock constructors
@@ -147,9 +147,9 @@ describe('IngestionService', () => {
       mockArtistRepository.findAll.mockResolvedValue([]);
       mockArtistRepository.create.mockResolvedValue({ id: 1, name: 'Test Artist' } as any);
 
-      mockEventRepository.findAll.mockResolvedValue([]);
+      mockEventRepository.exists.mockResolvedValue(false);
       mockEventRepository.create.mockResolvedValue({ id: 1, title: 'Test Concert' } as any);
-      mockEventRepository.addArtistToEvent.mockResolvedValue();
+      mockEventRepository.addArtistsToEvent.mockResolvedValue();
 
       const result = await ingestionService.ingestEventsByLocation({
         location: 'Seattle, WA',
@@ -196,9 +196,9 @@ describe('IngestionService', () => {
       mockVenueRepository.create.mockResolvedValue({ id: 1, name: 'Test Venue' } as any);
       mockArtistRepository.findAll.mockResolvedValue([]);
       mockArtistRepository.create.mockResolvedValue({ id: 1, name: 'Test Artist' } as any);
-      mockEventRepository.findAll.mockResolvedValue([]);
+      mockEventRepository.exists.mockResolvedValue(false);
       mockEventRepository.create.mockResolvedValue({ id: 1, title: 'Test Concert' } as any);
-      mockEventRepository.addArtistToEvent.mockResolvedValue();
+      mockEventRepository.addArtistsToEvent.mockResolvedValue();
 
       const result = await ingestionService.ingestEventsByLocation({
         location: 'Seattle, WA',
@@ -236,9 +236,9 @@ describe('IngestionService', () => {
       mockVenueRepository.create.mockResolvedValue({ id: 1, name: 'Test Venue' } as any);
       mockArtistRepository.findAll.mockResolvedValue([]);
       mockArtistRepository.create.mockResolvedValue({ id: 1, name: 'Test Artist' } as any);
-      mockEventRepository.findAll.mockResolvedValue([]);
+      mockEventRepository.exists.mockResolvedValue(false);
       mockEventRepository.create.mockResolvedValue({ id: 1, title: 'Test Concert' } as any);
-      mockEventRepository.addArtistToEvent.mockResolvedValue();
+      mockEventRepository.addArtistsToEvent.mockResolvedValue();
 
       const result = await ingestionService.ingestEventsByLocation({
         location: 'Seattle, WA',
@@ -302,9 +302,9 @@ describe('IngestionService', () => {
       mockCityRepository.findAll.mockResolvedValue([{ id: 1, name: 'Seattle' } as any]);
       mockVenueRepository.findAll.mockResolvedValue([{ id: 1, name: 'Test Venue' } as any]);
       mockArtistRepository.findAll.mockResolvedValue([{ id: 1, name: 'Test Artist' } as any]);
-      mockEventRepository.findAll.mockResolvedValue([]);
+      mockEventRepository.exists.mockResolvedValue(false);
       mockEventRepository.create.mockResolvedValue({ id: 1, title: 'Test Concert' } as any);
-      mockEventRepository.addArtistToEvent.mockResolvedValue();
+      mockEventRepository.addArtistsToEvent.mockResolvedValue();
 
       const result = await ingestionService.ingestEventsByLocation({
         location: 'Seattle, WA',
@@ -346,9 +346,9 @@ describe('IngestionService', () => {
       mockVenueRepository.create.mockResolvedValue({ id: 1, name: 'Test Venue' } as any);
       mockArtistRepository.findAll.mockResolvedValue([]);
       mockArtistRepository.create.mockResolvedValue({ id: 1, name: 'Test Artist' } as any);
-      mockEventRepository.findAll.mockResolvedValue([]);
+      mockEventRepository.exists.mockResolvedValue(false);
       mockEventRepository.create.mockResolvedValue({ id: 1, title: 'Test Concert' } as any);
-      mockEventRepository.addArtistToEvent.mockResolvedValue();
+      mockEventRepository.addArtistsToEvent.mockResolvedValue();
 
       const result = await ingestionService.ingestEventsByArtist('Test Artist');
 
@@ -355,11 +355,11 @@ export class IngestionService {
       const eventData = eventTransform.data!;
       
       // Check if event already exists
-      const existingEvents = await this.eventRepository.findAll({
+      const eventExists = await this.eventRepository.exists({
         external_id: eventData.external_id,
       });
 
-      if (existingEvents.length > 0) {
+      if (eventExists) {
         return { success: true, errors: [] };
       }
 
@@ -367,9 +367,7 @@ export class IngestionService {
       const newEvent = await this.eventRepository.create(eventData);
       
       // Associate artists with event
-      for (const artistId of artistIds) {
-        await this.eventRepository.addArtistToEvent(newEvent.id, artistId);
-      }
+      await this.eventRepository.addArtistsToEvent(newEvent.id, artistIds);
 
       return { success: true, errors: [] };
 
@@ -58,6 +58,21 @@ export interface Event extends BaseEntity {
   external_id: string | null;
   venue?: Venue; // Optional joined venue data
   artists?: Artist[]; // Optional joined artists data
+  status?: EventStatus; // Optional status relative to now, computed in SQL
+}
+
+// Event timing relative to the current time
+export type EventStatus = 'upcoming' | 'today' | 'ongoing' | 'past';
+
+// Event full-text search result with its venue/city columns and relevance
+export interface EventSearchHit extends Event {
+  venue_name: string | null;
+  venue_address: string | null;
+  city_name: string | null;
+  state_province: string | null;
+  country: string | null;
+  artists: Pick<Artist, 'id' | 'name' | 'genres'>[];
+  rank: number;
 }
 
 // Media model interface
@@ -116,6 +131,34 @@ export interface PaginatedResult<T> {
   total_pages: number;
 }
 
+// Keyset pagination result: no total count, a cursor for the next page
+export interface CursorPaginatedResult<T> {
+  data: T[];
+  limit: number;
+  next_cursor: string | null;
+}
+
+// Offset pagination result without a total count: next/previous page flags only
+export interface LitePaginatedResult<T> {
+  data: T[];
+  page: number;
+  limit: number;
+  has_next: boolean;
+  has_prev: boolean;
+}
+
+// Position of the last event already returned in event_datetime order
+export interface EventCursor {
+  event_datetime: Date;
+  id: number;
+}
+
+// Position of the last venue already returned in name order
+export interface VenueCursor {
+  name: string;
+  id: number;
+}
+
 // Geographic search parameters
 export interface GeoSearchParams extends QueryParams {
   lat: number;
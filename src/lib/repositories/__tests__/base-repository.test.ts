@@ -0,0 +1,65 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import pool from '../../db';
+import { BaseRepository } from '../base-repository';
+
+// Mock the database pool
+vi.mock('../../db', () => ({
+  default: {
+    connect: vi.fn(),
+    query: vi.fn()
+  }
+}));
+
+class TestRepository extends BaseRepository<any> {
+  constructor() {
+    super('test_table');
+  }
+}
+
+describe('BaseRepository', () => {
+  let repository: TestRepository;
+  let client: { query: any; release: any };
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    repository = new TestRepository();
+    client = {
+      query: vi.fn().mockResolvedValue({ rows: [{ id: 1 }] }),
+      release: vi.fn()
+    };
+    (pool.connect as any).mockResolvedValue(client);
+  });
+
+  describe('createMany', () => {
+    it('should insert every batch in one transaction', async () => {
+      const rows = Array.from({ length: 1500 }, (_, i) => ({ name: `Row ${i}` }));
+
+      await repository.createMany(rows);
+
+      const statements = client.query.mock.calls.map(([query]: any[]) =>
+        typeof query === 'string' ? query : query.text.slice(0, 6)
+      );
+      expect(statements).toEqual(['BEGIN', 'INSERT', 'INSERT', 'COMMIT']);
+      expect(client.query.mock.calls[1][0].values).toHaveLength(1000);
+      expect(client.release).toHaveBeenCalledTimes(1);
+    });
+
+    it('should roll back every batch when one fails', async () => {
+      client.query
+        .mockResolvedValueOnce({ rows: [] })
+        .mockResolvedValueOnce({ rows: [{ id: 1 }] })
+        .mockRejectedValueOnce(new Error('insert failed'));
+
+      const rows = Array.from({ length: 1500 }, (_, i) => ({ name: `Row ${i}` }));
+
+      await expect(repository.createMany(rows)).rejects.toThrow('insert failed');
+      expect(client.query).toHaveBeenLastCalledWith('ROLLBACK');
+      expect(client.release).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not open a transaction for no rows', async () => {
+      expect(await repository.createMany([])).toEqual([]);
+      expect(pool.connect).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -0,0 +1,120 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { CityRepository } from '../city-repository';
+import { VenueRepository } from '../venue-repository';
+import { QueryBuilder } from '../../db/query-builder';
+
+const execute = vi.fn();
+
+// Mock the QueryBuilder
+vi.mock('../../db/query-builder', () => {
+  const QueryBuilder: any = vi.fn().mockImplementation(() => {
+    const builder: any = {
+      select: vi.fn().mockReturnThis(),
+      where: vi.fn().mockReturnThis(),
+      orderBy: vi.fn().mockReturnThis(),
+      execute: (...args: unknown[]) => execute(...args),
+      insert: vi.fn().mockResolvedValue({ id: 1 }),
+      update: vi.fn().mockResolvedValue({ id: 1 }),
+      delete: vi.fn().mockResolvedValue(true)
+    };
+    return builder;
+  });
+  QueryBuilder.raw = vi.fn();
+  QueryBuilder.buildBulkInsert = vi.fn().mockReturnValue({ text: 'INSERT', values: [] });
+  return { QueryBuilder };
+});
+
+// Mock the database pool; transactions get a client that accepts every query
+vi.mock('../../db', () => ({
+  default: {
+    connect: vi.fn().mockResolvedValue({
+      query: vi.fn().mockResolvedValue({ rows: [] }),
+      release: vi.fn()
+    }),
+    query: vi.fn()
+  }
+}));
+
+describe('CityRepository', () => {
+  let cityRepository: CityRepository;
+
+  const seattle = { id: 1, name: 'Seattle', state_province: 'WA', country: 'US', venue_count: 15 };
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    CityRepository.clearVenueCountsCache();
+    CityRepository.clearRegionsCache();
+    cityRepository = new CityRepository();
+  });
+
+  describe('findByStateProvinceWithVenueCounts', () => {
+    it('should serve repeat lookups from the cache', async () => {
+      execute.mockResolvedValue([seattle]);
+
+      const first = await cityRepository.findByStateProvinceWithVenueCounts('WA');
+      const second = await cityRepository.findByStateProvinceWithVenueCounts('WA');
+
+      expect(execute).toHaveBeenCalledTimes(1);
+      expect(second).toBe(first);
+    });
+
+    it('should not cache unknown regions', async () => {
+      execute.mockResolvedValue([]);
+
+      await cityRepository.findByStateProvinceWithVenueCounts('XX');
+      await cityRepository.findByStateProvinceWithVenueCounts('XX');
+
+      expect(execute).toHaveBeenCalledTimes(2);
+    });
+
+    it('should drop cached counts when a venue is created', async () => {
+      execute.mockResolvedValue([seattle]);
+
+      await cityRepository.findByStateProvinceWithVenueCounts('WA');
+      await new VenueRepository().create({ name: 'New Venue', city_id: 1 });
+      await cityRepository.findByStateProvinceWithVenueCounts('WA');
+
+      expect(execute).toHaveBeenCalledTimes(2);
+    });
+
+    it('should drop cached counts when cities are created in bulk', async () => {
+      execute.mockResolvedValue([seattle]);
+
+      await cityRepository.findByStateProvinceWithVenueCounts('WA');
+      await cityRepository.createMany([{ name: 'Tacoma', state_province: 'WA', country: 'US' }]);
+      await cityRepository.findByStateProvinceWithVenueCounts('WA');
+
+      expect(execute).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('getRegions', () => {
+    const regions = [{ country: 'US', regions: ['OR', 'WA'] }];
+
+    beforeEach(() => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: regions });
+    });
+
+    it('should serve repeat lookups from the cache', async () => {
+      const first = await cityRepository.getRegions();
+      const second = await cityRepository.getRegions();
+
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(1);
+      expect(QueryBuilder.raw).toHaveBeenCalledWith(expect.any(String), [], 'cities_regions');
+      expect(second).toBe(first);
+    });
+
+    it.each([
+      ['create', (repository: CityRepository) => repository.create({ name: 'Tacoma', state_province: 'WA', country: 'US' })],
+      ['createMany', (repository: CityRepository) => repository.createMany([{ name: 'Tacoma', state_province: 'WA', country: 'US' }])],
+      ['update', (repository: CityRepository) => repository.update(1, { name: 'Seattle' })],
+      ['delete', (repository: CityRepository) => repository.delete(1)]
+    ])('should reload regions after a city %s', async (_, write) => {
+      await cityRepository.getRegions();
+      await write(cityRepository);
+      await cityRepository.getRegions();
+
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -0,0 +1,129 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { EventRepository } from '../event-repository';
+import { QueryBuilder } from '../../db/query-builder';
+
+// Mock the QueryBuilder
+vi.mock('../../db/query-builder', () => {
+  const QueryBuilder: any = vi.fn().mockImplementation(() => ({
+    update: vi.fn().mockResolvedValue(null),
+    delete: vi.fn().mockResolvedValue(true)
+  }));
+  QueryBuilder.raw = vi.fn();
+  return { QueryBuilder };
+});
+
+// Mock the database pool
+vi.mock('../../db', () => ({
+  default: {
+    connect: vi.fn(),
+    query: vi.fn()
+  }
+}));
+
+describe('EventRepository', () => {
+  let eventRepository: EventRepository;
+
+  const mockRow = {
+    id: 1,
+    venue_id: 10,
+    title: 'Test Concert',
+    event_datetime: new Date('2025-12-25T20:00:00Z'),
+    venue_name: 'Test Venue',
+    city_name: 'Seattle',
+    artists: [{ id: 5, name: 'Test Artist' }]
+  };
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    EventRepository.clearDetailsCache();
+    eventRepository = new EventRepository();
+  });
+
+  describe('search', () => {
+    it('should match title/description and artist names in separate index-backed branches', async () => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: [{ ...mockRow, rank: 0.5, __total: '1' }] });
+
+      const result = await eventRepository.search('indie rock', { city_id: 2, page: 1, limit: 10 });
+
+      const [sql, values] = (QueryBuilder.raw as any).mock.calls[0];
+      expect(sql).toContain("event_search_document(e.title, e.description) @@ plainto_tsquery('english', $1)");
+      expect(sql).toContain("to_tsvector('english', coalesce(a.name, '')) @@ plainto_tsquery('english', $1)");
+      expect(sql).toContain('UNION');
+      expect(sql).not.toMatch(/OR\s+EXISTS/);
+      expect(values).toEqual(['indie rock', 2, 10, 0]);
+      expect(result.data[0]).not.toHaveProperty('__total');
+      expect(result.total).toBe(1);
+    });
+
+    it('should return performing artists and rank artist name matches', async () => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: [] });
+
+      await eventRepository.search('indie rock');
+
+      const [sql] = (QueryBuilder.raw as any).mock.calls[0];
+      expect(sql).toContain("COALESCE(performers.artists, '[]'::json) AS artists");
+      expect(sql).toMatch(/\+ COALESCE\(performers\.rank, 0\) AS rank/);
+      expect(sql).toContain('ORDER BY rank DESC, e.event_datetime ASC, e.id ASC');
+    });
+
+    it('should sort by a supported field before relevance', async () => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: [] });
+
+      await eventRepository.search('jazz', { sort_by: 'event_datetime', sort_dir: 'asc' });
+      await eventRepository.search('jazz', { sort_by: 'venues; DROP TABLE events' });
+
+      expect((QueryBuilder.raw as any).mock.calls[0][0]).toContain(
+        'ORDER BY e.event_datetime ASC, rank DESC, e.event_datetime ASC, e.id ASC'
+      );
+      expect((QueryBuilder.raw as any).mock.calls[1][0]).toContain(
+        'ORDER BY rank DESC, e.event_datetime ASC, e.id ASC'
+      );
+    });
+
+    it('should count separately when the page is past the end', async () => {
+      (QueryBuilder.raw as any)
+        .mockResolvedValueOnce({ rows: [] })
+        .mockResolvedValueOnce({ rows: [{ total: '3' }] });
+
+      const result = await eventRepository.search('jazz', { page: 5, limit: 10 });
+
+      expect(QueryBuilder.raw).toHaveBeenNthCalledWith(2, expect.stringContaining('SELECT COUNT(*) AS total'), ['jazz']);
+      expect(result.data).toEqual([]);
+      expect(result.total).toBe(3);
+    });
+  });
+
+  describe('findByIdWithDetails', () => {
+    it('should serve repeat lookups from the cache', async () => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: [mockRow] });
+
+      const first = await eventRepository.findByIdWithDetails(1);
+      const second = await eventRepository.findByIdWithDetails(1);
+
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(1);
+      expect(QueryBuilder.raw).toHaveBeenCalledWith(expect.any(String), [1], 'events_find_by_id_with_details');
+      expect(second).toBe(first);
+      expect(first?.venue?.name).toBe('Test Venue');
+    });
+
+    it('should not cache missing events', async () => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: [] });
+
+      expect(await eventRepository.findByIdWithDetails(1)).toBeNull();
+      expect(await eventRepository.findByIdWithDetails(1)).toBeNull();
+
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(2);
+    });
+
+    it('should reload details after the event artists change', async () => {
+      (QueryBuilder.raw as any).mockResolvedValue({ rows: [mockRow] });
+
+      await eventRepository.findByIdWithDetails(1);
+      await eventRepository.addArtistToEvent(1, 6);
+      await eventRepository.findByIdWithDetails(1);
+
+      // Initial load, the insert, then a fresh load
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(3);
+    });
+  });
+});
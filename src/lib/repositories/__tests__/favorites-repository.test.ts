@@ -21,16 +21,16 @@ describe('FavoritesRepository', () => {
         created_at: new Date(),
       };
       
-      // Mock the insert method
-      (QueryBuilder.prototype.insert as jest.Mock).mockResolvedValue(mockFavorite);
+      // Mock the raw method
+      (QueryBuilder.raw as jest.Mock).mockResolvedValue({ rows: [mockFavorite] });
       
       const result = await favoritesRepository.addFavorite(1, 'venue', 2);
       
-      expect(QueryBuilder.prototype.insert).toHaveBeenCalledWith({
-        user_id: 1,
-        entity_type: 'venue',
-        entity_id: 2,
-      });
+      expect(QueryBuilder.raw).toHaveBeenCalledWith(
+        expect.stringContaining('ON CONFLICT (user_id, entity_type, entity_id) DO NOTHING'),
+        [1, 'venue', 2],
+        'favorites_add'
+      );
       expect(result).toEqual(mockFavorite);
     });
     
@@ -42,10 +42,8 @@ describe('FavoritesRepository', () => {
         created_at: new Date(),
       };
       
-      // Mock the insert method to throw a duplicate key error
-      const error = new Error('Duplicate key');
-      (error as any).code = '23505';
-      (QueryBuilder.prototype.insert as jest.Mock).mockRejectedValue(error);
+      // A conflicting insert returns no rows
+      (QueryBuilder.raw as jest.Mock).mockResolvedValue({ rows: [] });
       
       // Mock the getFavorite method
       (favoritesRepository.getFavorite as jest.Mock) = jest.fn().mockResolvedValue(mockFavorite);
@@ -66,7 +64,8 @@ describe('FavoritesRepository', () => {
       
       expect(QueryBuilder.raw).toHaveBeenCalledWith(
         'DELETE FROM user_favorites WHERE user_id = $1 AND entity_type = $2 AND entity_id = $3',
-        [1, 'venue', 2]
+        [1, 'venue', 2],
+        'favorites_remove'
       );
       expect(result).toBe(true);
     });
@@ -161,20 +160,29 @@ describe('FavoritesRepository', () => {
         total_pages: 1,
       };
       
-      // Mock the raw method for count query
-      (QueryBuilder.raw as jest.Mock).mockImplementation((query) => {
-        if (query.includes('COUNT(*)')) {
-          return Promise.resolve({ rows: [{ total: '2' }] });
-        } else {
-          return Promise.resolve({ rows: mockVenues.data });
-        }
+      // Rows carry the window count alongside the entity columns
+      (QueryBuilder.raw as jest.Mock).mockResolvedValue({
+        rows: mockVenues.data.map(row => ({ ...row, __total: '2' }))
       });
       
       const result = await favoritesRepository.getUserFavoriteVenues(1);
       
-      expect(QueryBuilder.raw).toHaveBeenCalledTimes(2);
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(1);
       expect(result).toEqual(mockVenues);
     });
+
+    it('should count separately when the page is past the end', async () => {
+      (QueryBuilder.raw as jest.Mock)
+        .mockResolvedValueOnce({ rows: [] })
+        .mockResolvedValueOnce({ rows: [{ total: '2' }] });
+
+      const result = await favoritesRepository.getUserFavoriteVenues(1, 5, 20);
+
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(2);
+      expect(QueryBuilder.raw).toHaveBeenLastCalledWith(expect.any(String), [1], 'favorites_venues_count');
+      expect(result.data).toEqual([]);
+      expect(result.total).toBe(2);
+    });
   });
   
   describe('getUserFavoriteArtists', () => {
@@ -190,18 +198,14 @@ describe('FavoritesRepository', () => {
         total_pages: 1,
       };
       
-      // Mock the raw method for count query
-      (QueryBuilder.raw as jest.Mock).mockImplementation((query) => {
-        if (query.includes('COUNT(*)')) {
-          return Promise.resolve({ rows: [{ total: '2' }] });
-        } else {
-          return Promise.resolve({ rows: mockArtists.data });
-        }
+      // Rows carry the window count alongside the entity columns
+      (QueryBuilder.raw as jest.Mock).mockResolvedValue({
+        rows: mockArtists.data.map(row => ({ ...row, __total: '2' }))
       });
       
       const result = await favoritesRepository.getUserFavoriteArtists(1);
       
-      expect(QueryBuilder.raw).toHaveBeenCalledTimes(2);
+      expect(QueryBuilder.raw).toHaveBeenCalledTimes(1);
       expect(result).toEqual(mockArtists);
     });
   });
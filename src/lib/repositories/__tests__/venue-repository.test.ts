@@ -1,11 +1,13 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { VenueRepository } from '../venue-repository';
 import { QueryBuilder } from '../../db/query-builder';
+import { encodeVenueCursor } from '../../utils/pagination';
 
 // Mock the QueryBuilder
 vi.mock('../../db/query-builder', () => ({
   QueryBuilder: vi.fn().mockImplementation(() => ({
     where: vi.fn().mockReturnThis(),
+    whereAfter: vi.fn().mockReturnThis(),
     select: vi.fn().mockReturnThis(),
     join: vi.fn().mockReturnThis(),
     orderBy: vi.fn().mockReturnThis(),
@@ -14,6 +16,7 @@ vi.mock('../../db/query-builder', () => ({
     execute: vi.fn(),
     executeSingle: vi.fn(),
     executePaginated: vi.fn(),
+    executeKeyset: vi.fn(),
     insert: vi.fn(),
     update: vi.fn(),
     delete: vi.fn()
@@ -82,10 +85,55 @@ describe('VenueRepository', () => {
     });
   });
 
+  describe('findByCityName', () => {
+    it('should break name ties by ID so pages line up with cursors', async () => {
+      mockQueryBuilder.executePaginated.mockResolvedValue({ data: [], total: 0, page: 1, limit: 20, total_pages: 0 });
+
+      await venueRepository.findByCityName('Seattle', { page: 1, limit: 20, sort_by: 'name', sort_dir: 'asc' });
+
+      expect(mockQueryBuilder.orderBy).toHaveBeenCalledWith(['venues.name', 'venues.id'], 'ASC');
+    });
+  });
+
+  describe('findByCityNameAfter', () => {
+    it('should seek past the cursor in (name, id) order', async () => {
+      const showbox = { id: 3, name: 'Showbox', city_id: 1 };
+      mockQueryBuilder.executeKeyset.mockResolvedValue({ data: [showbox], hasMore: true });
+
+      const result = await venueRepository.findByCityNameAfter('Seattle', { name: 'Neumos', id: 2 }, 1);
+
+      expect(mockQueryBuilder.whereAfter).toHaveBeenCalledWith(['venues.name', 'venues.id'], ['Neumos', 2]);
+      expect(mockQueryBuilder.orderBy).toHaveBeenCalledWith(['venues.name', 'venues.id'], 'ASC');
+      expect(mockQueryBuilder.executeKeyset).toHaveBeenCalledWith(1);
+      expect(result).toEqual({
+        data: [showbox],
+        limit: 1,
+        next_cursor: encodeVenueCursor(showbox)
+      });
+    });
+
+    it('should not return a cursor from the last page', async () => {
+      mockQueryBuilder.executeKeyset.mockResolvedValue({ data: [{ id: 3, name: 'Showbox' }], hasMore: false });
+
+      const result = await venueRepository.findByCityNameAfter('Seattle', { name: 'Neumos', id: 2 });
+
+      expect(result.next_cursor).toBeNull();
+    });
+  });
+
   describe('findNearby', () => {
     it('should find venues near a geographic point', async () => {
       const mockVenues = [
-        { id: 1, name: 'Nearby Venue', distance_km: 2.5 }
+        {
+          id: 1,
+          name: 'Nearby Venue',
+          city_id: 1,
+          city_name: 'Seattle',
+          state_province: 'WA',
+          country: 'US',
+          city_coordinates: { x: -122.3321, y: 47.6062 },
+          distance_km: 2.5
+        }
       ];
 
       mockQueryBuilder.execute.mockResolvedValue(mockVenues);
@@ -95,15 +143,31 @@ describe('VenueRepository', () => {
 
       expect(mockQueryBuilder.select).toHaveBeenCalledWith([
         'venues.*',
-        'ST_Distance(venues.coordinates, ST_MakePoint($1, $2)::geometry) / 1000 AS distance_km'
+        'cities.name AS city_name',
+        'cities.state_province',
+        'cities.country',
+        'cities.coordinates AS city_coordinates',
+        'ST_Distance(ST_SetSRID(venues.coordinates::geometry, 4326)::geography, ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography) / 1000 AS distance_km'
       ]);
+      expect(mockQueryBuilder.join).toHaveBeenCalledWith('LEFT JOIN cities ON venues.city_id = cities.id');
       expect(mockQueryBuilder.where).toHaveBeenCalledWith(
-        'ST_DWithin(venues.coordinates, ST_MakePoint($1, $2)::geometry, $3 * 1000)',
+        'ST_DWithin(ST_SetSRID(venues.coordinates::geometry, 4326)::geography, ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography, $3 * 1000)',
         -122.4194, 37.7749, 10
       );
-      expect(mockQueryBuilder.orderBy).toHaveBeenCalledWith('distance_km', 'ASC');
+      expect(mockQueryBuilder.orderBy).toHaveBeenCalledWith(
+        'ST_SetSRID(venues.coordinates::geometry, 4326)::geography <-> ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography',
+        'ASC'
+      );
       expect(mockQueryBuilder.limit).toHaveBeenCalledWith(20);
-      expect(result).toEqual(mockVenues);
+      expect(result[0]).toEqual(expect.objectContaining({
+        id: 1,
+        distance_km: 2.5,
+        city: expect.objectContaining({
+          id: 1,
+          name: 'Seattle',
+          coordinates: { x: -122.3321, y: 47.6062 }
+        })
+      }));
     });
 
     it('should use default limit when not provided', async () => {
@@ -173,7 +237,7 @@ describe('VenueRepository', () => {
 
       const result = await venueRepository.findByIdWithCity(1);
 
-      expect(QueryBuilder.raw).toHaveBeenCalledWith(expect.any(String), [1]);
+      expect(QueryBuilder.raw).toHaveBeenCalledWith(expect.any(String), [1], 'venues_find_by_id_with_city');
       expect(result).toEqual(expect.objectContaining({
         id: 1,
         name: 'Test Venue',
@@ -219,6 +283,21 @@ describe('VenueRepository', () => {
 
       expect(mockQueryBuilder.limit).toHaveBeenCalledWith(20);
     });
+
+    it('should match short terms as a name prefix', async () => {
+      mockQueryBuilder.execute.mockResolvedValue([]);
+
+      await venueRepository.searchByName(' Ne ');
+
+      expect(mockQueryBuilder.where).toHaveBeenCalledWith('LOWER(name) LIKE $1', 'ne%');
+    });
+
+    it('should return no venues for a blank term', async () => {
+      const result = await venueRepository.searchByName('   ');
+
+      expect(result).toEqual([]);
+      expect(mockQueryBuilder.execute).not.toHaveBeenCalled();
+    });
   });
 
   describe('getVenueCountsByCity', () => {
@@ -272,8 +351,8 @@ describe('VenueRepository', () => {
         expect.stringContaining('distance_km')
       ]));
       expect(mockQueryBuilder.where).toHaveBeenCalledWith(
-        'ST_DWithin(venues.coordinates, ST_MakePoint($1, $2)::geometry, $3 * 1000)',
-        47.6062, -122.3321, 10
+        'ST_DWithin(ST_SetSRID(venues.coordinates::geometry, 4326)::geography, ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography, $3 * 1000)',
+        -122.3321, 47.6062, 10
       );
       expect(result).toEqual(mockResult);
     });
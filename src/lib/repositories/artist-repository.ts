@@ -1,5 +1,47 @@
 import { BaseRepository } from './base-repository';
-import { Artist, Media, Event, EventSearchParams } from '../models/types';
+import { QueryBuilder } from '../db/query-builder';
+import { Artist, Media, Event, EventSearchParams, EventCursor } from '../models/types';
+import { eventSeekCondition } from '../utils/pagination';
+
+/**
+ * Build a query loading one artist with media aggregated as JSON.
+ * Media is aggregated in a correlated subquery, so the artist row is never
+ * repeated per media item and only the selected artist's media is read.
+ * @param condition WHERE clause referencing the artist as `a` and the value as $1
+ */
+function withMediaQuery(condition: string): string {
+  return `
+    SELECT 
+      a.*,
+      (
+        SELECT COALESCE(
+          json_agg(
+            json_build_object(
+              'id', m.id,
+              'artist_id', m.artist_id,
+              'type', m.type,
+              'url', m.url,
+              'created_at', m.created_at,
+              'updated_at', m.updated_at
+            )
+            ORDER BY m.created_at DESC
+          ),
+          '[]'
+        )
+        FROM media m
+        WHERE m.artist_id = a.id
+      ) as media
+    FROM artists a
+    WHERE ${condition}
+    ORDER BY a.id
+    LIMIT 1
+  `;
+}
+
+// Built once and run as named prepared statements
+const FIND_BY_ID_WITH_MEDIA_SQL = withMediaQuery('a.id = $1');
+const FIND_BY_NAME_WITH_MEDIA_SQL = withMediaQuery('LOWER(a.name) = LOWER($1)');
+const FIND_BY_NAME_SQL = 'SELECT * FROM artists WHERE LOWER(name) = LOWER($1) ORDER BY id ASC LIMIT 1';
 
 /**
  * Repository for managing artist data and related operations
@@ -14,9 +56,8 @@ export class ArtistRepository extends BaseRepository<Artist> {
    * @param name Artist name
    */
   async findByName(name: string): Promise<Artist | null> {
-    return this.createQueryBuilder()
-      .where('LOWER(name) = LOWER($1)', name)
-      .executeSingle<Artist>();
+    const result = await QueryBuilder.raw<Artist>(FIND_BY_NAME_SQL, [name], 'artists_find_by_name');
+    return result.rows.length > 0 ? result.rows[0] : null;
   }
 
   /**
@@ -24,28 +65,25 @@ export class ArtistRepository extends BaseRepository<Artist> {
    * @param id Artist ID
    */
   async findByIdWithMedia(id: number): Promise<Artist | null> {
-    const query = `
-      SELECT 
-        a.*,
-        COALESCE(
-          json_agg(
-            json_build_object(
-              'id', m.id,
-              'type', m.type,
-              'url', m.url,
-              'created_at', m.created_at,
-              'updated_at', m.updated_at
-            )
-          ) FILTER (WHERE m.id IS NOT NULL), 
-          '[]'
-        ) as media
-      FROM artists a
-      LEFT JOIN media m ON a.id = m.artist_id
-      WHERE a.id = $1
-      GROUP BY a.id
-    `;
+    return this.findOneWithMedia(FIND_BY_ID_WITH_MEDIA_SQL, 'artists_find_by_id_with_media', id);
+  }
+
+  /**
+   * Find an artist by name (case-insensitive) with their media in a single query
+   * @param name Artist name
+   */
+  async findByNameWithMedia(name: string): Promise<Artist | null> {
+    return this.findOneWithMedia(FIND_BY_NAME_WITH_MEDIA_SQL, 'artists_find_by_name_with_media', name);
+  }
 
-    const result = await this.pool.query(query, [id]);
+  /**
+   * Load a single artist row with its media aggregated as JSON
+   * @param query One of the prebuilt media queries
+   * @param name Prepared statement name for the query
+   * @param value Value bound to $1
+   */
+  private async findOneWithMedia(query: string, name: string, value: string | number): Promise<Artist | null> {
+    const result = await QueryBuilder.raw<Artist>(query, [value], name);
     return result.rows.length > 0 ? result.rows[0] : null;
   }
 
@@ -53,8 +91,51 @@ export class ArtistRepository extends BaseRepository<Artist> {
    * Find upcoming events for an artist
    * @param artistId Artist ID
    * @param params Optional search parameters
+   * @param cursor Optional position of the last event already returned; seeks past it instead of using OFFSET
    */
-  async findUpcomingEvents(artistId: number, params?: EventSearchParams): Promise<Event[]> {
+  async findUpcomingEvents(
+    artistId: number,
+    params?: EventSearchParams,
+    cursor?: EventCursor
+  ): Promise<{ data: Event[]; hasMore: boolean }> {
+    return this.queryUpcomingEvents('ea.artist_id = $1', artistId, params, cursor);
+  }
+
+  /**
+   * Find upcoming events for an artist identified by name (case-insensitive).
+   * The name is resolved inside the query, so callers can run this concurrently
+   * with their own artist lookup instead of waiting for the ID first.
+   * @param name Artist name
+   * @param params Optional search parameters
+   * @param cursor Optional position of the last event already returned
+   */
+  async findUpcomingEventsByArtistName(
+    name: string,
+    params?: EventSearchParams,
+    cursor?: EventCursor
+  ): Promise<{ data: Event[]; hasMore: boolean }> {
+    return this.queryUpcomingEvents(
+      'ea.artist_id = (SELECT id FROM artists WHERE LOWER(name) = LOWER($1) ORDER BY id LIMIT 1)',
+      name,
+      params,
+      cursor
+    );
+  }
+
+  /**
+   * Build and run the upcoming events query for a single artist.
+   * With a limit, fetches one extra row to tell whether another page follows.
+   * @param artistCondition WHERE clause selecting the artist, with the value as $1
+   * @param artistValue Value bound to $1
+   * @param params Optional search parameters
+   * @param cursor Optional keyset position; replaces OFFSET when given
+   */
+  private async queryUpcomingEvents(
+    artistCondition: string,
+    artistValue: string | number,
+    params?: EventSearchParams,
+    cursor?: EventCursor
+  ): Promise<{ data: Event[]; hasMore: boolean }> {
     let query = `
       SELECT 
         e.*,
@@ -77,11 +158,11 @@ export class ArtistRepository extends BaseRepository<Artist> {
       JOIN event_artists ea ON e.id = ea.event_id
       JOIN venues v ON e.venue_id = v.id
       JOIN cities c ON v.city_id = c.id
-      WHERE ea.artist_id = $1 
+      WHERE ${artistCondition}
         AND e.event_datetime >= NOW()
     `;
 
-    const queryParams: any[] = [artistId];
+    const queryParams: any[] = [artistValue];
     let paramIndex = 2;
 
     // Add date filtering if provided
@@ -97,16 +178,23 @@ export class ArtistRepository extends BaseRepository<Artist> {
       paramIndex++;
     }
 
-    // Add ordering
-    query += ` ORDER BY e.event_datetime ASC`;
+    // Keyset pagination: seek past the last event returned
+    if (cursor) {
+      query += ` AND ${eventSeekCondition('e', paramIndex, paramIndex + 1)}`;
+      queryParams.push(cursor.id, cursor.event_datetime);
+      paramIndex += 2;
+    }
+
+    // Add ordering; id breaks ties so cursors are stable
+    query += ` ORDER BY e.event_datetime ASC, e.id ASC`;
 
     // Add pagination if provided
     if (params?.limit) {
       query += ` LIMIT $${paramIndex}`;
-      queryParams.push(params.limit);
+      queryParams.push(params.limit + 1);
       paramIndex++;
 
-      if (params?.page && params.page > 1) {
+      if (!cursor && params?.page && params.page > 1) {
         const offset = (params.page - 1) * params.limit;
         query += ` OFFSET $${paramIndex}`;
         queryParams.push(offset);
@@ -114,7 +202,10 @@ export class ArtistRepository extends BaseRepository<Artist> {
     }
 
     const result = await this.pool.query(query, queryParams);
-    return result.rows;
+    const limit = params?.limit;
+    const hasMore = !!limit && result.rows.length > limit;
+
+    return { data: hasMore ? result.rows.slice(0, limit) : result.rows, hasMore };
   }
 
   /**
@@ -142,16 +233,19 @@ export class ArtistRepository extends BaseRepository<Artist> {
   }
 
   /**
-   * Search artists by name or genre
+   * Search artists by name or genre.
+   * Both branches are index-backed (trigram GIN on name, GIN on genres), so the
+   * planner can combine them with a BitmapOr instead of scanning every artist.
    * @param searchTerm Search term
    * @param limit Optional limit
    */
   async search(searchTerm: string, limit: number = 20): Promise<Artist[]> {
+    // `= ANY(genres)` can't use the GIN index; array containment can
     const query = `
       SELECT * FROM artists
       WHERE 
         name ILIKE $1 
-        OR $2 = ANY(genres)
+        OR genres @> ARRAY[$2]::text[]
       ORDER BY 
         CASE 
           WHEN LOWER(name) = LOWER($3) THEN 1
@@ -3,6 +3,9 @@ import pool from '../db'
 import { QueryBuilder } from '../db/query-builder';
 import { BaseEntity, QueryParams, PaginatedResult } from '../models/types';
 
+// Rows per multi-row INSERT; larger batches stop paying off and risk the 65535 bind parameter limit
+const CREATE_MANY_BATCH_SIZE = 1000;
+
 /**
  * Base repository class that implements common CRUD operations
  * @template T The entity type
@@ -70,6 +73,23 @@ export abstract class BaseRepository<T extends BaseEntity> {
     return builder.execute<T>();
   }
 
+  /**
+   * Find entities loading only the given columns, for listings that don't need full rows
+   * @param columns Columns to select
+   * @param limit Optional maximum number of rows
+   */
+  async findAllColumns<K extends keyof T & string>(columns: K[], limit?: number): Promise<Pick<T, K>[]> {
+    const builder = this.createQueryBuilder()
+      .select(columns)
+      .orderBy('id', 'ASC');
+
+    if (limit) {
+      builder.limit(limit);
+    }
+
+    return builder.execute<Pick<T, K>>();
+  }
+
   /**
    * Find entities with pagination
    * @param params Query parameters
@@ -92,6 +112,40 @@ export abstract class BaseRepository<T extends BaseEntity> {
     return this.createQueryBuilder().insert<T>(data);
   }
 
+  /**
+   * Create many entities in one transaction, with multi-row INSERTs of up to
+   * CREATE_MANY_BATCH_SIZE rows. If any batch fails, none of the rows are kept.
+   * Subclasses that cache derived data must invalidate it after this resolves.
+   * @param rows Entity data; every row must have the same columns
+   */
+  async createMany(rows: Partial<T>[]): Promise<T[]> {
+    if (rows.length === 0) {
+      return [];
+    }
+
+    const client = await this.pool.connect();
+    const created: T[] = [];
+
+    try {
+      await client.query('BEGIN');
+
+      for (let i = 0; i < rows.length; i += CREATE_MANY_BATCH_SIZE) {
+        const batch = rows.slice(i, i + CREATE_MANY_BATCH_SIZE) as Record<string, unknown>[];
+        const result = await client.query(QueryBuilder.buildBulkInsert(this.tableName, batch));
+        created.push(...result.rows);
+      }
+
+      await client.query('COMMIT');
+    } catch (error) {
+      await client.query('ROLLBACK');
+      throw error;
+    } finally {
+      client.release();
+    }
+
+    return created;
+  }
+
   /**
    * Update an existing entity
    * @param id Entity ID
@@ -123,4 +177,21 @@ export abstract class BaseRepository<T extends BaseEntity> {
     const result = await builder.executeSingle<{ count: string }>();
     return result ? parseInt(result.count, 10) : 0;
   }
+
+  /**
+   * Check whether any entity matches the given column values.
+   * Stops at the first match instead of counting or loading rows.
+   * @param criteria Column values that must all match
+   */
+  async exists(criteria: Partial<T>): Promise<boolean> {
+    const columns = Object.keys(criteria);
+    const conditions = columns.map((column, i) => `${column} = $${i + 1}`).join(' AND ');
+    const whereClause = conditions ? ` WHERE ${conditions}` : '';
+
+    const result = await QueryBuilder.raw<{ exists: boolean }>(
+      `SELECT EXISTS (SELECT 1 FROM ${this.tableName}${whereClause}) AS exists`,
+      Object.values(criteria)
+    );
+    return result.rows[0]?.exists ?? false;
+  }
 }
\ No newline at end of file
@@ -2,6 +2,29 @@ import { BaseRepository } from './base-repository';
 import { City, GeoPoint, QueryParams } from '../models/types';
 import { QueryBuilder } from '../db/query-builder';
 
+// City location as a WGS84 geography; matches idx_cities_geography so radius
+// filters are index-backed and distances come out in meters
+const CITY_GEOGRAPHY = 'ST_SetSRID(coordinates::geometry, 4326)::geography';
+const POINT_GEOGRAPHY = 'ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography';
+// Nearest-first ordering with the KNN operator, served in order by idx_cities_geography
+const NEAREST_FIRST = `${CITY_GEOGRAPHY} <-> ${POINT_GEOGRAPHY}`;
+
+// Built once and run as a named prepared statement
+const FIND_BY_NAME_SQL = 'SELECT * FROM cities WHERE LOWER(name) = LOWER($1) ORDER BY id ASC LIMIT 1';
+
+// Regions change only when cities are added or moved, so the grouped list is
+// cached in process; writes through this repository drop it early
+const REGIONS_CACHE_TTL_MS = 5 * 60 * 1000;
+let regionsCache: { regions: { country: string, regions: string[] }[]; expiresAt: number } | null = null;
+
+// Venue counts per region are read on every region page, so they are cached
+// briefly per region. City and venue writes through the repositories drop the
+// cache; other writes show up within the TTL. Keys come from request paths, so
+// the cache is capped and evicts least recently used regions.
+const VENUE_COUNTS_CACHE_TTL_MS = 60 * 1000;
+const VENUE_COUNTS_CACHE_MAX_SIZE = 100;
+const venueCountsCache = new Map<string, { cities: (City & { venue_count: number })[]; expiresAt: number }>();
+
 /**
  * Repository for City entities
  */
@@ -10,6 +33,15 @@ export class CityRepository extends BaseRepository<City> {
     super('cities');
   }
 
+  /**
+   * Find a city by name (case-insensitive)
+   * @param name City name
+   */
+  async findByName(name: string): Promise<City | null> {
+    const result = await QueryBuilder.raw<City>(FIND_BY_NAME_SQL, [name], 'cities_find_by_name');
+    return result.rows.length > 0 ? result.rows[0] : null;
+  }
+
   /**
    * Find cities by state/province
    * @param stateProvince State or province name
@@ -26,6 +58,54 @@ export class CityRepository extends BaseRepository<City> {
     return builder.execute<City>();
   }
 
+  /**
+   * Find cities in a state/province with the number of venues in each, ordered by name.
+   * Counts are correlated per city, so only the region's venues are counted.
+   * Served from a one-minute in-process cache per region; the returned array is
+   * shared with the cache and must not be mutated.
+   * @param stateProvince State or province name
+   */
+  async findByStateProvinceWithVenueCounts(stateProvince: string): Promise<(City & { venue_count: number })[]> {
+    const cached = venueCountsCache.get(stateProvince);
+    if (cached) {
+      if (cached.expiresAt > Date.now()) {
+        // Re-insert so the Map's insertion order tracks recency
+        venueCountsCache.delete(stateProvince);
+        venueCountsCache.set(stateProvince, cached);
+        return cached.cities;
+      }
+      venueCountsCache.delete(stateProvince);
+    }
+
+    const cities = await this.createQueryBuilder()
+      .select([
+        'cities.*',
+        '(SELECT COUNT(*) FROM venues WHERE venues.city_id = cities.id)::int AS venue_count'
+      ])
+      .where('state_province = $1', stateProvince)
+      .orderBy('cities.name', 'ASC')
+      .execute<City & { venue_count: number }>();
+
+    // Unknown regions aren't cached, so made-up paths can't fill the cache
+    if (cities.length === 0) {
+      return cities;
+    }
+
+    // Evict the least recently used region once the cache is full
+    if (venueCountsCache.size >= VENUE_COUNTS_CACHE_MAX_SIZE) {
+      venueCountsCache.delete(venueCountsCache.keys().next().value!);
+    }
+    venueCountsCache.set(stateProvince, { cities, expiresAt: Date.now() + VENUE_COUNTS_CACHE_TTL_MS });
+    return cities;
+  }
+
+  /**
+   * Clear the cached per-region venue counts
+   */
+  static clearVenueCountsCache(): void {
+    venueCountsCache.clear();
+  }
+
   /**
    * Find cities by country
    * @param country Country code (2 characters)
@@ -53,20 +133,25 @@ export class CityRepository extends BaseRepository<City> {
     const builder = this.createQueryBuilder()
       .select([
         '*',
-        'ST_Distance(coordinates, ST_MakePoint($1, $2)::geometry) / 1000 AS distance_km'
+        `ST_Distance(${CITY_GEOGRAPHY}, ${POINT_GEOGRAPHY}) / 1000 AS distance_km`
       ])
-      .where('ST_DWithin(coordinates, ST_MakePoint($1, $2)::geometry, $3 * 1000)', 
+      .where(`ST_DWithin(${CITY_GEOGRAPHY}, ${POINT_GEOGRAPHY}, $3 * 1000)`, 
         point.x, point.y, radiusKm)
-      .orderBy('distance_km', 'ASC')
+      .orderBy(NEAREST_FIRST, 'ASC')
       .limit(limit);
     
     return builder.execute<City & { distance_km: number }>();
   }
 
   /**
-   * Get distinct regions (state/province) grouped by country
+   * Get distinct regions (state/province) grouped by country.
+   * Served from a five-minute in-process cache.
    */
   async getRegions(): Promise<{ country: string, regions: string[] }[]> {
+    if (regionsCache && regionsCache.expiresAt > Date.now()) {
+      return regionsCache.regions;
+    }
+
     const query = `
       SELECT country, array_agg(DISTINCT state_province ORDER BY state_province) as regions
       FROM cities
@@ -74,9 +159,62 @@ export class CityRepository extends BaseRepository<City> {
       ORDER BY country
     `;
     
-    const result = await QueryBuilder.raw<{ country: string, regions: string[] }>(query);
+    const result = await QueryBuilder.raw<{ country: string, regions: string[] }>(query, [], 'cities_regions');
+    regionsCache = { regions: result.rows, expiresAt: Date.now() + REGIONS_CACHE_TTL_MS };
     return result.rows;
   }
+
+  /**
+   * Clear the cached region list
+   */
+  static clearRegionsCache(): void {
+    regionsCache = null;
+  }
+
+  /**
+   * Create a city and drop the cached region list and venue counts
+   * @param data City data
+   */
+  async create(data: Partial<City>): Promise<City> {
+    const city = await super.create(data);
+    regionsCache = null;
+    venueCountsCache.clear();
+    return city;
+  }
+
+  /**
+   * Create many cities and drop the cached region list and venue counts
+   * @param rows City data
+   */
+  async createMany(rows: Partial<City>[]): Promise<City[]> {
+    const cities = await super.createMany(rows);
+    regionsCache = null;
+    venueCountsCache.clear();
+    return cities;
+  }
+
+  /**
+   * Update a city and drop the cached region list and venue counts
+   * @param id City ID
+   * @param data Updated city data
+   */
+  async update(id: number, data: Partial<City>): Promise<City | null> {
+    const city = await super.update(id, data);
+    regionsCache = null;
+    venueCountsCache.clear();
+    return city;
+  }
+
+  /**
+   * Delete a city and drop the cached region list and venue counts
+   * @param id City ID
+   */
+  async delete(id: number): Promise<boolean> {
+    const deleted = await super.delete(id);
+    regionsCache = null;
+    venueCountsCache.clear();
+    return deleted;
+  }
     // existing methods and properties
 
   // Add findRegions method for testing/mocking
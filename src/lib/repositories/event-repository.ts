@@ -1,6 +1,63 @@
 import { QueryBuilder } from '../db/query-builder';
 import { BaseRepository } from './base-repository';
-import { Event, EventSearchParams, PaginatedResult } from '../models/types';
+import { Event, EventSearchHit, EventSearchParams, EventCursor, PaginatedResult, CursorPaginatedResult, LitePaginatedResult } from '../models/types';
+import { buildPaginatedResult, encodeEventCursor, eventSeekCondition } from '../utils/pagination';
+
+// Built once and run as a named prepared statement. Artists are aggregated in a
+// correlated subquery so the venue/city join never fans out per artist.
+const FIND_BY_ID_WITH_DETAILS_SQL = `
+  SELECT 
+    e.*,
+    v.name AS venue_name,
+    v.address AS venue_address,
+    v.capacity AS venue_capacity,
+    v.website AS venue_website,
+    c.name AS city_name,
+    c.state_province,
+    c.country,
+    CASE
+      WHEN e.event_datetime < NOW() - INTERVAL '24 hours' THEN 'past'
+      WHEN e.event_datetime < NOW() THEN 'ongoing'
+      WHEN e.event_datetime <= NOW() + INTERVAL '24 hours' THEN 'today'
+      ELSE 'upcoming'
+    END AS status,
+    (
+      SELECT COALESCE(
+        JSON_AGG(
+          JSON_BUILD_OBJECT(
+            'id', a.id,
+            'name', a.name,
+            'genres', a.genres,
+            'photo_url', a.photo_url,
+            'profile_bio', a.profile_bio
+          )
+        ),
+        '[]'::json
+      )
+      FROM event_artists ea
+      JOIN artists a ON ea.artist_id = a.id
+      WHERE ea.event_id = e.id
+    ) AS artists
+  FROM events e
+  LEFT JOIN venues v ON e.venue_id = v.id
+  LEFT JOIN cities c ON v.city_id = c.id
+  WHERE e.id = $1
+`;
+
+// Sort fields accepted by search(), mapped to their SQL expressions
+export const EVENT_SEARCH_SORT_COLUMNS = new Map<string, string>([
+  ['_score', 'rank'],
+  ['event_datetime', 'e.event_datetime'],
+  ['title', 'e.title']
+]);
+
+// Short-lived cache of event detail lookups, keyed by event ID. Writes through this
+// repository evict the entry; venue and artist edits are picked up when the TTL lapses.
+// The computed status is cached too, so it can lag the clock by up to the TTL around
+// the past/ongoing/today boundaries.
+const DETAILS_CACHE_TTL_MS = 60 * 1000;
+const DETAILS_CACHE_MAX_SIZE = 1000;
+const detailsCache = new Map<number, { event: Event; expiresAt: number }>();
 
 /**
  * Repository for Event entities
@@ -19,6 +76,40 @@ export class EventRepository extends BaseRepository<Event> {
     const page = params?.page || 1;
     const limit = params?.limit || 20;
     
+    const builder = this.venueEventsQuery(venueId, params);
+    
+    if (params) {
+      builder.applyQueryParams(params);
+    }
+    
+    return builder.executePaginated<Event>(page, limit);
+  }
+
+  /**
+   * Find events by venue ID without counting the total
+   * @param venueId Venue ID
+   * @param params Optional search parameters including date filters
+   */
+  async findByVenueIdLite(venueId: number, params?: EventSearchParams): Promise<LitePaginatedResult<Event>> {
+    return this.executeLitePage(this.venueEventsQuery(venueId, params), params);
+  }
+
+  /**
+   * Find events by venue ID after a cursor (keyset pagination)
+   * @param venueId Venue ID
+   * @param cursor Position of the last event already returned
+   * @param params Optional search parameters including date filters
+   */
+  async findByVenueIdAfter(venueId: number, cursor: EventCursor, params?: EventSearchParams): Promise<CursorPaginatedResult<Event>> {
+    return this.executeKeysetPage(this.venueEventsQuery(venueId, params), cursor, params);
+  }
+
+  /**
+   * Build the venue events query shared by offset and keyset pagination
+   * @param venueId Venue ID
+   * @param params Optional search parameters including date filters
+   */
+  private venueEventsQuery(venueId: number, params?: EventSearchParams): QueryBuilder {
     let builder = this.createQueryBuilder()
       .select([
         'events.*',
@@ -45,52 +136,74 @@ export class EventRepository extends BaseRepository<Event> {
       builder = builder.where('events.event_datetime >= NOW()');
     }
     
-    // Order by event date
-    builder = builder.orderBy('events.event_datetime', 'ASC');
-    
-    if (params) {
-      builder.applyQueryParams(params);
-    }
-    
-    return builder.executePaginated<Event>(page, limit);
+    // Order by event date, with ID as a tiebreaker so offset pages and cursors agree
+    return builder.orderBy(['events.event_datetime', 'events.id'], 'ASC');
   }
 
   /**
-   * Find an event by ID with full details including venue and artists
+   * Find an event by ID with full details including venue and artists.
+   * Results are cached briefly since this backs the event detail page.
    * @param id Event ID
    */
   async findByIdWithDetails(id: number): Promise<Event | null> {
-    const query = `
-      SELECT 
-        e.*,
-        v.name AS venue_name,
-        v.address AS venue_address,
-        v.capacity AS venue_capacity,
-        v.website AS venue_website,
-        c.name AS city_name,
-        c.state_province,
-        c.country,
-        COALESCE(
-          JSON_AGG(
-            JSON_BUILD_OBJECT(
-              'id', a.id,
-              'name', a.name,
-              'genres', a.genres,
-              'photo_url', a.photo_url,
-              'profile_bio', a.profile_bio
-            )
-          ) FILTER (WHERE a.id IS NOT NULL), 
-          '[]'::json
-        ) AS artists
-      FROM events e
-      LEFT JOIN venues v ON e.venue_id = v.id
-      LEFT JOIN cities c ON v.city_id = c.id
-      LEFT JOIN event_artists ea ON e.id = ea.event_id
-      LEFT JOIN artists a ON ea.artist_id = a.id
-      WHERE e.id = $1
-      GROUP BY e.id, v.id, c.id
-    `;
-    
+    const cached = detailsCache.get(id);
+    if (cached) {
+      if (cached.expiresAt > Date.now()) {
+        // Re-insert so the Map's insertion order tracks recency
+        detailsCache.delete(id);
+        detailsCache.set(id, cached);
+        return cached.event;
+      }
+      detailsCache.delete(id);
+    }
+
+    const event = await this.loadByIdWithDetails(id);
+    if (!event) {
+      return null;
+    }
+
+    // Evict the least recently used entry once the cache is full
+    if (detailsCache.size >= DETAILS_CACHE_MAX_SIZE) {
+      detailsCache.delete(detailsCache.keys().next().value!);
+    }
+    detailsCache.set(id, { event, expiresAt: Date.now() + DETAILS_CACHE_TTL_MS });
+
+    return event;
+  }
+
+  /**
+   * Clear the event details cache
+   */
+  static clearDetailsCache(): void {
+    detailsCache.clear();
+  }
+
+  /**
+   * Update an event and drop its cached details
+   * @param id Event ID
+   * @param data Updated event data
+   */
+  async update(id: number, data: Partial<Event>): Promise<Event | null> {
+    const event = await super.update(id, data);
+    detailsCache.delete(id);
+    return event;
+  }
+
+  /**
+   * Delete an event and drop its cached details
+   * @param id Event ID
+   */
+  async delete(id: number): Promise<boolean> {
+    const deleted = await super.delete(id);
+    detailsCache.delete(id);
+    return deleted;
+  }
+
+  /**
+   * Load an event with venue and artists from the database
+   * @param id Event ID
+   */
+  private async loadByIdWithDetails(id: number): Promise<Event | null> {
     const result = await QueryBuilder.raw<Event & { 
       venue_name: string;
       venue_address: string;
@@ -100,7 +213,7 @@ export class EventRepository extends BaseRepository<Event> {
       state_province: string;
       country: string;
       artists: any[];
-    }>(query, [id]);
+    }>(FIND_BY_ID_WITH_DETAILS_SQL, [id], 'events_find_by_id_with_details');
     
     if (result.rows.length === 0) {
       return null;
@@ -145,6 +258,21 @@ export class EventRepository extends BaseRepository<Event> {
     const page = params?.page || 1;
     const limit = params?.limit || 20;
     
+    const builder = this.artistEventsQuery(artistId, params);
+    
+    if (params) {
+      builder.applyQueryParams(params);
+    }
+    
+    return builder.executePaginated<Event>(page, limit);
+  }
+
+  /**
+   * Build the artist events query
+   * @param artistId Artist ID
+   * @param params Optional search parameters
+   */
+  private artistEventsQuery(artistId: number, params?: EventSearchParams): QueryBuilder {
     let builder = this.createQueryBuilder()
       .select([
         'events.*',
@@ -173,7 +301,18 @@ export class EventRepository extends BaseRepository<Event> {
     }
     
     // Order by event date
-    builder = builder.orderBy('events.event_datetime', 'ASC');
+    return builder.orderBy('events.event_datetime', 'ASC');
+  }
+
+  /**
+   * Find upcoming events with optional filtering
+   * @param params Search parameters
+   */
+  async findUpcoming(params?: EventSearchParams): Promise<PaginatedResult<Event>> {
+    const page = params?.page || 1;
+    const limit = params?.limit || 20;
+    
+    const builder = this.upcomingEventsQuery(params);
     
     if (params) {
       builder.applyQueryParams(params);
@@ -183,13 +322,10 @@ export class EventRepository extends BaseRepository<Event> {
   }
 
   /**
-   * Find upcoming events with optional filtering
+   * Build the upcoming events query
    * @param params Search parameters
    */
-  async findUpcoming(params?: EventSearchParams): Promise<PaginatedResult<Event>> {
-    const page = params?.page || 1;
-    const limit = params?.limit || 20;
-    
+  private upcomingEventsQuery(params?: EventSearchParams): QueryBuilder {
     let builder = this.createQueryBuilder()
       .select([
         'events.*',
@@ -218,13 +354,56 @@ export class EventRepository extends BaseRepository<Event> {
     }
     
     // Order by event date
-    builder = builder.orderBy('events.event_datetime', 'ASC');
-    
+    return builder.orderBy('events.event_datetime', 'ASC');
+  }
+
+  /**
+   * Run an event list query as an offset page that reports has_next/has_prev
+   * instead of a total, skipping the window count over every matching row
+   * @param builder Event list query
+   * @param params Search parameters
+   */
+  private async executeLitePage(
+    builder: QueryBuilder,
+    params?: EventSearchParams
+  ): Promise<LitePaginatedResult<Event>> {
+    const page = params?.page || 1;
+    const limit = params?.limit || 20;
+
     if (params) {
       builder.applyQueryParams(params);
     }
-    
-    return builder.executePaginated<Event>(page, limit);
+
+    return builder.executeLitePaginated<Event>(page, limit);
+  }
+
+  /**
+   * Run an event list query as a keyset page ordered by (event_datetime, id).
+   * Seeks past the cursor through idx_events_datetime_id instead of scanning
+   * and discarding OFFSET rows.
+   * @param builder Event list query
+   * @param cursor Position of the last event already returned
+   * @param params Search parameters; page is ignored
+   */
+  private async executeKeysetPage(
+    builder: QueryBuilder,
+    cursor: EventCursor,
+    params?: EventSearchParams
+  ): Promise<CursorPaginatedResult<Event>> {
+    const limit = params?.limit || 20;
+
+    const idParam = builder.nextParamIndex();
+    builder.where(eventSeekCondition('events', idParam, idParam + 1), cursor.id, cursor.event_datetime);
+    builder.orderBy(['events.event_datetime', 'events.id'], 'ASC');
+
+    const { data, hasMore } = await builder.executeKeyset<Event>(limit);
+    const last = data[data.length - 1];
+
+    return {
+      data,
+      limit,
+      next_cursor: hasMore && last ? encodeEventCursor(last) : null
+    };
   }
 
   /**
@@ -264,6 +443,110 @@ export class EventRepository extends BaseRepository<Event> {
     return builder.execute<Event>();
   }
 
+  /**
+   * Full-text search of upcoming events by title, description and performing artist names.
+   * Each match is a separate branch of a UNION so both GIN indexes from migration 008
+   * can serve it; an OR across the two would force a sequential scan. Relevance adds the
+   * title/description rank to the best artist name rank, so artist-only matches still
+   * score. Results are ordered by `sort_by` when it names an EVENT_SEARCH_SORT_COLUMNS
+   * key, then by relevance and date.
+   * @param query Search query (plain text)
+   * @param params Optional search parameters
+   */
+  async search(query: string, params?: EventSearchParams): Promise<PaginatedResult<EventSearchHit>> {
+    const page = params?.page || 1;
+    const limit = params?.limit || 20;
+    const values: unknown[] = [query];
+    const filters: string[] = [];
+
+    // Add optional filters
+    if (params?.venue_id) {
+      values.push(params.venue_id);
+      filters.push(`AND e.venue_id = $${values.length}`);
+    }
+    if (params?.city_id) {
+      values.push(params.city_id);
+      filters.push(`AND v.city_id = $${values.length}`);
+    }
+    if (params?.start_date) {
+      values.push(params.start_date);
+      filters.push(`AND e.event_datetime >= $${values.length}`);
+    }
+    if (params?.end_date) {
+      values.push(params.end_date);
+      filters.push(`AND e.event_datetime <= $${values.length}`);
+    }
+
+    const sortColumn = params?.sort_by ? EVENT_SEARCH_SORT_COLUMNS.get(params.sort_by) : undefined;
+    const orderBy = [
+      ...(sortColumn ? [`${sortColumn} ${params?.sort_dir === 'asc' ? 'ASC' : 'DESC'}`] : []),
+      'rank DESC',
+      'e.event_datetime ASC',
+      'e.id ASC'
+    ].join(', ');
+
+    const from = `
+      FROM (
+        SELECT e.id
+        FROM events e
+        WHERE event_search_document(e.title, e.description) @@ plainto_tsquery('english', $1)
+        UNION
+        SELECT ea.event_id
+        FROM artists a
+        JOIN event_artists ea ON ea.artist_id = a.id
+        WHERE to_tsvector('english', coalesce(a.name, '')) @@ plainto_tsquery('english', $1)
+      ) matched
+      JOIN events e ON e.id = matched.id
+      LEFT JOIN venues v ON e.venue_id = v.id
+      LEFT JOIN cities c ON v.city_id = c.id
+    `;
+    const where = `
+      WHERE e.event_datetime >= NOW()
+        ${filters.join(' ')}
+    `;
+
+    // Get the page and the total in one query
+    const result = await QueryBuilder.raw<EventSearchHit & { __total: string }>(
+      `SELECT
+        e.*,
+        v.name AS venue_name,
+        v.address AS venue_address,
+        c.name AS city_name,
+        c.state_province,
+        c.country,
+        COALESCE(performers.artists, '[]'::json) AS artists,
+        ts_rank(event_search_document(e.title, e.description), plainto_tsquery('english', $1))
+          + COALESCE(performers.rank, 0) AS rank,
+        COUNT(*) OVER() AS __total
+      ${from}
+      LEFT JOIN LATERAL (
+        SELECT
+          JSON_AGG(JSON_BUILD_OBJECT('id', a.id, 'name', a.name, 'genres', a.genres)) AS artists,
+          MAX(ts_rank(to_tsvector('english', coalesce(a.name, '')), plainto_tsquery('english', $1))) AS rank
+        FROM event_artists ea
+        JOIN artists a ON ea.artist_id = a.id
+        WHERE ea.event_id = e.id
+      ) performers ON true
+      ${where}
+      ORDER BY ${orderBy}
+      LIMIT $${values.length + 1} OFFSET $${values.length + 2}`,
+      [...values, limit, (page - 1) * limit]
+    );
+
+    let total = 0;
+    if (result.rows.length > 0) {
+      total = parseInt(result.rows[0].__total, 10);
+    } else if (page > 1) {
+      // An empty page past the end carries no count
+      const countResult = await QueryBuilder.raw<{ total: string }>(`SELECT COUNT(*) AS total ${from} ${where}`, values);
+      total = parseInt(countResult.rows[0].total, 10);
+    }
+
+    const data = result.rows.map(({ __total, ...row }) => row);
+
+    return buildPaginatedResult(data, total, page, limit);
+  }
+
   /**
    * Get event counts by venue
    */
@@ -283,7 +566,7 @@ export class EventRepository extends BaseRepository<Event> {
       venue_id: number;
       venue_name: string;
       event_count: number;
-    }>(query);
+    }>(query, [], 'events_counts_by_venue');
     
     return result.rows;
   }
@@ -300,7 +583,26 @@ export class EventRepository extends BaseRepository<Event> {
       ON CONFLICT (event_id, artist_id) DO NOTHING
     `;
     
-    await QueryBuilder.raw(query, [eventId, artistId]);
+    await QueryBuilder.raw(query, [eventId, artistId], 'event_artists_insert');
+    detailsCache.delete(eventId);
+  }
+
+  /**
+   * Associate several artists with an event in one statement
+   * @param eventId Event ID
+   * @param artistIds Artist IDs
+   */
+  async addArtistsToEvent(eventId: number, artistIds: number[]): Promise<void> {
+    if (artistIds.length === 0) return;
+
+    const query = `
+      INSERT INTO event_artists (event_id, artist_id)
+      SELECT $1, UNNEST($2::int[])
+      ON CONFLICT (event_id, artist_id) DO NOTHING
+    `;
+    
+    await QueryBuilder.raw(query, [eventId, artistIds], 'event_artists_insert_many');
+    detailsCache.delete(eventId);
   }
 
   /**
@@ -314,6 +616,7 @@ export class EventRepository extends BaseRepository<Event> {
       WHERE event_id = $1 AND artist_id = $2
     `;
     
-    await QueryBuilder.raw(query, [eventId, artistId]);
+    await QueryBuilder.raw(query, [eventId, artistId], 'event_artists_delete');
+    detailsCache.delete(eventId);
   }
 }
\ No newline at end of file
@@ -1,38 +1,36 @@
 import { QueryBuilder } from '../db/query-builder';
 import { UserFavorite, Artist, Venue, PaginatedResult } from '../models/types';
+import { buildPaginatedResult } from '../utils/pagination';
 
 /**
  * Repository for user favorites-related database operations
  */
 export class FavoritesRepository {
-  private queryBuilder: QueryBuilder;
-
-  constructor() {
-    this.queryBuilder = new QueryBuilder('user_favorites');
-  }
-
   /**
-   * Add a favorite item for a user
+   * Add a favorite item for a user.
+   * Adding an existing favorite is a no-op that returns the existing row.
    * @param userId User ID
    * @param entityType Type of entity ('venue' or 'artist')
    * @param entityId Entity ID
-   * @returns Created favorite object
+   * @returns Created or existing favorite object
    */
   async addFavorite(userId: number, entityType: 'venue' | 'artist', entityId: number): Promise<UserFavorite> {
-    try {
-      return await this.queryBuilder.insert<UserFavorite>({
-        user_id: userId,
-        entity_type: entityType,
-        entity_id: entityId,
-      });
-    } catch (error: any) {
-      // Handle duplicate key error (favorite already exists)
-      if (error.code === '23505') { // PostgreSQL unique constraint violation
-        // Return the existing favorite
-        return await this.getFavorite(userId, entityType, entityId) as UserFavorite;
-      }
-      throw error;
+    // A duplicate hits the primary key and inserts nothing instead of raising
+    const result = await QueryBuilder.raw<UserFavorite>(
+      `INSERT INTO user_favorites (user_id, entity_type, entity_id)
+       VALUES ($1, $2, $3)
+       ON CONFLICT (user_id, entity_type, entity_id) DO NOTHING
+       RETURNING *`,
+      [userId, entityType, entityId],
+      'favorites_add'
+    );
+
+    if (result.rows.length > 0) {
+      return result.rows[0];
     }
+
+    // Already a favorite; return the existing row
+    return await this.getFavorite(userId, entityType, entityId) as UserFavorite;
   }
 
   /**
@@ -45,7 +43,8 @@ export class FavoritesRepository {
   async removeFavorite(userId: number, entityType: 'venue' | 'artist', entityId: number): Promise<boolean> {
     const result = await QueryBuilder.raw(
       'DELETE FROM user_favorites WHERE user_id = $1 AND entity_type = $2 AND entity_id = $3',
-      [userId, entityType, entityId]
+      [userId, entityType, entityId],
+      'favorites_remove'
     );
     return result.rowCount > 0;
   }
@@ -103,35 +102,7 @@ export class FavoritesRepository {
     page: number = 1,
     limit: number = 20
   ): Promise<PaginatedResult<Venue>> {
-    const offset = (page - 1) * limit;
-    
-    // Count total favorites
-    const countResult = await QueryBuilder.raw<{ total: string }>(
-      `SELECT COUNT(*) as total FROM user_favorites uf
-       JOIN venues v ON uf.entity_id = v.id
-       WHERE uf.user_id = $1 AND uf.entity_type = 'venue'`,
-      [userId]
-    );
-    
-    const total = parseInt(countResult.rows[0].total, 10);
-    
-    // Get favorite venues with details
-    const result = await QueryBuilder.raw<Venue>(
-      `SELECT v.* FROM user_favorites uf
-       JOIN venues v ON uf.entity_id = v.id
-       WHERE uf.user_id = $1 AND uf.entity_type = 'venue'
-       ORDER BY uf.created_at DESC
-       LIMIT $2 OFFSET $3`,
-      [userId, limit, offset]
-    );
-    
-    return {
-      data: result.rows,
-      total,
-      page,
-      limit,
-      total_pages: Math.ceil(total / limit),
-    };
+    return this.getFavoriteEntities<Venue>('venues', 'venue', userId, page, limit);
   }
 
   /**
@@ -146,34 +117,56 @@ export class FavoritesRepository {
     page: number = 1,
     limit: number = 20
   ): Promise<PaginatedResult<Artist>> {
+    return this.getFavoriteEntities<Artist>('artists', 'artist', userId, page, limit);
+  }
+
+  /**
+   * Page through a user's favorited entities, most recent first.
+   * The total comes from a window count on the page query, so a page costs one
+   * round trip; only an empty page past the end falls back to a separate count.
+   * Both statements are named per entity type, so each connection plans them once.
+   * @param table Entity table joined to user_favorites
+   * @param entityType Favorite entity type stored in user_favorites
+   * @param userId User ID
+   * @param page Page number
+   * @param limit Items per page
+   */
+  private async getFavoriteEntities<T>(
+    table: 'venues' | 'artists',
+    entityType: 'venue' | 'artist',
+    userId: number,
+    page: number,
+    limit: number
+  ): Promise<PaginatedResult<T>> {
     const offset = (page - 1) * limit;
-    
-    // Count total favorites
-    const countResult = await QueryBuilder.raw<{ total: string }>(
-      `SELECT COUNT(*) as total FROM user_favorites uf
-       JOIN artists a ON uf.entity_id = a.id
-       WHERE uf.user_id = $1 AND uf.entity_type = 'artist'`,
-      [userId]
-    );
-    
-    const total = parseInt(countResult.rows[0].total, 10);
-    
-    // Get favorite artists with details
-    const result = await QueryBuilder.raw<Artist>(
-      `SELECT a.* FROM user_favorites uf
-       JOIN artists a ON uf.entity_id = a.id
-       WHERE uf.user_id = $1 AND uf.entity_type = 'artist'
+    const from = `FROM user_favorites uf
+       JOIN ${table} e ON uf.entity_id = e.id
+       WHERE uf.user_id = $1 AND uf.entity_type = '${entityType}'`;
+
+    // Get favorite entities with details and the total in one query
+    const result = await QueryBuilder.raw<T & { __total: string }>(
+      `SELECT e.*, COUNT(*) OVER() AS __total ${from}
        ORDER BY uf.created_at DESC
        LIMIT $2 OFFSET $3`,
-      [userId, limit, offset]
+      [userId, limit, offset],
+      `favorites_${table}_page`
     );
-    
-    return {
-      data: result.rows,
-      total,
-      page,
-      limit,
-      total_pages: Math.ceil(total / limit),
-    };
+
+    let total = 0;
+    if (result.rows.length > 0) {
+      total = parseInt(result.rows[0].__total, 10);
+    } else if (page > 1) {
+      // An empty page past the end carries no count
+      const countResult = await QueryBuilder.raw<{ total: string }>(
+        `SELECT COUNT(*) as total ${from}`,
+        [userId],
+        `favorites_${table}_count`
+      );
+      total = parseInt(countResult.rows[0].total, 10);
+    }
+
+    const data = result.rows.map(({ __total, ...row }) => row as T);
+
+    return buildPaginatedResult(data, total, page, limit);
   }
 }
\ No newline at end of file
@@ -331,24 +331,26 @@ export class RecommendationRepository {
         c.country,
         ags.total_score as score,
         ags.best_score_type,
-        COALESCE(
-          JSON_AGG(
-            JSON_BUILD_OBJECT(
-              'id', a.id,
-              'name', a.name,
-              'genres', a.genres,
-              'photo_url', a.photo_url
-            )
-          ) FILTER (WHERE a.id IS NOT NULL), 
-          '[]'::json
+        (
+          SELECT COALESCE(
+            JSON_AGG(
+              JSON_BUILD_OBJECT(
+                'id', a.id,
+                'name', a.name,
+                'genres', a.genres,
+                'photo_url', a.photo_url
+              )
+            ),
+            '[]'::json
+          )
+          FROM event_artists ea
+          JOIN artists a ON ea.artist_id = a.id
+          WHERE ea.event_id = e.id
         ) AS artists
       FROM events e
       JOIN venues v ON e.venue_id = v.id
       JOIN cities c ON v.city_id = c.id
-      LEFT JOIN event_artists ea ON e.id = ea.event_id
-      LEFT JOIN artists a ON ea.artist_id = a.id
       JOIN aggregated_scores ags ON e.id = ags.id
-      GROUP BY e.id, v.id, c.id, ags.total_score, ags.best_score_type
       ORDER BY 
         ags.best_score_type ASC,
         ags.total_score DESC,
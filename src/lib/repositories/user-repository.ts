@@ -1,6 +1,19 @@
 import { QueryBuilder } from '../db/query-builder';
 import { User, Session, PasswordResetToken } from '../models/types';
 
+// Built once and run as a named prepared statement; idx_users_email_lower is
+// unique, so at most one user matches
+const FIND_BY_EMAIL_SQL = 'SELECT * FROM users WHERE LOWER(email) = LOWER($1)';
+
+// Run as a named prepared statement too: every authenticated request that
+// misses the token cache looks its session up here
+const FIND_USER_BY_SESSION_TOKEN_SQL = `
+  SELECT u.* FROM sessions s
+  JOIN users u ON u.id = s.user_id
+  WHERE s.token_hash = $1 AND s.expires_at > NOW()
+  LIMIT 1
+`;
+
 /**
  * Repository for user-related database operations
  */
@@ -23,14 +36,13 @@ export class UserRepository {
   }
 
   /**
-   * Find a user by email
+   * Find a user by email (case-insensitive)
    * @param email User email
    * @returns User object or null if not found
    */
   async findByEmail(email: string): Promise<User | null> {
-    return await new QueryBuilder('users')
-      .where('email = $1', email)
-      .executeSingle<User>();
+    const result = await QueryBuilder.raw<User>(FIND_BY_EMAIL_SQL, [email], 'users_find_by_email');
+    return result.rows.length > 0 ? result.rows[0] : null;
   }
 
   /**
@@ -82,6 +94,20 @@ export class UserRepository {
       .executeSingle<Session>();
   }
 
+  /**
+   * Find the user owning an unexpired session in a single query
+   * @param tokenHash Hashed token
+   * @returns User object or null if the session is missing or expired
+   */
+  async findUserBySessionToken(tokenHash: string): Promise<User | null> {
+    const result = await QueryBuilder.raw<User>(
+      FIND_USER_BY_SESSION_TOKEN_SQL,
+      [tokenHash],
+      'users_find_by_session_token'
+    );
+    return result.rows.length > 0 ? result.rows[0] : null;
+  }
+
   /**
    * Delete a session
    * @param id Session ID
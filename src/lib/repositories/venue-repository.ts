@@ -1,6 +1,45 @@
 import { QueryBuilder } from '../db/query-builder';
 import { BaseRepository } from './base-repository';
-import { Venue, GeoPoint, QueryParams, PaginatedResult } from '../models/types';
+import { CityRepository } from './city-repository';
+import { Venue, GeoPoint, QueryParams, PaginatedResult, CursorPaginatedResult, VenueCursor } from '../models/types';
+import { encodeVenueCursor } from '../utils/pagination';
+
+// Venue location as a WGS84 geography; matches idx_venues_geography so radius
+// filters are index-backed and distances come out in meters
+const VENUE_GEOGRAPHY = 'ST_SetSRID(venues.coordinates::geometry, 4326)::geography';
+const POINT_GEOGRAPHY = 'ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography';
+// Nearest-first ordering with the KNN operator, which idx_venues_geography can
+// return in order so LIMIT stops the index scan early
+const NEAREST_FIRST = `${VENUE_GEOGRAPHY} <-> ${POINT_GEOGRAPHY}`;
+
+// Trigrams need at least three characters; shorter searches match as a name
+// prefix through idx_venues_name_lower_pattern instead
+const MIN_SUBSTRING_SEARCH_LENGTH = 3;
+
+// Name order with ID as a tiebreaker; the key for city venue cursors and
+// idx_venues_city_name_id
+const NAME_ORDER = ['venues.name', 'venues.id'];
+
+// Built once and run as a named prepared statement
+const FIND_BY_ID_WITH_CITY_SQL = `
+  SELECT 
+    v.*,
+    c.name AS city_name,
+    c.state_province,
+    c.country,
+    c.coordinates AS city_coordinates
+  FROM venues v
+  LEFT JOIN cities c ON v.city_id = c.id
+  WHERE v.id = $1
+`;
+
+// City columns joined onto venue rows
+interface VenueCityColumns {
+  city_name: string;
+  state_province: string;
+  country: string;
+  city_coordinates?: GeoPoint;
+}
 
 /**
  * Repository for Venue entities
@@ -29,25 +68,95 @@ export class VenueRepository extends BaseRepository<Venue> {
     return builder.executePaginated<Venue>(page, limit);
   }
 
+  /**
+   * Find venues by city name (case-insensitive) with pagination.
+   * The city is resolved in a subquery, so this can run concurrently with a city lookup.
+   * Ascending name order breaks ties by ID, so pages line up with findByCityNameAfter.
+   * @param cityName City name
+   * @param params Optional query parameters
+   */
+  async findByCityName(cityName: string, params?: QueryParams): Promise<PaginatedResult<Venue>> {
+    const page = params?.page || 1;
+    const limit = params?.limit || 20;
+    
+    const builder = this.createQueryBuilder()
+      .where('city_id = (SELECT id FROM cities WHERE LOWER(name) = LOWER($1) ORDER BY id LIMIT 1)', cityName);
+    
+    if (params) {
+      builder.applyQueryParams(params);
+    }
+    if (params?.sort_by === 'name' && params.sort_dir?.toUpperCase() !== 'DESC') {
+      builder.orderBy(NAME_ORDER, 'ASC');
+    }
+    
+    return builder.executePaginated<Venue>(page, limit);
+  }
+
+  /**
+   * Find venues by city name after a cursor (keyset pagination in name order)
+   * @param cityName City name
+   * @param cursor Position of the last venue already returned
+   * @param limit Items per page
+   */
+  async findByCityNameAfter(cityName: string, cursor: VenueCursor, limit: number = 20): Promise<CursorPaginatedResult<Venue>> {
+    const builder = this.createQueryBuilder()
+      .where('venues.city_id = (SELECT id FROM cities WHERE LOWER(name) = LOWER($1) ORDER BY id LIMIT 1)', cityName);
+
+    return this.executeKeysetPage(builder, cursor, limit);
+  }
+
+  /**
+   * Run a venue list query as a keyset page ordered by (name, id).
+   * Seeks past the cursor through idx_venues_city_name_id instead of scanning
+   * and discarding OFFSET rows.
+   * @param builder Venue list query filtered to one city
+   * @param cursor Position of the last venue already returned
+   * @param limit Items per page
+   */
+  private async executeKeysetPage(
+    builder: QueryBuilder,
+    cursor: VenueCursor,
+    limit: number
+  ): Promise<CursorPaginatedResult<Venue>> {
+    builder.whereAfter(NAME_ORDER, [cursor.name, cursor.id]);
+    builder.orderBy(NAME_ORDER, 'ASC');
+
+    const { data, hasMore } = await builder.executeKeyset<Venue>(limit);
+    const last = data[data.length - 1];
+
+    return {
+      data,
+      limit,
+      next_cursor: hasMore && last ? encodeVenueCursor(last) : null
+    };
+  }
+
   /**
    * Find venues near a geographic point
    * @param point Geographic point (longitude, latitude)
    * @param radiusKm Radius in kilometers
    * @param limit Maximum number of results
    */
-  async findNearby(point: GeoPoint, radiusKm: number, limit: number = 20): Promise<Venue[]> {
-    // Use PostGIS ST_DWithin to find venues within the radius
+  async findNearby(point: GeoPoint, radiusKm: number, limit: number = 20): Promise<(Venue & { distance_km: number })[]> {
+    // Use PostGIS ST_DWithin to find venues within the radius, loading each
+    // venue's city in the same projection rather than per venue afterwards
     const builder = this.createQueryBuilder()
       .select([
         'venues.*',
-        'ST_Distance(venues.coordinates, ST_MakePoint($1, $2)::geometry) / 1000 AS distance_km'
+        'cities.name AS city_name',
+        'cities.state_province',
+        'cities.country',
+        'cities.coordinates AS city_coordinates',
+        `ST_Distance(${VENUE_GEOGRAPHY}, ${POINT_GEOGRAPHY}) / 1000 AS distance_km`
       ])
-      .where('ST_DWithin(venues.coordinates, ST_MakePoint($1, $2)::geometry, $3 * 1000)', 
+      .join('LEFT JOIN cities ON venues.city_id = cities.id')
+      .where(`ST_DWithin(${VENUE_GEOGRAPHY}, ${POINT_GEOGRAPHY}, $3 * 1000)`, 
         point.x, point.y, radiusKm)
-      .orderBy('distance_km', 'ASC')
+      .orderBy(NEAREST_FIRST, 'ASC')
       .limit(limit);
     
-    return builder.execute<Venue & { distance_km: number }>();
+    const venues = await builder.execute<Venue & VenueCityColumns & { distance_km: number }>();
+    return venues.map(venue => this.withCity(venue));
   }
 
   /**
@@ -68,25 +177,30 @@ export class VenueRepository extends BaseRepository<Venue> {
       builder.applyQueryParams(params);
     }
     
-    const venues = await builder.execute<Venue & { 
-      city_name: string;
-      state_province: string;
-      country: string;
-    }>();
+    const venues = await builder.execute<Venue & VenueCityColumns>();
     
     // Transform the result to include city object
-    return venues.map(venue => ({
+    return venues.map(venue => this.withCity(venue));
+  }
+
+  /**
+   * Nest the joined city columns of a venue row into a city object
+   * @param venue Venue row with city columns
+   */
+  private withCity<V extends Venue & VenueCityColumns>(venue: V): V {
+    return {
       ...venue,
       city: {
         id: venue.city_id,
         name: venue.city_name,
         state_province: venue.state_province,
         country: venue.country,
-        coordinates: { x: 0, y: 0 }, // We don't have city coordinates in this query
+        // City coordinates are only selected by some queries
+        coordinates: venue.city_coordinates || { x: 0, y: 0 },
         created_at: new Date(),
         updated_at: new Date()
       }
-    }));
+    };
   }
 
   /**
@@ -94,24 +208,12 @@ export class VenueRepository extends BaseRepository<Venue> {
    * @param id Venue ID
    */
   async findByIdWithCity(id: number): Promise<Venue | null> {
-    const query = `
-      SELECT 
-        v.*,
-        c.name AS city_name,
-        c.state_province,
-        c.country,
-        c.coordinates AS city_coordinates
-      FROM venues v
-      LEFT JOIN cities c ON v.city_id = c.id
-      WHERE v.id = $1
-    `;
-    
     const result = await QueryBuilder.raw<Venue & { 
       city_name: string;
       state_province: string;
       country: string;
       city_coordinates: GeoPoint;
-    }>(query, [id]);
+    }>(FIND_BY_ID_WITH_CITY_SQL, [id], 'venues_find_by_id_with_city');
     
     if (result.rows.length === 0) {
       return null;
@@ -140,13 +242,32 @@ export class VenueRepository extends BaseRepository<Venue> {
    * @param limit Maximum number of results
    */
   async searchByName(query: string, limit: number = 20): Promise<Venue[]> {
-    const builder = this.createQueryBuilder()
-      .where('name ILIKE $1', `%${query}%`)
+    const term = query.trim();
+    if (!term) {
+      return [];
+    }
+
+    const builder = this.whereNameMatches(this.createQueryBuilder(), 'name', term)
       .limit(limit);
     
     return builder.execute<Venue>();
   }
 
+  /**
+   * Filter a venue query by name. Terms long enough for the trigram index
+   * match anywhere in the name; shorter ones would match nearly every row
+   * that way, so they match as a prefix instead.
+   * @param builder Venue query
+   * @param column Venue name column
+   * @param term Trimmed, non-empty search term
+   */
+  private whereNameMatches(builder: QueryBuilder, column: string, term: string): QueryBuilder {
+    if (term.length < MIN_SUBSTRING_SEARCH_LENGTH) {
+      return builder.where(`LOWER(${column}) LIKE $1`, `${term.toLowerCase()}%`);
+    }
+    return builder.where(`${column} ILIKE $1`, `%${term}%`);
+  }
+
   /**
    * Get venue counts by city
    */
@@ -199,14 +320,14 @@ export class VenueRepository extends BaseRepository<Venue> {
         'cities.name AS city_name',
         'cities.state_province',
         'cities.country',
-        'ST_Distance(venues.coordinates, ST_MakePoint($1, $2)::geometry) / 1000 AS distance_km'
+        `ST_Distance(${VENUE_GEOGRAPHY}, ${POINT_GEOGRAPHY}) / 1000 AS distance_km`
       ]);
       
       // Add geographic radius filter if specified
       if (params.radius) {
         builder = builder.where(
-          'ST_DWithin(venues.coordinates, ST_MakePoint($1, $2)::geometry, $3 * 1000)',
-          params.lat, params.lon, params.radius
+          `ST_DWithin(${VENUE_GEOGRAPHY}, ${POINT_GEOGRAPHY}, $3 * 1000)`,
+          params.lon, params.lat, params.radius
         );
       }
     } else {
@@ -236,7 +357,7 @@ export class VenueRepository extends BaseRepository<Venue> {
     
     // Apply sorting - prioritize by prosper_rank and distance if available
     if (params.lat && params.lon && !params.sort_by) {
-      builder = builder.orderBy('distance_km', 'ASC');
+      builder = builder.orderBy(NEAREST_FIRST, 'ASC');
     } else if (!params.sort_by) {
       builder = builder.orderBy('venues.prosper_rank', 'DESC');
     } else {
@@ -262,6 +383,11 @@ export class VenueRepository extends BaseRepository<Venue> {
     searchTerm: string, 
     params?: QueryParams & { state_province?: string; country?: string }
   ): Promise<Venue[]> {
+    const term = searchTerm.trim();
+    if (!term) {
+      return [];
+    }
+
     let builder = this.createQueryBuilder()
       .join('LEFT JOIN cities ON venues.city_id = cities.id')
       .select([
@@ -269,8 +395,8 @@ export class VenueRepository extends BaseRepository<Venue> {
         'cities.name AS city_name',
         'cities.state_province',
         'cities.country'
-      ])
-      .where('venues.name ILIKE $1', `%${searchTerm}%`);
+      ]);
+    builder = this.whereNameMatches(builder, 'venues.name', term);
     
     // Add geographic filters
     if (params?.state_province) {
@@ -293,4 +419,45 @@ export class VenueRepository extends BaseRepository<Venue> {
       country: string;
     }>();
   }
-}
\ No newline at end of file
+
+  /**
+   * Create a venue and drop the cached per-region venue counts
+   * @param data Venue data
+   */
+  async create(data: Partial<Venue>): Promise<Venue> {
+    const venue = await super.create(data);
+    CityRepository.clearVenueCountsCache();
+    return venue;
+  }
+
+  /**
+   * Create many venues and drop the cached per-region venue counts
+   * @param rows Venue data
+   */
+  async createMany(rows: Partial<Venue>[]): Promise<Venue[]> {
+    const venues = await super.createMany(rows);
+    CityRepository.clearVenueCountsCache();
+    return venues;
+  }
+
+  /**
+   * Update a venue and drop the cached per-region venue counts
+   * @param id Venue ID
+   * @param data Updated venue data
+   */
+  async update(id: number, data: Partial<Venue>): Promise<Venue | null> {
+    const venue = await super.update(id, data);
+    CityRepository.clearVenueCountsCache();
+    return venue;
+  }
+
+  /**
+   * Delete a venue and drop the cached per-region venue counts
+   * @param id Venue ID
+   */
+  async delete(id: number): Promise<boolean> {
+    const deleted = await super.delete(id);
+    CityRepository.clearVenueCountsCache();
+    return deleted;
+  }
+}
@@ -21,14 +21,25 @@ import {
   createOptimizedGeoQuery
 } from './query-optimizers';
 
-// Elasticsearch client configuration
-const client = new Client({
-  node: process.env.ELASTICSEARCH_URL || 'http://localhost:9200',
-  auth: process.env.ELASTICSEARCH_AUTH ? {
-    username: process.env.ELASTICSEARCH_USERNAME || 'elastic',
-    password: process.env.ELASTICSEARCH_PASSWORD || 'changeme'
-  } : undefined,
-});
+// Elasticsearch client, created on first use so importing this module
+// (e.g. from health checks) doesn't build a connection pool up front
+let client: Client | null = null;
+
+/**
+ * Get the shared Elasticsearch client, creating it on first call
+ */
+function getClient(): Client {
+  if (!client) {
+    client = new Client({
+      node: process.env.ELASTICSEARCH_URL || 'http://localhost:9200',
+      auth: process.env.ELASTICSEARCH_AUTH ? {
+        username: process.env.ELASTICSEARCH_USERNAME || 'elastic',
+        password: process.env.ELASTICSEARCH_PASSWORD || 'changeme'
+      } : undefined,
+    });
+  }
+  return client;
+}
 
 // Index names
 export const INDICES = {
@@ -115,10 +126,8 @@ export interface CategorizedSearchResults {
  * Elasticsearch service class for managing search operations
  */
 export class ElasticsearchService {
-  private client: Client;
-
-  constructor() {
-    this.client = client;
+  private get client(): Client {
+    return getClient();
   }
 
   /**
@@ -55,14 +55,15 @@ export class IndexingService {
     let hasMore = true;
 
     while (hasMore) {
-      const venues = await this.venueRepo.findAll({ page, limit });
+      // Cities come back in the same JOIN query rather than one lookup per venue
+      const venues = await this.venueRepo.findWithCity({ page, limit, sort_by: 'venues.id' });
       
-      if (venues.data.length === 0) {
+      if (venues.length === 0) {
         hasMore = false;
         break;
       }
 
-      const operations = venues.data.map(venue => ({
+      const operations = venues.map(venue => ({
         index: 'venues',
         id: venue.id.toString(),
         document: this.transformVenueForIndex(venue)
@@ -70,9 +71,9 @@ export class IndexingService {
 
       await elasticsearchService.bulkIndex(operations);
       
-      console.log(`Synced ${venues.data.length} venues (page ${page})`);
+      console.log(`Synced ${venues.length} venues (page ${page})`);
       page++;
-      hasMore = venues.data.length === limit;
+      hasMore = venues.length === limit;
     }
   }
 
@@ -152,7 +153,7 @@ export class IndexingService {
    * Index a single venue
    */
   async indexVenue(venueId: number): Promise<void> {
-    const venue = await this.venueRepo.findById(venueId);
+    const venue = await this.venueRepo.findByIdWithCity(venueId);
     if (venue && venue.city) {
       await elasticsearchService.indexVenue(venue as Venue & { city: City });
     }
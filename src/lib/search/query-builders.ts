@@ -389,12 +389,18 @@ export class EventQueryBuilder extends SearchQueryBuilder {
     } = params;
 
     const filters: any[] = [];
-    const now = new Date();
-    const futureDate = new Date();
-    futureDate.setDate(now.getDate() + days_ahead);
 
-    // Date range for upcoming events
-    filters.push(this.buildDateRangeFilter('event_datetime', now, futureDate)!);
+    // Date range for upcoming events, resolved by Elasticsearch date math rather
+    // than a client timestamp. Rounding to the minute keeps the filter identical
+    // across requests, so Elasticsearch can reuse its cached result.
+    filters.push({
+      range: {
+        event_datetime: {
+          gte: 'now/m',
+          lte: `now+${days_ahead}d/m`
+        }
+      }
+    });
 
     // Venue filter
     if (venue_id) {
@@ -10,8 +10,9 @@
  * @returns Optimized query object
  */
 export function optimizeSearchQuery(query: any, expectedResultSize: number = 100): any {
-  // Create a deep copy of the query to avoid modifying the original
-  const optimizedQuery = JSON.parse(JSON.stringify(query));
+  // Serialize once: the string serves both the deep copy and the cacheability check
+  const queryStr = JSON.stringify(query);
+  const optimizedQuery = JSON.parse(queryStr);
   
   // Add track_total_hits optimization based on expected result size
   if (expectedResultSize < 10000) {
@@ -26,7 +27,7 @@ export function optimizeSearchQuery(query: any, expectedResultSize: number = 100
   optimizedQuery.min_score = 0.1; // Filter out very low-scoring results
   
   // Add request cache for appropriate queries
-  if (isQueryCacheable(optimizedQuery)) {
+  if (isQueryCacheable(optimizedQuery, queryStr)) {
     optimizedQuery.request_cache = true;
   }
   
@@ -45,16 +46,16 @@ export function optimizeSearchQuery(query: any, expectedResultSize: number = 100
 /**
  * Check if a query is cacheable
  * @param query Query object to check
+ * @param queryStr Serialized form of the query
  * @returns Whether the query can be cached
  */
-function isQueryCacheable(query: any): boolean {
+function isQueryCacheable(query: any, queryStr: string): boolean {
   // Don't cache queries with random scoring
   if (query.query?.function_score?.random_score) {
     return false;
   }
   
   // Don't cache queries with now() or other date math
-  const queryStr = JSON.stringify(query);
   if (queryStr.includes('now')) {
     return false;
   }
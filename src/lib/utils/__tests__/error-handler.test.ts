@@ -1,11 +1,13 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { ErrorHandler, AppError, ErrorType, GracefulDegradation } from '../error-handler';
 import { NextResponse } from 'next/server';
+import { logger } from '../logger';
 
 // Mock the logger
 vi.mock('../logger', () => ({
   logger: {
-    error: vi.fn()
+    error: vi.fn(),
+    warn: vi.fn()
   }
 }));
 
@@ -52,6 +54,18 @@ describe('ErrorHandler', () => {
       expect(response.status).toBe(404);
     });
 
+    it('should log operational client errors as warnings without a stack', () => {
+      const appError = new AppError('Venue not found', ErrorType.NOT_FOUND, 404);
+      ErrorHandler.handleError(appError, 'req-123');
+
+      expect(logger.warn).toHaveBeenCalledWith(
+        'Venue not found',
+        { type: ErrorType.NOT_FOUND, statusCode: 404 },
+        'req-123'
+      );
+      expect(logger.error).not.toHaveBeenCalled();
+    });
+
     it('should handle Zod validation errors', () => {
       const zodError = {
         issues: [
@@ -5,7 +5,7 @@ describe('PerformanceMonitor', () => {
   beforeEach(() => {
     vi.clearAllMocks();
     // Clear metrics before each test
-    (PerformanceMonitor as any).metrics = [];
+    PerformanceMonitor.reset();
   });
 
   describe('recordMetric', () => {
@@ -51,6 +51,22 @@ describe('PerformanceMonitor', () => {
       expect(metrics[0].value).toBe(10); // First kept metric
       expect(metrics[metrics.length - 1].value).toBe(maxMetrics + 9); // Last metric
     });
+
+    it('should export production metrics in batches', () => {
+      vi.stubEnv('NODE_ENV', 'production');
+      const logSpy = vi.spyOn(console, 'log').mockImplementation(() => {});
+
+      PerformanceMonitor.recordMetric('batch.metric', 1);
+      PerformanceMonitor.recordMetric('batch.metric', 2);
+      expect(logSpy).not.toHaveBeenCalled();
+
+      PerformanceMonitor.flushMetrics();
+      expect(logSpy).toHaveBeenCalledTimes(1);
+      expect(logSpy.mock.calls[0][0].split('\n')).toHaveLength(2);
+
+      logSpy.mockRestore();
+      vi.unstubAllEnvs();
+    });
   });
 
   describe('recordApiResponseTime', () => {
@@ -70,6 +86,29 @@ describe('PerformanceMonitor', () => {
         }
       }));
     });
+
+    it('should key ID-bearing paths by their route template', () => {
+      PerformanceMonitor.recordApiResponseTime('/api/events/123', 'GET', 200, 100);
+      PerformanceMonitor.recordApiResponseTime('/api/events/456', 'GET', 200, 300);
+
+      const metrics = PerformanceMonitor.getMetrics('api.response_time');
+      expect(metrics.map(m => m.tags?.endpoint)).toEqual(['/api/events/[id]', '/api/events/[id]']);
+      expect(PerformanceMonitor.getAverageResponseTime('/api/events/[id]')).toBe(200);
+      expect(PerformanceMonitor.getAverageResponseTime('/api/events/789')).toBe(200);
+    });
+
+    it('should warn once when the endpoint cap is reached', () => {
+      const warnSpy = vi.spyOn(console, 'warn').mockImplementation(() => {});
+      const maxEndpoints = (PerformanceMonitor as any).MAX_TRACKED_ENDPOINTS;
+
+      for (let i = 0; i < maxEndpoints + 10; i++) {
+        PerformanceMonitor.recordApiResponseTime(`/api/endpoint-${i}`, 'GET', 200, 100);
+      }
+
+      expect(warnSpy).toHaveBeenCalledTimes(1);
+      expect(warnSpy.mock.calls[0][0]).toContain(`Tracking ${maxEndpoints} endpoints`);
+      warnSpy.mockRestore();
+    });
   });
 
   describe('recordDatabaseQuery', () => {
@@ -163,6 +202,31 @@ describe('PerformanceMonitor', () => {
       const average = PerformanceMonitor.getAverageResponseTime('/api/nonexistent');
       expect(average).toBe(0);
     });
+
+    it('should keep endpoint averages after raw metrics roll over', () => {
+      const maxMetrics = (PerformanceMonitor as any).MAX_METRICS;
+      for (let i = 0; i < maxMetrics; i++) {
+        PerformanceMonitor.recordMetric('filler.metric', i);
+      }
+
+      expect(PerformanceMonitor.getMetrics('api.response_time')).toHaveLength(0);
+      expect(PerformanceMonitor.getAverageResponseTime('/api/test')).toBe(150);
+    });
+
+    it('should average only the most recent samples', () => {
+      const window = (PerformanceMonitor as any).RESPONSE_WINDOW;
+      for (let i = 0; i < window; i++) {
+        PerformanceMonitor.recordApiResponseTime('/api/test', 'GET', 200, 50);
+      }
+
+      expect(PerformanceMonitor.getAverageResponseTime('/api/test')).toBe(50);
+    });
+
+    it('should filter by time using recorded metrics', () => {
+      const since = new Date(Date.now() - 1000);
+      const average = PerformanceMonitor.getAverageResponseTime('/api/other', since);
+      expect(average).toBe(300);
+    });
   });
 });
 
@@ -171,6 +235,7 @@ describe('HealthMonitor', () => {
     vi.clearAllMocks();
     // Clear registered health checks
     (HealthMonitor as any).healthChecks.clear();
+    HealthMonitor.clearHealthCache();
   });
 
   describe('registerHealthCheck', () => {
@@ -284,6 +349,54 @@ describe('HealthMonitor', () => {
     });
   });
 
+  describe('getCachedSystemHealth', () => {
+    it('should reuse the snapshot within the TTL', async () => {
+      const healthyCheck = vi.fn().mockResolvedValue({
+        service: 'test-service',
+        status: 'healthy' as const
+      });
+      
+      HealthMonitor.registerHealthCheck('test-service', healthyCheck);
+      
+      const first = await HealthMonitor.getCachedSystemHealth();
+      const second = await HealthMonitor.getCachedSystemHealth();
+      
+      expect(second).toBe(first);
+      expect(healthyCheck).toHaveBeenCalledTimes(1);
+    });
+
+    it('should share a single run between concurrent callers', async () => {
+      const healthyCheck = vi.fn().mockResolvedValue({
+        service: 'test-service',
+        status: 'healthy' as const
+      });
+      
+      HealthMonitor.registerHealthCheck('test-service', healthyCheck);
+      
+      await Promise.all([
+        HealthMonitor.getCachedSystemHealth(),
+        HealthMonitor.getCachedSystemHealth(),
+        HealthMonitor.getCachedSystemHealth()
+      ]);
+      
+      expect(healthyCheck).toHaveBeenCalledTimes(1);
+    });
+
+    it('should run the checks again once the TTL has expired', async () => {
+      const healthyCheck = vi.fn().mockResolvedValue({
+        service: 'test-service',
+        status: 'healthy' as const
+      });
+      
+      HealthMonitor.registerHealthCheck('test-service', healthyCheck);
+      
+      await HealthMonitor.getCachedSystemHealth(0);
+      await HealthMonitor.getCachedSystemHealth(0);
+      
+      expect(healthyCheck).toHaveBeenCalledTimes(2);
+    });
+  });
+
   describe('createExternalApiHealthCheck', () => {
     beforeEach(() => {
       global.fetch = vi.fn();
@@ -392,12 +505,66 @@ describe('RequestTracker', () => {
     });
   });
 
+  describe('sampling', () => {
+    afterEach(() => {
+      RequestTracker.setSampleRate(1);
+    });
+
+    it('should skip tracking for unsampled requests', () => {
+      RequestTracker.setSampleRate(0);
+
+      RequestTracker.startRequest('unsampled', '/api/test', 'GET');
+      expect(RequestTracker.getActiveRequestsCount()).toBe(0);
+
+      // Ending an untracked request is a no-op
+      RequestTracker.endRequest('unsampled', 200);
+      expect(RequestTracker.getActiveRequestsCount()).toBe(0);
+    });
+
+    it('should count unsampled requests without recording them', () => {
+      PerformanceMonitor.reset();
+      RequestTracker.setSampleRate(0);
+      const before = RequestTracker.getUnsampledCount();
+
+      RequestTracker.startRequest('unsampled', '/api/test', 'GET');
+      RequestTracker.endRequest('unsampled', 200);
+
+      expect(RequestTracker.getUnsampledCount()).toBe(before + 1);
+      expect(PerformanceMonitor.getMetrics('api.response_time')).toHaveLength(0);
+    });
+
+    it('should record a sampled request once', () => {
+      PerformanceMonitor.reset();
+
+      RequestTracker.startRequest('sampled', '/api/test', 'GET');
+      RequestTracker.endRequest('sampled', 200);
+
+      expect(PerformanceMonitor.getMetrics('api.response_time')).toHaveLength(1);
+    });
+  });
+
+  describe('requestIdOf', () => {
+    it('should reuse the request ID set by the middleware', () => {
+      const request = new Request('http://localhost/api/test', {
+        headers: { 'x-request-id': 'middleware-id' }
+      });
+
+      expect(RequestTracker.requestIdOf(request)).toBe('middleware-id');
+    });
+
+    it('should generate an ID when the middleware did not run', () => {
+      const request = new Request('http://localhost/api/test');
+
+      expect(RequestTracker.requestIdOf(request)).toMatch(/^[0-9a-f-]{36}$/);
+    });
+  });
+
   describe('cleanupStaleRequests', () => {
     it('should remove stale requests', () => {
       const activeRequests = (RequestTracker as any).activeRequests;
       
       // Add a stale request (older than 5 minutes)
-      const staleTime = Date.now() - (6 * 60 * 1000); // 6 minutes ago
+      const staleTime = performance.now() - (6 * 60 * 1000); // 6 minutes ago
       activeRequests.set('stale-request', {
         startTime: staleTime,
         endpoint: '/api/stale',
@@ -0,0 +1,19 @@
+import { describe, it, expect } from 'vitest';
+import { decodeEventCursor, encodeEventCursor, eventSeekCondition } from '../pagination';
+
+describe('event cursors', () => {
+  it('should round-trip an event position', () => {
+    const position = { event_datetime: new Date('2030-06-01T19:30:00.123Z'), id: 42 };
+
+    expect(decodeEventCursor(encodeEventCursor(position))).toEqual(position);
+  });
+
+  it('should seek from the cursor event\'s stored timestamp', () => {
+    // The cursor only carries milliseconds; comparing against it directly would
+    // repeat an event whose stored time has sub-millisecond precision
+    expect(eventSeekCondition('e', 3, 4)).toBe(
+      '(e.event_datetime, e.id) > (COALESCE((SELECT cursor_event.event_datetime FROM events cursor_event ' +
+      'WHERE cursor_event.id = $3), $4), $3)'
+    );
+  });
+});
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { createHash } from 'crypto';
 
 /**
  * Cache control options for API responses
@@ -94,6 +95,74 @@ export const CACHE_CONFIGS = {
   },
 };
 
+/**
+ * Cache configuration for idempotent public GETs (regions, city venues, venue detail)
+ */
+export const CACHEABLE_GET: CacheControlOptions = {
+  maxAge: 60, // 1 minute
+  staleWhileRevalidate: 300, // 5 minutes
+  public: true,
+  immutable: false,
+};
+
+/**
+ * Generate a strong ETag from a serialized response body
+ * @param body Serialized response body
+ * @returns Quoted ETag value
+ */
+export function generateBodyETag(body: string): string {
+  return `"${createHash('sha1').update(body).digest('hex').slice(0, 16)}"`;
+}
+
+/**
+ * Check whether an If-None-Match header matches the given ETag
+ * @param ifNoneMatch If-None-Match header value
+ * @param etag Current ETag
+ */
+function etagMatches(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  if (ifNoneMatch.trim() === '*') return true;
+
+  return ifNoneMatch
+    .split(',')
+    .some(tag => tag.trim().replace(/^W\//, '') === etag);
+}
+
+/**
+ * Build a JSON response with Cache-Control and an ETag derived from the body.
+ * Returns an empty 304 when the client's If-None-Match already matches.
+ * @param request NextRequest object
+ * @param body Response payload
+ * @param options Cache control options
+ * @returns 200 JSON response or 304 Not Modified
+ */
+export function cachedJsonResponse(
+  request: NextRequest,
+  body: unknown,
+  options: CacheControlOptions = CACHEABLE_GET
+): NextResponse {
+  // Serialize once; the same string feeds both the hash and the response
+  const json = JSON.stringify(body);
+  const etag = generateBodyETag(json);
+  const cacheControl = generateCacheControlHeader(options);
+
+  if (etagMatches(request.headers.get('if-none-match'), etag)) {
+    return new NextResponse(null, {
+      status: 304,
+      headers: { 'ETag': etag, 'Cache-Control': cacheControl }
+    });
+  }
+
+  return new NextResponse(json, {
+    status: 200,
+    headers: {
+      'Content-Type': 'application/json',
+      'ETag': etag,
+      'Cache-Control': cacheControl
+    }
+  });
+}
+
 /**
  * Determine cache config based on request path
  * @param path Request path
@@ -1,16 +1,46 @@
+// Formatters are built once at module load; toLocaleDateString/toLocaleTimeString
+// construct a new Intl.DateTimeFormat on every call.
+const DATE_TIME_FORMAT = new Intl.DateTimeFormat('en-US', {
+  weekday: 'short',
+  month: 'short',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: '2-digit'
+});
+
+const DATE_ONLY_FORMAT = new Intl.DateTimeFormat('en-US', {
+  month: 'short',
+  day: 'numeric',
+  year: 'numeric'
+});
+
+const TIME_ONLY_FORMAT = new Intl.DateTimeFormat('en-US', {
+  hour: 'numeric',
+  minute: '2-digit'
+});
+
+const SHORT_MONTH_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short' });
+
+const EVENT_DATE_FORMAT = new Intl.DateTimeFormat('en-US', {
+  weekday: 'long',
+  year: 'numeric',
+  month: 'long',
+  day: 'numeric'
+});
+
+const EVENT_TIME_FORMAT = new Intl.DateTimeFormat('en-US', {
+  hour: 'numeric',
+  minute: '2-digit',
+  hour12: true
+});
+
 /**
  * Format a date to a human-readable string
  * @param date Date to format
  * @returns Formatted date string (e.g., "Fri, Jan 15 at 8:00 PM")
  */
 export function formatDate(date: Date): string {
-  return date.toLocaleDateString('en-US', {
-    weekday: 'short',
-    month: 'short',
-    day: 'numeric',
-    hour: 'numeric',
-    minute: '2-digit'
-  });
+  return DATE_TIME_FORMAT.format(date);
 }
 
 /**
@@ -19,11 +49,7 @@ export function formatDate(date: Date): string {
  * @returns Formatted date string (e.g., "Jan 15, 2023")
  */
 export function formatDateOnly(date: Date): string {
-  return date.toLocaleDateString('en-US', {
-    month: 'short',
-    day: 'numeric',
-    year: 'numeric'
-  });
+  return DATE_ONLY_FORMAT.format(date);
 }
 
 /**
@@ -32,10 +58,25 @@ export function formatDateOnly(date: Date): string {
  * @returns Formatted time string (e.g., "8:00 PM")
  */
 export function formatTimeOnly(date: Date): string {
-  return date.toLocaleTimeString('en-US', {
-    hour: 'numeric',
-    minute: '2-digit'
-  });
+  return TIME_ONLY_FORMAT.format(date);
+}
+
+/**
+ * Format an event date in long form
+ * @param date Date to format
+ * @returns Formatted date string (e.g., "Friday, January 15, 2023")
+ */
+export function formatEventDate(date: Date): string {
+  return EVENT_DATE_FORMAT.format(date);
+}
+
+/**
+ * Format an event start time
+ * @param date Date to format
+ * @returns Formatted time string (e.g., "8:00 PM")
+ */
+export function formatEventTime(date: Date): string {
+  return EVENT_TIME_FORMAT.format(date);
 }
 
 /**
@@ -90,8 +131,8 @@ export function getRelativeTimeString(date: Date): string {
  * @returns Formatted date range string
  */
 export function formatDateRange(startDate: Date, endDate: Date): string {
-  const startMonth = startDate.toLocaleDateString('en-US', { month: 'short' });
-  const endMonth = endDate.toLocaleDateString('en-US', { month: 'short' });
+  const startMonth = SHORT_MONTH_FORMAT.format(startDate);
+  const endMonth = SHORT_MONTH_FORMAT.format(endDate);
   const startDay = startDate.getDate();
   const endDay = endDate.getDate();
   const startYear = startDate.getFullYear();
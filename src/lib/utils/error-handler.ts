@@ -151,7 +151,18 @@ export class ErrorHandler {
    */
   private static logError(error: unknown, requestId?: string): void {
     try {
-      if (error instanceof AppError) {
+      if (error instanceof AppError && error.isOperational && error.statusCode < 500) {
+        // Expected client errors (404, 400, 401...) don't need a stack trace
+        logger.warn(
+          error.message,
+          {
+            type: error.type,
+            statusCode: error.statusCode,
+            ...error.context
+          },
+          requestId
+        );
+      } else if (error instanceof AppError) {
         logger.error(
           error.message,
           error,
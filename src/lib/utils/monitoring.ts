@@ -2,6 +2,8 @@
  * Application monitoring and metrics collection
  */
 
+import { randomUUID } from 'crypto';
+
 export interface MetricData {
   name: string;
   value: number;
@@ -29,12 +31,33 @@ export interface SystemHealth {
   };
 }
 
+// Path segments that are record IDs: integers, UUIDs and long hex strings
+const ID_SEGMENT = /^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24,})$/i;
+
+// Fixed window of recent response times with a running sum
+interface ResponseTimeStats {
+  samples: Float64Array;
+  next: number;
+  count: number;
+  runningSum: number;
+}
+
 /**
  * Performance monitoring utilities
  */
 export class PerformanceMonitor {
   private static metrics: MetricData[] = [];
+  private static metricsStart = 0; // Index of the oldest metric once the buffer is full
   private static readonly MAX_METRICS = 1000; // Keep last 1000 metrics in memory
+  private static readonly RESPONSE_WINDOW = 100; // Samples per endpoint for averages
+  private static responseStats: Map<string, ResponseTimeStats> = new Map();
+  private static readonly ALL_ENDPOINTS = '*';
+  private static readonly MAX_TRACKED_ENDPOINTS = 500; // Bound per-endpoint stats after ID normalization
+  private static endpointCapWarned = false;
+  private static pendingExport: MetricData[] = [];
+  private static exportTimer: ReturnType<typeof setTimeout> | null = null;
+  private static readonly EXPORT_BATCH_SIZE = 1024; // Flush early once this many metrics are queued
+  private static readonly EXPORT_INTERVAL_MS = 1000;
 
   /**
    * Record a performance metric
@@ -48,11 +71,13 @@ export class PerformanceMonitor {
       unit
     };
 
-    this.metrics.push(metric);
-
-    // Keep only recent metrics to prevent memory leaks
-    if (this.metrics.length > this.MAX_METRICS) {
-      this.metrics = this.metrics.slice(-this.MAX_METRICS);
+    // Keep only recent metrics to prevent memory leaks; once full, overwrite
+    // the oldest slot instead of copying the buffer on every record
+    if (this.metrics.length < this.MAX_METRICS) {
+      this.metrics.push(metric);
+    } else {
+      this.metrics[this.metricsStart] = metric;
+      this.metricsStart = (this.metricsStart + 1) % this.MAX_METRICS;
     }
 
     // In production, send to monitoring service (e.g., DataDog, New Relic, CloudWatch)
@@ -65,11 +90,53 @@ export class PerformanceMonitor {
    * Record API response time
    */
   static recordApiResponseTime(endpoint: string, method: string, statusCode: number, responseTime: number): void {
+    endpoint = this.normalizeEndpoint(endpoint);
     this.recordMetric('api.response_time', responseTime, {
       endpoint,
       method,
       status_code: statusCode.toString()
     }, 'ms');
+
+    // Maintain running sums so averages don't rescan the metric buffer
+    this.updateResponseStats(this.ALL_ENDPOINTS, responseTime);
+    this.updateResponseStats(endpoint, responseTime);
+  }
+
+  /**
+   * Collapse ID segments into a route template, so /api/events/123 and
+   * /api/events/456 share the /api/events/[id] stats instead of each taking a slot
+   */
+  private static normalizeEndpoint(endpoint: string): string {
+    return endpoint
+      .split('/')
+      .map(segment => ID_SEGMENT.test(segment) ? '[id]' : segment)
+      .join('/');
+  }
+
+  /**
+   * Add a response time sample to an endpoint's recent window
+   */
+  private static updateResponseStats(key: string, responseTime: number): void {
+    let stats = this.responseStats.get(key);
+    if (!stats) {
+      if (this.responseStats.size >= this.MAX_TRACKED_ENDPOINTS) {
+        if (!this.endpointCapWarned) {
+          this.endpointCapWarned = true;
+          console.warn(
+            `Tracking ${this.MAX_TRACKED_ENDPOINTS} endpoints; response times for new endpoints such as ${key} are not averaged`
+          );
+        }
+        return;
+      }
+      stats = { samples: new Float64Array(this.RESPONSE_WINDOW), next: 0, count: 0, runningSum: 0 };
+      this.responseStats.set(key, stats);
+    }
+
+    // Replace the oldest sample and adjust the sum by the difference
+    stats.runningSum += responseTime - stats.samples[stats.next];
+    stats.samples[stats.next] = responseTime;
+    stats.next = (stats.next + 1) % this.RESPONSE_WINDOW;
+    if (stats.count < this.RESPONSE_WINDOW) stats.count++;
   }
 
   /**
@@ -98,23 +165,33 @@ export class PerformanceMonitor {
    * Get recent metrics for analysis
    */
   static getMetrics(name?: string, since?: Date): MetricData[] {
-    let filteredMetrics = this.metrics;
-
-    if (name) {
-      filteredMetrics = filteredMetrics.filter(m => m.name === name);
+    const total = this.metrics.length;
+    const result: MetricData[] = [];
+
+    // Walk the ring buffer oldest first and filter in the same pass,
+    // rather than copying it into order and then filtering each criterion
+    for (let i = 0; i < total; i++) {
+      const metric = this.metrics[(this.metricsStart + i) % total];
+      if (name && metric.name !== name) continue;
+      if (since && metric.timestamp < since) continue;
+      result.push(metric);
     }
 
-    if (since) {
-      filteredMetrics = filteredMetrics.filter(m => m.timestamp >= since);
-    }
-
-    return filteredMetrics;
+    return result;
   }
 
   /**
-   * Calculate average response time for an endpoint
+   * Calculate average response time for an endpoint.
+   * Without `since`, averages the endpoint's last RESPONSE_WINDOW samples.
    */
   static getAverageResponseTime(endpoint?: string, since?: Date): number {
+    if (endpoint) endpoint = this.normalizeEndpoint(endpoint);
+    // Without a time window, read the running sum in O(1)
+    if (!since) {
+      const stats = this.responseStats.get(endpoint ?? this.ALL_ENDPOINTS);
+      return stats && stats.count > 0 ? stats.runningSum / stats.count : 0;
+    }
+
     const metrics = this.getMetrics('api.response_time', since);
     const filteredMetrics = endpoint 
       ? metrics.filter(m => m.tags?.endpoint === endpoint)
@@ -127,12 +204,52 @@ export class PerformanceMonitor {
   }
 
   /**
-   * Send metric to external monitoring service
+   * Clear recorded metrics and response time totals
+   */
+  static reset(): void {
+    this.metrics = [];
+    this.metricsStart = 0;
+    this.responseStats.clear();
+    this.endpointCapWarned = false;
+    this.pendingExport = [];
+    if (this.exportTimer) {
+      clearTimeout(this.exportTimer);
+      this.exportTimer = null;
+    }
+  }
+
+  /**
+   * Queue a metric for the external monitoring service.
+   * Metrics are exported in batches so the request path never waits on the write.
    */
   private static sendToMonitoringService(metric: MetricData): void {
+    this.pendingExport.push(metric);
+
+    if (this.pendingExport.length >= this.EXPORT_BATCH_SIZE) {
+      this.flushMetrics();
+    } else if (!this.exportTimer) {
+      this.exportTimer = setTimeout(() => this.flushMetrics(), this.EXPORT_INTERVAL_MS);
+      // Don't keep the process alive just to export metrics
+      this.exportTimer.unref?.();
+    }
+  }
+
+  /**
+   * Export all queued metrics in one write
+   */
+  static flushMetrics(): void {
+    if (this.exportTimer) {
+      clearTimeout(this.exportTimer);
+      this.exportTimer = null;
+    }
+    if (this.pendingExport.length === 0) return;
+
+    const batch = this.pendingExport;
+    this.pendingExport = [];
+
     // Implementation would depend on the monitoring service
     // Examples: DataDog, New Relic, CloudWatch, Prometheus
-    console.log('[METRIC]', JSON.stringify(metric));
+    console.log(batch.map(metric => `[METRIC] ${JSON.stringify(metric)}`).join('\n'));
   }
 }
 
@@ -141,6 +258,9 @@ export class PerformanceMonitor {
  */
 export class HealthMonitor {
   private static healthChecks: Map<string, () => Promise<HealthCheckResult>> = new Map();
+  private static readonly HEALTH_CACHE_TTL_MS = 5000; // Reuse a health snapshot for 5 seconds
+  private static cachedHealth: { health: SystemHealth; expiresAt: number } | null = null;
+  private static pendingHealth: Promise<SystemHealth> | null = null;
 
   /**
    * Register a health check for a service
@@ -200,6 +320,38 @@ export class HealthMonitor {
     };
   }
 
+  /**
+   * Return a recent system health snapshot, running the checks at most once per TTL.
+   * Concurrent callers share a single in-flight run, so frequent probes of the
+   * health endpoint don't each hit the database and Elasticsearch.
+   */
+  static async getCachedSystemHealth(ttlMs: number = this.HEALTH_CACHE_TTL_MS): Promise<SystemHealth> {
+    const now = Date.now();
+    if (this.cachedHealth && this.cachedHealth.expiresAt > now) {
+      return this.cachedHealth.health;
+    }
+
+    if (!this.pendingHealth) {
+      this.pendingHealth = this.getSystemHealth()
+        .then(health => {
+          this.cachedHealth = { health, expiresAt: Date.now() + ttlMs };
+          return health;
+        })
+        .finally(() => {
+          this.pendingHealth = null;
+        });
+    }
+
+    return this.pendingHealth;
+  }
+
+  /**
+   * Drop the cached health snapshot so the next call runs the checks again
+   */
+  static clearHealthCache(): void {
+    this.cachedHealth = null;
+  }
+
   /**
    * Database health check
    */
@@ -207,15 +359,22 @@ export class HealthMonitor {
     const startTime = Date.now();
     
     try {
-      const { testConnection } = await import('../db');
+      const { testConnection, getPoolStats } = await import('../db');
       const result = await testConnection();
       const responseTime = Date.now() - startTime;
+      const pool = getPoolStats();
+
+      // Requests queueing for a connection mean the pool is saturated
+      let status: HealthCheckResult['status'] = result.success ? 'healthy' : 'unhealthy';
+      if (status === 'healthy' && pool.waiting > 0) {
+        status = 'degraded';
+      }
 
       return {
         service: 'database',
-        status: result.success ? 'healthy' : 'unhealthy',
+        status,
         responseTime,
-        details: result
+        details: { ...result, pool }
       };
     } catch (error) {
       return {
@@ -295,30 +454,69 @@ export class HealthMonitor {
 }
 
 /**
- * Request tracking middleware utilities
+ * Parse a sample rate setting, defaulting to tracking every request
+ * @param value Raw setting value
+ */
+function parseSampleRate(value: string | undefined): number {
+  const rate = parseFloat(value || '');
+  return isNaN(rate) ? 1 : Math.min(Math.max(rate, 0), 1);
+}
+
+/**
+ * Request tracking middleware utilities.
+ * Start times come from the monotonic performance clock, so durations are
+ * unaffected by wall-clock adjustments.
  */
 export class RequestTracker {
   private static activeRequests: Map<string, { startTime: number; endpoint: string; method: string }> = new Map();
+  private static sampleRate = parseSampleRate(process.env.MONITOR_SAMPLE_RATE);
+  private static unsampledCount = 0;
 
   /**
-   * Start tracking a request
+   * Set the fraction of requests that are tracked (0 to 1)
+   * @param rate Sample rate; 1 tracks every request
+   */
+  static setSampleRate(rate: number): void {
+    this.sampleRate = Math.min(Math.max(rate, 0), 1);
+  }
+
+  /**
+   * Get the ID the middleware assigned to a request, so tracking, logs and
+   * error responses share the ID sent back in x-request-id.
+   * Paths the middleware skips get a fresh ID.
+   */
+  static requestIdOf(request: Request): string {
+    return request.headers.get('x-request-id') || randomUUID();
+  }
+
+  /**
+   * Start tracking a request.
+   * Only a MONITOR_SAMPLE_RATE fraction of requests is tracked; the rest only
+   * bump a counter, and endRequest ignores them, so their response time is
+   * never recorded.
    */
   static startRequest(requestId: string, endpoint: string, method: string): void {
+    if (this.sampleRate < 1 && Math.random() >= this.sampleRate) {
+      this.unsampledCount++;
+      return;
+    }
+
     this.activeRequests.set(requestId, {
-      startTime: Date.now(),
+      startTime: performance.now(),
       endpoint,
       method
     });
   }
 
   /**
-   * End tracking a request and record metrics
+   * End tracking a request and record its response time.
+   * This is the only place tracked routes record api.response_time.
    */
   static endRequest(requestId: string, statusCode: number): void {
     const request = this.activeRequests.get(requestId);
     if (!request) return;
 
-    const duration = Date.now() - request.startTime;
+    const duration = performance.now() - request.startTime;
     
     PerformanceMonitor.recordApiResponseTime(
       request.endpoint,
@@ -331,10 +529,17 @@ export class RequestTracker {
 
     // Log slow requests
     if (duration > 1000) { // Log requests slower than 1 second
-      console.warn(`Slow request detected: ${request.method} ${request.endpoint} took ${duration}ms`);
+      console.warn(`Slow request detected: ${request.method} ${request.endpoint} took ${Math.round(duration)}ms`);
     }
   }
 
+  /**
+   * Get the number of requests skipped by sampling
+   */
+  static getUnsampledCount(): number {
+    return this.unsampledCount;
+  }
+
   /**
    * Get currently active requests count
    */
@@ -343,16 +548,17 @@ export class RequestTracker {
   }
 
   /**
-   * Clean up stale request tracking (requests older than 5 minutes)
+   * Clean up stale request tracking (requests older than 5 minutes).
+   * The map iterates in insertion (start time) order, so the sweep stops at the
+   * first request that is still fresh instead of walking every active request.
    */
   static cleanupStaleRequests(): void {
-    const fiveMinutesAgo = Date.now() - (5 * 60 * 1000);
+    const fiveMinutesAgo = performance.now() - (5 * 60 * 1000);
     
     for (const [requestId, request] of this.activeRequests) {
-      if (request.startTime < fiveMinutesAgo) {
-        console.warn(`Cleaning up stale request: ${requestId}`);
-        this.activeRequests.delete(requestId);
-      }
+      if (request.startTime >= fiveMinutesAgo) break;
+      console.warn(`Cleaning up stale request: ${requestId}`);
+      this.activeRequests.delete(requestId);
     }
   }
 }
@@ -0,0 +1,131 @@
+import { PaginatedResult, EventCursor, VenueCursor } from '../models/types';
+
+/**
+ * Pagination metadata returned alongside list responses
+ */
+export type PaginationMeta = Omit<PaginatedResult<unknown>, 'data'>;
+
+/**
+ * Build pagination metadata from a total count
+ * @param total Total number of matching items
+ * @param page Current page (1-based)
+ * @param limit Items per page
+ */
+export function paginationMeta(total: number, page: number, limit: number): PaginationMeta {
+  return {
+    page,
+    limit,
+    total,
+    total_pages: Math.ceil(total / limit)
+  };
+}
+
+/**
+ * Extract pagination metadata from a repository result without recomputing it
+ * @param result Paginated repository result
+ */
+export function paginationOf(result: PaginatedResult<unknown>): PaginationMeta {
+  return {
+    page: result.page,
+    limit: result.limit,
+    total: result.total,
+    total_pages: result.total_pages
+  };
+}
+
+/**
+ * Assemble a paginated result from a page of rows and the total count
+ * @param data Rows for the current page
+ * @param total Total number of matching items
+ * @param page Current page (1-based)
+ * @param limit Items per page
+ */
+export function buildPaginatedResult<T>(data: T[], total: number, page: number, limit: number): PaginatedResult<T> {
+  return { data, ...paginationMeta(total, page, limit) };
+}
+
+/**
+ * Parse page/limit query parameters with defaults and bounds.
+ * Missing or malformed values fall back to the defaults; limit is capped at maxLimit.
+ * @param searchParams URL search params
+ * @param defaultLimit Limit used when none is given
+ * @param maxLimit Upper bound for limit
+ */
+export function parsePagination(
+  searchParams: URLSearchParams,
+  defaultLimit: number = 20,
+  maxLimit: number = 100
+): { page: number; limit: number } {
+  const page = parseInt(searchParams.get('page') || '', 10);
+  const limit = parseInt(searchParams.get('limit') || '', 10);
+
+  return {
+    page: page >= 1 ? page : 1,
+    limit: limit >= 1 ? Math.min(limit, maxLimit) : defaultLimit
+  };
+}
+
+/**
+ * Encode an event position as an opaque cursor string
+ * @param cursor Datetime and ID of the last event returned
+ */
+export function encodeEventCursor(cursor: EventCursor): string {
+  return Buffer.from(`${new Date(cursor.event_datetime).getTime()}:${cursor.id}`).toString('base64url');
+}
+
+/**
+ * Build the SQL condition seeking past an event cursor in (event_datetime, id) order.
+ * Cursors carry milliseconds but Postgres stores microseconds, so the cursor event's
+ * stored timestamp is looked up by ID; the cursor's own time is only used if that
+ * event has since been deleted.
+ * @param table Events table name or alias
+ * @param idParam Placeholder number bound to the cursor's event ID
+ * @param datetimeParam Placeholder number bound to the cursor's timestamp
+ */
+export function eventSeekCondition(table: string, idParam: number, datetimeParam: number): string {
+  const cursorDatetime = `COALESCE((SELECT cursor_event.event_datetime FROM events cursor_event ` +
+    `WHERE cursor_event.id = $${idParam}), $${datetimeParam})`;
+  return `(${table}.event_datetime, ${table}.id) > (${cursorDatetime}, $${idParam})`;
+}
+
+/**
+ * Decode a cursor produced by encodeEventCursor
+ * @param cursor Opaque cursor string
+ * @returns The event position, or null if the cursor is malformed
+ */
+export function decodeEventCursor(cursor: string): EventCursor | null {
+  const [time, id] = Buffer.from(cursor, 'base64url').toString().split(':');
+  const eventDatetime = new Date(Number(time));
+  const eventId = Number(id);
+
+  if (!time || !id || isNaN(eventDatetime.getTime()) || !Number.isInteger(eventId)) {
+    return null;
+  }
+
+  return { event_datetime: eventDatetime, id: eventId };
+}
+
+/**
+ * Encode a venue position as an opaque cursor string
+ * @param cursor Name and ID of the last venue returned
+ */
+export function encodeVenueCursor(cursor: VenueCursor): string {
+  return Buffer.from(JSON.stringify([cursor.name, cursor.id])).toString('base64url');
+}
+
+/**
+ * Decode a cursor produced by encodeVenueCursor
+ * @param cursor Opaque cursor string
+ * @returns The venue position, or null if the cursor is malformed
+ */
+export function decodeVenueCursor(cursor: string): VenueCursor | null {
+  try {
+    const [name, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (typeof name !== 'string' || !Number.isInteger(id)) {
+      return null;
+    }
+    return { name, id };
+  } catch {
+    return null;
+  }
+}
@@ -0,0 +1,73 @@
+import { z } from 'zod';
+
+/**
+ * Split comma-separated entries of a list parameter.
+ * Accepts both repeated params (?genres=rock&genres=indie) and the
+ * legacy comma form (?genres=rock,indie), or a mix of the two.
+ * @param value Single value or all values collected for the key
+ */
+function splitListValues(value: string | string[] | undefined): string[] | undefined {
+  if (value === undefined) return undefined;
+
+  const values = typeof value === 'string' ? [value] : value;
+  const result: string[] = [];
+
+  for (const entry of values) {
+    if (!entry) continue;
+    // Fast path: most values carry no separator
+    if (entry.indexOf(',') === -1) {
+      result.push(entry);
+    } else {
+      result.push(...entry.split(','));
+    }
+  }
+
+  return result.length > 0 ? result : undefined;
+}
+
+/**
+ * Zod schema for a list-valued query parameter
+ */
+export const listParam = z
+  .union([z.string(), z.array(z.string())])
+  .optional()
+  .transform(splitListValues);
+
+/**
+ * Convert URL search params to a plain object for schema validation.
+ * Keys listed in `listKeys` keep every occurrence; other keys keep the last one.
+ * @param searchParams URL search params
+ * @param listKeys Keys that may be repeated
+ */
+export function searchParamsToObject(
+  searchParams: URLSearchParams,
+  listKeys: ReadonlySet<string>
+): Record<string, string | string[]> {
+  const params: Record<string, string | string[]> = {};
+
+  for (const [key, value] of searchParams) {
+    if (listKeys.has(key)) {
+      const existing = params[key];
+      if (existing === undefined) {
+        params[key] = value;
+      } else if (typeof existing === 'string') {
+        params[key] = [existing, value];
+      } else {
+        existing.push(value);
+      }
+    } else {
+      params[key] = value;
+    }
+  }
+
+  return params;
+}
+
+/**
+ * Zod schema for an optional ISO 8601 date query parameter.
+ * Malformed dates fail validation instead of reaching handlers as Invalid Date.
+ */
+export const dateParam = z.preprocess(
+  value => (value === '' ? undefined : value),
+  z.coerce.date().optional()
+);
@@ -1,7 +1,6 @@
 'use client';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { RequestTracker } from '@/lib/utils/monitoring';
 import { randomUUID } from 'crypto';
 
 // List of valid genres for subdomain filtering
@@ -24,6 +23,18 @@ export const VALID_GENRES = [
   'world',
 ];
 
+// Lookup set built once at module load for per-request genre checks
+const VALID_GENRE_SET: ReadonlySet<string> = new Set(VALID_GENRES);
+
+// CORS headers for API routes, built once. Max-Age lets browsers reuse a
+// preflight result instead of sending OPTIONS before every cross-origin call.
+const API_CORS_HEADERS: ReadonlyArray<[string, string]> = [
+  ['Access-Control-Allow-Origin', '*'],
+  ['Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'],
+  ['Access-Control-Allow-Headers', 'Content-Type, Authorization, x-request-id'],
+  ['Access-Control-Max-Age', '86400'],
+];
+
 /**
  * Middleware to detect genre subdomains, add monitoring, and handle request tracking
  */
@@ -33,11 +44,12 @@ export function middleware(request: NextRequest) {
   // Get hostname (e.g., rock.venue-explorer.com)
   const hostname = request.headers.get('host') || '';
   
-  // Extract potential genre from subdomain
-  const subdomain = hostname.split('.')[0];
+  // Extract potential genre from subdomain without splitting the whole host
+  const dotIndex = hostname.indexOf('.');
+  const subdomain = (dotIndex === -1 ? hostname : hostname.slice(0, dotIndex)).toLowerCase();
   
   // Check if the subdomain is a valid genre
-  const isValidGenre = VALID_GENRES.includes(subdomain.toLowerCase());
+  const isValidGenre = VALID_GENRE_SET.has(subdomain);
   
   // Clone the request headers to add genre and tracking information
   const requestHeaders = new Headers(request.headers);
@@ -47,17 +59,12 @@ export function middleware(request: NextRequest) {
   
   if (isValidGenre) {
     // Add genre to request headers for downstream processing
-    requestHeaders.set('x-genre-filter', subdomain.toLowerCase());
+    requestHeaders.set('x-genre-filter', subdomain);
   } else {
     // Remove any existing genre filter if not a valid genre subdomain
     requestHeaders.delete('x-genre-filter');
   }
   
-  // Track API requests
-  if (request.nextUrl.pathname.startsWith('/api/')) {
-    RequestTracker.startRequest(requestId, request.nextUrl.pathname, request.method);
-  }
-  
   // Create a new response with modified headers
   const response = NextResponse.next({
     request: {
@@ -70,9 +77,9 @@ export function middleware(request: NextRequest) {
   
   // Add CORS headers for API routes
   if (request.nextUrl.pathname.startsWith('/api/')) {
-    response.headers.set('Access-Control-Allow-Origin', '*');
-    response.headers.set('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS');
-    response.headers.set('Access-Control-Allow-Headers', 'Content-Type, Authorization, x-request-id');
+    for (const [name, value] of API_CORS_HEADERS) {
+      response.headers.set(name, value);
+    }
     
     // Handle preflight requests
     if (request.method === 'OPTIONS') {
@@ -59,7 +59,7 @@ describe('Venue Discovery Flow Integration Tests', () => {
     });
 
     // Mock venues data
-    VenueRepository.prototype.findByCityId = vi.fn().mockResolvedValue({
+    VenueRepository.prototype.findByCityName = vi.fn().mockResolvedValue({
       data: [
         {
           id: 1,
@@ -34,7 +34,7 @@ describe('API Performance Tests', () => {
       { region: 'OR', city_count: 3 }
     ]);
 
-    VenueRepository.prototype.findByCityId = vi.fn().mockResolvedValue({
+    VenueRepository.prototype.findByCityName = vi.fn().mockResolvedValue({
       data: Array.from({ length: 20 }, (_, i) => ({
         id: i + 1,
         name: `Venue ${i + 1}`,
@@ -76,8 +76,8 @@ describe('API Performance Tests', () => {
   it('should respond to regions API within 200ms', async () => {
     const startTime = performance.now();
     
-    // const request = new NextRequest('http://localhost/api/regions');
-    const response = await getRegions();
+    const request = new NextRequest('http://localhost/api/regions');
+    const response = await getRegions(request);
     
     const endTime = performance.now();
     const responseTime = endTime - startTime;
@@ -188,7 +188,7 @@ describe('API Performance Tests', () => {
 
   it('should benchmark database query performance', async () => {
     // Mock a more realistic database response time
-    VenueRepository.prototype.findByCityId = vi.fn().mockImplementation(() => 
+    VenueRepository.prototype.findByCityName = vi.fn().mockImplementation(() => 
       new Promise(resolve => {
         setTimeout(() => resolve({
           data: [],